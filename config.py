@@ -8,7 +8,42 @@ ASSETS_DIR = os.path.join(BASE_DIR, "assets")
 DATA_DIR = os.path.join(BASE_DIR, "data")
 
 # File data
+# Database pengguna (SQLite); users.xlsx lama hanya dipakai untuk migrasi sekali
+USERS_SQLITE = os.path.join(DATA_DIR, "users.db")
 USERS_DB = os.path.join(DATA_DIR, "users.xlsx")
+# Database customer (SQLite); xlsx dipakai sebagai format import/export
+CUSTOMERS_DB = os.path.join(DATA_DIR, "customers.db")
+CUSTOMERS_XLSX = os.path.join(DATA_DIR, "database_customer.xlsx")
+# Folder workspace customer (satu subfolder berisi SET_BDU.xlsx per customer)
+CUSTOMERS_DIR = os.path.join(DATA_DIR, "customers")
+BDU_TEMPLATE = os.path.join(DATA_DIR, "SET_BDU.xlsx")
+# Jumlah workspace yang dibuat paralel saat import customer massal
+ONBOARDING_WORKERS = 4
+
+# Cache (aman dihapus, akan dibuat ulang)
+CACHE_DIR = os.path.join(DATA_DIR, "cache")
+RENDER_CACHE_DIR = os.path.join(CACHE_DIR, "renders")
+TEMPLATE_CACHE_DIR = os.path.join(CACHE_DIR, "templates")
+
+# Konversi Word -> PDF: backend dicoba berurutan ("libreoffice", "word")
+CONVERSION_BACKENDS = ["libreoffice", "word"]
+# Path soffice; kosongkan untuk mencari otomatis di PATH / lokasi instalasi umum
+SOFFICE_PATH = os.environ.get("DIAC_SOFFICE_PATH", "")
+# Jumlah konversi LibreOffice paralel (masing-masing dengan profil sendiri)
+CONVERSION_WORKERS = 2
+CONVERSION_TIMEOUT = 120  # detik
+
+# Jumlah job background yang boleh berjalan bersamaan per resource
+JOB_RESOURCE_LIMITS = {
+    "excel": 1,      # otomasi Excel (xlwings) - projection
+    "workbook": 2,   # baca/tulis SET_BDU customer, registrasi customer
+    "document": 2,   # generate proposal Word
+    "default": 2,
+}
+
+# Resolusi pratinjau proposal: thumbnail (~600px lebar untuk A4) dan halaman penuh
+THUMBNAIL_DPI = 75
+FULL_PAGE_DPI = 200
 
 # Konfigurasi aplikasi
 APP_NAME = "DIAC-V"
@@ -40,4 +75,31 @@ ACCESS_LEVELS = {
     "director": 3,  # Akses ke banyak grup
     "admin": 4,  # Akses ke semua grup + fitur admin
     "ceo": 5  # Akses penuh
-}
\ No newline at end of file
+}
+
+# Relasi antar departemen - dasar akses manager/director ke departemen lain
+DEPARTMENT_RELATIONS = {
+    "ADE": ["BDU", "PRJ"],
+    "BDU": ["ADE", "MAR"],
+    "MAR": ["BDU"],
+    "MAN": ["PRJ"],
+    "PRJ": ["ADE", "MAN", "FIN"],
+    "FIN": ["LEG", "PRJ"],
+    "LEG": ["FIN"]
+}
+
+# Jangkauan akses per level: jumlah langkah relasi dari departemen sendiri (None = semua departemen)
+ROLE_RELATION_DEPTH = {
+    "user": 0,  # Departemen sendiri
+    "manager": 1,  # + departemen terkait langsung
+    "director": 2,  # + departemen terkait dari departemen terkait
+    "admin": None,
+    "ceo": None
+}
+
+# Pengecualian per user, mis. {"mike_fin": {"grant": ["BDU"], "deny": []}}
+USER_ACCESS_OVERRIDES = {}
+
+# Keamanan login
+BCRYPT_ROUNDS = 12  # Cost bcrypt; hash dengan cost berbeda di-rehash otomatis saat login berikutnya
+SESSION_TTL = 15 * 60  # Detik; login ulang user yang sama dalam waktu ini tidak perlu verifikasi bcrypt penuh
\ No newline at end of file
@@ -4,6 +4,10 @@ import os
 import sys
 import warnings
 
+# Profiler harus aktif sebelum import lain supaya PyQt5 dan view ikut terukur
+from modules.startup_profiler import start_if_requested, get_profiler
+start_if_requested(sys.argv)
+
 # Suppress SIP deprecation warnings
 warnings.filterwarnings("ignore", category=DeprecationWarning, module=".*sip.*")
 warnings.filterwarnings("ignore", message=".*sipPyTypeDict.*")
@@ -15,12 +19,11 @@ from PyQt5.QtCore import QTimer, pyqtSignal, QObject
 
 app = QApplication(sys.argv)
 
-# Import modules lokal
+# Import modules lokal - hanya yang dibutuhkan sampai layar login.
+# View departemen (pandas, openpyxl, fitz, docx, ...) di-import saat pertama dibuka.
 from modules.auth import AuthManager
 from views.login_view import LoginView
-from views.dashboard_view import DashboardView
-from views.customer_search_view import CustomerSearchView 
-from views.bdu_view_extended import BDUGroupView
+from views.view_manager import ViewManager
 from config import APP_NAME, APP_LOGO
 
 class ThreadSafeSignals(QObject):
@@ -100,15 +103,14 @@ class DIACApplication:
         # Inisialisasi splash screen
         self.show_splash_screen()
         
-        # Inisialisasi views
+        # Inisialisasi views - view selain login dikelola (dan disimpan) oleh view manager
         self.login_view = None
-        self.dashboard_view = None
-        self.customer_search_view = None
-        self.bdu_view = None
+        self.view_manager = ViewManager()
+        self._bdu_pending = False
         self.current_loading = None
         
-        # Timer untuk menampilkan login setelah splash
-        QtCore.QTimer.singleShot(2000, self.init_views)
+        # Tampilkan login begitu event loop berjalan (splash sudah ter-paint)
+        QtCore.QTimer.singleShot(0, self.init_views)
     
     def setup_styles(self):
         stylesheet = """
@@ -216,40 +218,30 @@ class DIACApplication:
         # Inisialisasi login view
         self.login_view = LoginView(self.auth_manager, self.on_login_success)
         self.login_view.showMaximized()
+        
+        profiler = get_profiler()
+        if profiler:
+            profiler.mark("login view shown")
+            profiler.report()
+            # Import setelah ini tidak dilaporkan - lepas wrapper __import__
+            profiler.uninstall()
     
     def on_login_success(self):
-        """Callback saat login berhasil - THREAD SAFE"""
+        """Callback saat login berhasil - dipanggil di main thread"""
         print("Login success - starting dashboard initialization...")
         
-        # Show loading
-        loading = self.show_simple_loading("Initializing Dashboard", "Setting up your workspace...")
+        # Loading dialog ter-paint dulu (processEvents) sebelum dashboard dibuat
+        self.show_simple_loading("Initializing Dashboard", "Setting up your workspace...")
+        self.register_views()
         
-        # Use QTimer untuk memastikan eksekusi di main thread
-        QTimer.singleShot(500, self.initialize_dashboard_delayed)
-    
-    def initialize_dashboard_delayed(self):
-        """Initialize dashboard dengan delay untuk thread safety"""
         try:
-            print("Creating dashboard in main thread...")
-            
-            # Hide login view
+            self.view_manager.get("dashboard")
+            self.hide_current_loading()
             if self.login_view:
                 self.login_view.hide()
-            
-            # Create dashboard di main thread
-            if not self.dashboard_view:
-                self.dashboard_view = DashboardView(self.auth_manager)
-                self.dashboard_view.logout_signal.connect(self.on_logout)
-                self.connect_department_signals()
-            
-            # Hide loading
-            self.hide_current_loading()
-            
-            # Show dashboard menggunakan signal
-            QTimer.singleShot(100, self.signals.show_dashboard.emit)
-            
+            self.signals.show_dashboard.emit()
         except Exception as e:
-            print(f"Error in initialize_dashboard_delayed: {str(e)}")
+            print(f"Error initializing dashboard: {str(e)}")
             import traceback
             traceback.print_exc()
             
@@ -259,31 +251,54 @@ class DIACApplication:
             if self.login_view:
                 self.login_view.showMaximized()
     
+    def register_views(self):
+        """Daftarkan view untuk user yang sedang login beserta urutan preload-nya"""
+        # Customer search dibuat saat idle setelah dashboard tampil jika user punya akses BDU
+        dashboard_next = ["customer_search"] if self.auth_manager.has_access("BDU") else []
+        self.view_manager.register("dashboard", self.create_dashboard_view, preload_next=dashboard_next)
+        self.view_manager.register("customer_search", self.create_customer_search_view,
+                                   preload_modules=["views.bdu_view_extended"])
+    
+    def create_dashboard_view(self):
+        from views.dashboard_view import DashboardView
+        view = DashboardView(self.auth_manager)
+        view.logout_signal.connect(self.on_logout)
+        if hasattr(view, 'open_department_signal'):
+            view.open_department_signal.connect(self.open_department)
+        return view
+    
+    def create_customer_search_view(self):
+        from views.customer_search_view import CustomerSearchView
+        view = CustomerSearchView(self.auth_manager)
+        view.back_to_dashboard.connect(self.on_back_to_dashboard)
+        view.open_bdu_view.connect(self.on_open_bdu_view)
+        return view
+    
+    @property
+    def dashboard_view(self):
+        return self.view_manager.view("dashboard")
+    
+    @property
+    def customer_search_view(self):
+        return self.view_manager.view("customer_search")
+    
+    @property
+    def bdu_view(self):
+        return self.view_manager.view("bdu")
+    
     def _do_show_dashboard(self):
         """Actually show dashboard - guaranteed main thread"""
         print("Showing dashboard in main thread...")
-        if self.dashboard_view:
-            self.dashboard_view.showMaximized()
-            self.dashboard_view.raise_()
-            self.dashboard_view.activateWindow()
-            self.dashboard_view.setFocus()
-            QApplication.processEvents()
+        self.view_manager.show("dashboard").setFocus()
     
     def _do_show_customer_search(self):
         """Actually show customer search - guaranteed main thread"""
-        if self.customer_search_view:
-            self.customer_search_view.showMaximized()
-            self.customer_search_view.raise_()
-            self.customer_search_view.activateWindow()
-            QApplication.processEvents()
+        self.view_manager.show("customer_search")
     
     def _do_show_bdu_view(self):
         """Actually show BDU view - guaranteed main thread"""
         if self.bdu_view:
-            self.bdu_view.showMaximized()
-            self.bdu_view.raise_()
-            self.bdu_view.activateWindow()
-            QApplication.processEvents()
+            self.view_manager.show("bdu")
     
     def _do_show_login(self):
         """Actually show login - guaranteed main thread"""
@@ -291,17 +306,11 @@ class DIACApplication:
             self.login_view.showMaximized()
             self.login_view.raise_()
             self.login_view.activateWindow()
-            QApplication.processEvents()
-    
-    def connect_department_signals(self):
-        """Connect signals for opening department modules"""
-        if hasattr(self.dashboard_view, 'open_department_signal'):
-            self.dashboard_view.open_department_signal.connect(self.open_department)
     
     def check_customer_database(self):
-        """Check if database_customer.xlsx exists"""
-        db_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "database_customer.xlsx")
-        return os.path.exists(db_path)
+        """Check if the customer database (customers.db or database_customer.xlsx to import) exists"""
+        from modules.customer_store import customer_database_available
+        return customer_database_available()
     
     def check_bdu_excel(self):
         """Check if SET_BDU.xlsx exists"""
@@ -310,6 +319,11 @@ class DIACApplication:
     
     def open_department(self, dept_id):
         """Open department module based on department ID"""
+        if not self.auth_manager.has_access(dept_id):
+            QMessageBox.warning(self.dashboard_view, "Department Access",
+                               f"You don't have access to the {dept_id} module.")
+            return
+        
         if dept_id == "BDU":
             if not self.check_bdu_excel():
                 QMessageBox.warning(self.dashboard_view, "File Not Found", 
@@ -318,141 +332,78 @@ class DIACApplication:
             
             if not self.check_customer_database():
                 QMessageBox.warning(self.dashboard_view, "File Not Found", 
-                                   "database_customer.xlsx is missing in the data directory.\nPlease add the file and try again.")
+                                   "Customer database is missing in the data directory.\nPlease add database_customer.xlsx and try again.")
                 return
             
-            # Show loading
-            loading = self.show_simple_loading("Opening BDU Module", "Loading customer search interface...")
+            # Loading dialog hanya perlu jika view belum di-preload
+            if not self.customer_search_view:
+                self.show_simple_loading("Opening BDU Module", "Loading customer search interface...")
             
-            # Initialize customer search dengan delay
-            QTimer.singleShot(500, self.initialize_customer_search_delayed)
+            try:
+                self.view_manager.get("customer_search")
+                self.hide_current_loading()
+                self.signals.show_customer_search.emit()
+            except Exception as e:
+                print(f"Error opening customer search: {str(e)}")
+                self.hide_current_loading()
+                QMessageBox.critical(self.dashboard_view, "Initialization Error", f"Failed to open customer search: {str(e)}")
+                self.signals.show_dashboard.emit()
         else:
             QMessageBox.information(self.dashboard_view, "Department Access", 
                                    f"The {dept_id} module is not implemented yet.")
     
-    def initialize_customer_search_delayed(self):
-        """Initialize customer search dengan delay"""
-        try:
-            # Hide dashboard
-            if self.dashboard_view:
-                self.dashboard_view.hide()
-            
-            # Create customer search view
-            if not self.customer_search_view:
-                self.customer_search_view = CustomerSearchView(self.auth_manager)
-                self.customer_search_view.back_to_dashboard.connect(self.on_back_to_dashboard)
-                self.customer_search_view.open_bdu_view.connect(self.on_open_bdu_view)
-            
-            # Hide loading
-            self.hide_current_loading()
-            
-            # Show customer search
-            QTimer.singleShot(100, self.signals.show_customer_search.emit)
-            
-        except Exception as e:
-            print(f"Error in initialize_customer_search_delayed: {str(e)}")
-            self.hide_current_loading()
-            QMessageBox.critical(self.dashboard_view, "Initialization Error", f"Failed to open customer search: {str(e)}")
-            QTimer.singleShot(100, self.signals.show_dashboard.emit)
-    
     def on_open_bdu_view(self, customer_name):
         """Callback when continuing to BDU view from customer search"""
-        loading = self.show_simple_loading("Loading BDU Workspace", f"Setting up workspace for {customer_name}...")
+        self.show_simple_loading("Loading BDU Workspace", f"Setting up workspace for {customer_name}...")
         
-        # Store customer name for delayed initialization
-        self.current_customer = customer_name
-        QTimer.singleShot(500, self.initialize_bdu_view_delayed)
-    
-    def initialize_bdu_view_delayed(self):
-        """Initialize BDU view dengan delay"""
         try:
-            customer_name = getattr(self, 'current_customer', 'Unknown')
-            
-            # Hide customer search view
-            if self.customer_search_view:
-                self.customer_search_view.hide()
-            
-            # Create or update BDU view
+            # BDU view dipakai ulang - cukup ganti customer dan reload workbook
             if not self.bdu_view:
-                self.bdu_view = BDUGroupView(self.auth_manager, customer_name)
-                self.bdu_view.back_to_dashboard.connect(self.on_back_to_dashboard)
+                from views.bdu_view_extended import BDUGroupView
+                view = BDUGroupView(self.auth_manager, customer_name)
+                view.back_to_dashboard.connect(self.on_back_to_dashboard)
+                view.workspace_ready.connect(self.on_bdu_workspace_ready)
+                self.view_manager.set_view("bdu", view)
             else:
-                if hasattr(self.bdu_view, 'set_current_customer'):
-                    self.bdu_view.set_current_customer(customer_name)
-            
-            # Hide loading
-            self.hide_current_loading()
-            
-            # Show BDU view
-            QTimer.singleShot(100, self.signals.show_bdu_view.emit)
+                self.bdu_view.set_current_customer(customer_name)
             
+            # View ditampilkan saat sheet pertama siap (signal workspace_ready)
+            self._bdu_pending = True
+            if self.bdu_view.is_workspace_ready():
+                self.on_bdu_workspace_ready()
         except Exception as e:
-            print(f"Error in initialize_bdu_view_delayed: {str(e)}")
+            print(f"Error loading BDU workspace: {str(e)}")
             self.hide_current_loading()
             QMessageBox.critical(None, "Initialization Error", f"Failed to load BDU workspace: {str(e)}")
             
             if self.customer_search_view:
-                QTimer.singleShot(100, self.signals.show_customer_search.emit)
+                self.signals.show_customer_search.emit()
+    
+    def on_bdu_workspace_ready(self):
+        """Workbook customer sudah mulai tampil - tutup loading dan pindah ke BDU view"""
+        if not self._bdu_pending:
+            return
+        self._bdu_pending = False
+        self.hide_current_loading()
+        self.signals.show_bdu_view.emit()
     
     def on_back_to_dashboard(self):
         """Callback when going back to dashboard from any view"""
-        loading = self.show_simple_loading("Returning to Dashboard", "Saving your session...")
-        
-        QTimer.singleShot(500, self.return_to_dashboard_delayed)
-    
-    def return_to_dashboard_delayed(self):
-        """Return to dashboard dengan delay"""
-        try:
-            # Hide all department views
-            if self.customer_search_view:
-                self.customer_search_view.hide()
-            
-            if self.bdu_view:
-                self.bdu_view.hide()
-            
-            # Hide loading
-            self.hide_current_loading()
-            
-            # Show dashboard
-            QTimer.singleShot(100, self.signals.show_dashboard.emit)
-            
-        except Exception as e:
-            print(f"Error in return_to_dashboard_delayed: {str(e)}")
-            self.hide_current_loading()
-            QTimer.singleShot(100, self.signals.show_dashboard.emit)
+        self._bdu_pending = False
+        self.hide_current_loading()
+        self.signals.show_dashboard.emit()
     
     def on_logout(self):
         """Callback saat logout"""
-        loading = self.show_simple_loading("Logging Out", "Saving your session...")
-        
-        QTimer.singleShot(500, self.logout_delayed)
-    
-    def logout_delayed(self):
-        """Logout dengan delay"""
         try:
-            # Close all views
-            if self.dashboard_view:
-                self.dashboard_view.close()
-                self.dashboard_view = None
-            
-            if self.customer_search_view:
-                self.customer_search_view.close()
-                self.customer_search_view = None
-                
-            if self.bdu_view:
-                self.bdu_view.close()
-                self.bdu_view = None
-            
-            # Hide loading
+            # View terikat ke user yang login - buang semua, login view dipakai lagi
+            self._bdu_pending = False
+            self.view_manager.discard_all()
             self.hide_current_loading()
-            
-            # Show login
-            QTimer.singleShot(100, self.signals.show_login.emit)
-            
         except Exception as e:
-            print(f"Error in logout_delayed: {str(e)}")
-            self.hide_current_loading()
-            QTimer.singleShot(100, self.signals.show_login.emit)
+            print(f"Error during logout: {str(e)}")
+        
+        self.signals.show_login.emit()
     
     def quit_application(self):
         """Properly quit the application"""
@@ -463,12 +414,7 @@ class DIACApplication:
             self.hide_current_loading()
             
             # Close all windows
-            if self.dashboard_view:
-                self.dashboard_view.close()
-            if self.customer_search_view:
-                self.customer_search_view.close()
-            if self.bdu_view:
-                self.bdu_view.close()
+            self.view_manager.discard_all()
             if self.login_view:
                 self.login_view.close()
             
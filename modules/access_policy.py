@@ -0,0 +1,112 @@
+# modules/access_policy.py - Kebijakan akses departemen, dikompilasi ke bitset saat login
+
+import os
+import sys
+import threading
+from functools import lru_cache
+
+# Add parent directory to path so we can import from config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import DEPARTMENTS, DEPARTMENT_RELATIONS, ROLE_RELATION_DEPTH, USER_ACCESS_OVERRIDES
+
+# Satu bit per departemen: DEPARTMENTS dulu (urutan dashboard), lalu departemen lain saat pertama dipakai
+_department_bits = {}
+_department_order = []
+_bits_lock = threading.Lock()
+
+
+def department_bit(department):
+    """Bit untuk departemen; departemen baru (mis. IT, EXEC) didaftarkan"""
+    bit = _department_bits.get(department)
+    if bit is None:
+        with _bits_lock:
+            bit = _department_bits.get(department)
+            if bit is None:
+                bit = 1 << len(_department_order)
+                _department_order.append(department)
+                _department_bits[department] = bit
+    return bit
+
+
+def departments_of(mask):
+    """Id departemen untuk bit yang aktif, dalam urutan pendaftaran"""
+    return [department for department in list(_department_order) if mask & _department_bits[department]]
+
+
+for _department in DEPARTMENTS:
+    department_bit(_department["id"])
+ALL_DEPARTMENTS_MASK = sum(department_bit(department["id"]) for department in DEPARTMENTS)
+
+
+@lru_cache(maxsize=None)
+def role_mask(role, department):
+    """
+    Baris matriks role x departemen: departemen yang dapat dijangkau dari
+    `department` dalam ROLE_RELATION_DEPTH[role] langkah DEPARTMENT_RELATIONS.
+    Return None untuk role dengan akses ke semua departemen.
+    """
+    if role not in ROLE_RELATION_DEPTH:
+        return 0
+    depth = ROLE_RELATION_DEPTH[role]
+    if depth is None:
+        return None
+
+    mask = department_bit(department)
+    frontier = [department]
+    for _ in range(depth):
+        next_frontier = []
+        for current in frontier:
+            for related in DEPARTMENT_RELATIONS.get(current, []):
+                bit = department_bit(related)
+                if not mask & bit:
+                    mask |= bit
+                    next_frontier.append(related)
+        frontier = next_frontier
+    return mask
+
+
+class AccessPolicy:
+    """Hak akses satu user sebagai bitset; has_access hanya satu lookup dict dan satu AND"""
+
+    __slots__ = ('mask', 'all_access', 'denied')
+
+    def __init__(self, mask=0, all_access=False, denied=0):
+        self.mask = mask
+        self.all_access = all_access
+        self.denied = denied
+
+    def allows(self, department):
+        bit = _department_bits.get(department)
+        if bit is None:
+            # Departemen yang tidak dikenal hanya terbuka untuk admin/CEO
+            return self.all_access
+        if self.all_access:
+            return not self.denied & bit
+        return bool(self.mask & bit)
+
+    def departments(self):
+        """Departemen dashboard yang dapat diakses (ditambah departemen sendiri untuk role terbatas)"""
+        return departments_of(self.mask)
+
+
+NO_ACCESS = AccessPolicy()
+
+
+def compile_policy(user):
+    """Kompilasi role, relasi departemen dan USER_ACCESS_OVERRIDES untuk user yang login"""
+    if not user:
+        return NO_ACCESS
+
+    mask = role_mask(user.get('access_level'), user.get('department'))
+    all_access = mask is None
+    if all_access:
+        mask = ALL_DEPARTMENTS_MASK
+
+    override = USER_ACCESS_OVERRIDES.get(user.get('username'), {})
+    for department in override.get('grant', []):
+        mask |= department_bit(department)
+    denied = 0
+    for department in override.get('deny', []):
+        denied |= department_bit(department)
+
+    return AccessPolicy(mask & ~denied, all_access, denied)
@@ -1,69 +1,127 @@
 # modules/auth.py - Modul otentikasi untuk DIAC-V
 
-import pandas as pd
 import bcrypt
+import hashlib
+import hmac
 import os
-from config import USERS_DB, ACCESS_LEVELS
+import time
+from config import BCRYPT_ROUNDS, SESSION_TTL
+from modules.access_policy import NO_ACCESS, compile_policy
+from modules.user_repository import get_user_repository
 
 class AuthManager:
     def __init__(self):
         self.current_user = None
+        self.access_policy = NO_ACCESS
+        self.users = get_user_repository()
+        # Sesi lokal (hanya di memori proses ini) untuk login ulang tanpa bcrypt
+        self._session_key = os.urandom(32)
+        self._session = None
         self._create_default_db_if_not_exists()
         
     def _create_default_db_if_not_exists(self):
-        """Membuat database pengguna default jika belum ada"""
-        if not os.path.exists(USERS_DB):
-            # Buat direktori jika belum ada
-            os.makedirs(os.path.dirname(USERS_DB), exist_ok=True)
+        """Membuat pengguna default jika database pengguna masih kosong"""
+        if self.users.is_empty():
+            usernames = ['admin', 'john_ade', 'mary_bdu', 'alex_mar', 'dave_man',
+                         'sarah_prj', 'mike_fin', 'lisa_leg', 'ceo']
+            names = ['Administrator', 'John Smith', 'Mary Johnson', 'Alex Brown', 'Dave Wilson',
+                     'Sarah Miller', 'Mike Taylor', 'Lisa Anderson', 'CEO']
+            departments = ['IT', 'ADE', 'BDU', 'MAR', 'MAN', 'PRJ', 'FIN', 'LEG', 'EXEC']
+            access_levels = ['admin', 'user', 'user', 'user', 'user', 'user', 'user', 'user', 'ceo']
+            emails = ['admin@diac-v.com', 'john@diac-v.com', 'mary@diac-v.com', 'alex@diac-v.com',
+                      'dave@diac-v.com', 'sarah@diac-v.com', 'mike@diac-v.com', 'lisa@diac-v.com', 'ceo@diac-v.com']
             
-            # Buat data pengguna default
-            default_users = pd.DataFrame({
-                'username': ['admin', 'john_ade', 'mary_bdu', 'alex_mar', 'dave_man', 
-                             'sarah_prj', 'mike_fin', 'lisa_leg', 'ceo'],
-                'password': [self._hash_password('admin123')] + [self._hash_password('password123')] * 8,
-                'name': ['Administrator', 'John Smith', 'Mary Johnson', 'Alex Brown', 'Dave Wilson',
-                        'Sarah Miller', 'Mike Taylor', 'Lisa Anderson', 'CEO'],
-                'department': ['IT', 'ADE', 'BDU', 'MAR', 'MAN', 'PRJ', 'FIN', 'LEG', 'EXEC'],
-                'access_level': ['admin', 'user', 'user', 'user', 'user', 'user', 'user', 'user', 'ceo'],
-                'email': ['admin@diac-v.com', 'john@diac-v.com', 'mary@diac-v.com', 'alex@diac-v.com', 
-                         'dave@diac-v.com', 'sarah@diac-v.com', 'mike@diac-v.com', 'lisa@diac-v.com', 'ceo@diac-v.com']
-            })
+            # Hash password default sekali saja
+            admin_password = self._hash_password('admin123')
+            user_password = self._hash_password('password123')
             
-            # Simpan ke Excel
-            default_users.to_excel(USERS_DB, index=False)
+            self.users.add_many([
+                {
+                    'username': username,
+                    'password': admin_password if username == 'admin' else user_password,
+                    'name': name,
+                    'department': department,
+                    'access_level': access_level,
+                    'email': email
+                }
+                for username, name, department, access_level, email
+                in zip(usernames, names, departments, access_levels, emails)
+            ])
     
     def _hash_password(self, password):
-        """Hash password menggunakan bcrypt"""
-        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+        """Hash password menggunakan bcrypt dengan cost BCRYPT_ROUNDS"""
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode('utf-8')
     
     def _verify_password(self, password, hashed):
         """Verifikasi password dengan hash"""
         return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
     
+    def _needs_rehash(self, hashed):
+        """True jika hash dibuat dengan cost selain BCRYPT_ROUNDS (format $2b$<cost>$...)"""
+        try:
+            return int(hashed.split('$')[2]) != BCRYPT_ROUNDS
+        except (IndexError, ValueError):
+            return False
+    
+    def _session_token(self, username, hashed, password, expires_at):
+        """HMAC atas kredensial; ikut berubah jika hash password di database berubah"""
+        message = '\0'.join([username, hashed, password, repr(expires_at)]).encode('utf-8')
+        return hmac.new(self._session_key, message, hashlib.sha256).digest()
+    
+    def _start_session(self, user, password):
+        expires_at = time.time() + SESSION_TTL
+        self._session = {
+            'username': user['username'],
+            'expires_at': expires_at,
+            'token': self._session_token(user['username'], user['password'], password, expires_at)
+        }
+    
+    def _session_valid(self, user, password):
+        """True jika login ulang cocok dengan sesi yang belum kedaluwarsa"""
+        session = self._session
+        if not session or session['username'] != user['username'] or time.time() > session['expires_at']:
+            return False
+        token = self._session_token(user['username'], user['password'], password, session['expires_at'])
+        return hmac.compare_digest(token, session['token'])
+    
+    def clear_session(self):
+        """Paksa verifikasi bcrypt penuh pada login berikutnya"""
+        self._session = None
+    
     def login(self, username, password):
         """Otentikasi pengguna dengan username dan password"""
-        # Baca database pengguna
         try:
-            df = pd.read_excel(USERS_DB)
-            
-            # Cari user berdasarkan username
-            user = df[df['username'] == username]
-            if user.empty:
+            # Cari user berdasarkan username (dict di memori, dimuat ulang hanya jika database berubah)
+            user = self.users.get(username)
+            if user is None:
                 return False, "Username tidak ditemukan."
             
-            # Verifikasi password
-            stored_password = user['password'].values[0]
-            if not self._verify_password(password, stored_password):
-                return False, "Password salah."
+            # Verifikasi password - sesi lokal yang masih berlaku cukup dicek dengan HMAC
+            if not self._session_valid(user, password):
+                if not self._verify_password(password, user['password']):
+                    return False, "Password salah."
+                
+                # Rehash transparan jika BCRYPT_ROUNDS diubah
+                if self._needs_rehash(user['password']):
+                    try:
+                        new_hash = self._hash_password(password)
+                        if self.users.update_password(user['username'], new_hash):
+                            user['password'] = new_hash
+                    except Exception as e:
+                        print(f"Error rehashing password for {user['username']}: {str(e)}")
+                
+                self._start_session(user, password)
             
             # Set pengguna saat ini
             self.current_user = {
-                'username': user['username'].values[0],
-                'name': user['name'].values[0],
-                'department': user['department'].values[0],
-                'access_level': user['access_level'].values[0],
-                'email': user['email'].values[0]
+                'username': user['username'],
+                'name': user['name'],
+                'department': user['department'],
+                'access_level': user['access_level'],
+                'email': user['email']
             }
+            # Hak akses dikompilasi sekali per login
+            self.access_policy = compile_policy(self.current_user)
             
             return True, "Login berhasil."
         except Exception as e:
@@ -71,7 +129,9 @@ class AuthManager:
     
     def logout(self):
         """Logout pengguna saat ini"""
+        # Sesi lokal sengaja dipertahankan sampai SESSION_TTL agar login ulang cepat
         self.current_user = None
+        self.access_policy = NO_ACCESS
         return True
     
     def get_current_user(self):
@@ -80,38 +140,11 @@ class AuthManager:
     
     def has_access(self, department):
         """Cek apakah pengguna punya akses ke departemen tertentu"""
-        if not self.current_user:
-            return False
-        
-        user_level = ACCESS_LEVELS.get(self.current_user['access_level'], 0)
-        user_dept = self.current_user['department']
-        
-        # Admin dan CEO punya akses ke semua
-        if user_level >= ACCESS_LEVELS['admin']:
-            return True
-        
-        # User biasa hanya punya akses ke departemen sendiri
-        if user_level == ACCESS_LEVELS['user']:
-            return user_dept == department
-        
-        # Manager dan director punya akses berdasarkan level
-        # Logika akses untuk level lain dapat ditambahkan di sini
-        
-        return False
+        return self.access_policy.allows(department)
     
     def get_accessible_departments(self):
         """Dapatkan daftar departemen yang dapat diakses pengguna saat ini"""
-        from config import DEPARTMENTS
-        
-        if not self.current_user:
-            return []
-        
-        # Admin dan CEO dapat mengakses semua departemen
-        if self.current_user['access_level'] in ['admin', 'ceo']:
-            return [dept["id"] for dept in DEPARTMENTS]
-        
-        # User biasa hanya dapat mengakses departemen mereka sendiri
-        return [self.current_user['department']]
+        return self.access_policy.departments()
     
     def change_password(self, old_password, new_password):
         """Ubah password pengguna saat ini"""
@@ -119,17 +152,17 @@ class AuthManager:
             return False, "Tidak ada pengguna yang login."
         
         try:
-            df = pd.read_excel(USERS_DB)
-            user_idx = df[df['username'] == self.current_user['username']].index[0]
+            user = self.users.get(self.current_user['username'])
+            if user is None:
+                return False, "Username tidak ditemukan."
             
             # Verifikasi password lama
-            stored_password = df.loc[user_idx, 'password']
-            if not self._verify_password(old_password, stored_password):
+            if not self._verify_password(old_password, user['password']):
                 return False, "Password lama salah."
             
-            # Update password
-            df.loc[user_idx, 'password'] = self._hash_password(new_password)
-            df.to_excel(USERS_DB, index=False)
+            # Update password (satu UPDATE dalam transaksi, bukan menulis ulang seluruh file)
+            self.users.update_password(user['username'], self._hash_password(new_password))
+            self.clear_session()
             
             return True, "Password berhasil diubah."
         except Exception as e:
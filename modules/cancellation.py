@@ -0,0 +1,158 @@
+# modules/cancellation.py - Pembatalan kooperatif untuk task background (projection, proposal, ...)
+
+import os
+import shutil
+import signal
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+
+class OperationCancelled(BaseException):
+    """
+    Dilempar di checkpoint saat user membatalkan task.
+
+    Turunan BaseException (seperti KeyboardInterrupt) supaya tidak tertelan oleh
+    blok `except Exception` yang banyak dipakai di dalam pipeline projection.
+    """
+    pass
+
+
+class CancellationToken:
+    """
+    Token yang dibagikan antara GUI (cancel) dan worker (checkpoint).
+
+    Proses turunan (Excel via xlwings, soffice, ...) didaftarkan dengan
+    register_process() sehingga cancel() bisa langsung mematikannya - panggilan
+    COM/subprocess yang sedang memblokir worker ikut gagal dan worker sampai
+    ke checkpoint berikutnya.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._processes = []
+        self._lock = threading.Lock()
+
+    def cancel(self):
+        if self._event.is_set():
+            return
+        self._event.set()
+
+        with self._lock:
+            processes = list(self._processes)
+            self._processes = []
+        for process in processes:
+            kill_process(process)
+
+    def is_cancelled(self):
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """Checkpoint: lempar OperationCancelled jika task sudah dibatalkan"""
+        if self._event.is_set():
+            raise OperationCancelled("Operation cancelled by user")
+
+    def sleep(self, seconds):
+        """Pengganti time.sleep yang langsung bangun (dan raise) saat dibatalkan"""
+        if self._event.wait(seconds):
+            raise OperationCancelled("Operation cancelled by user")
+
+    def register_process(self, process):
+        """Daftarkan subprocess.Popen atau PID; langsung dimatikan jika sudah dibatalkan"""
+        if process is None:
+            return process
+        with self._lock:
+            if not self._event.is_set():
+                self._processes.append(process)
+                return process
+        kill_process(process)
+        raise OperationCancelled("Operation cancelled by user")
+
+    def unregister_process(self, process):
+        with self._lock:
+            if process in self._processes:
+                self._processes.remove(process)
+
+    @contextmanager
+    def activate(self):
+        """Jadikan token ini current_token() untuk thread pemanggil"""
+        previous = getattr(_local, "token", None)
+        _local.token = self
+        try:
+            yield self
+        finally:
+            _local.token = previous
+
+
+def kill_process(process):
+    """Matikan subprocess.Popen atau PID tanpa melempar error"""
+    try:
+        if hasattr(process, "kill"):
+            process.kill()
+        else:
+            os.kill(int(process), signal.SIGTERM)
+    except Exception as e:
+        print(f"Error killing process {process}: {str(e)}")
+
+
+class _NullToken(CancellationToken):
+    """Token untuk kode yang dijalankan di luar LoadingWorker - tidak pernah dibatalkan"""
+
+    def cancel(self):
+        pass
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def register_process(self, process):
+        return process
+
+
+_local = threading.local()
+_null_token = _NullToken()
+
+
+def current_token():
+    """Token task yang sedang berjalan di thread ini (no-op token jika tidak ada)"""
+    return getattr(_local, "token", None) or _null_token
+
+
+class FileTransaction:
+    """
+    Backup file sebelum task memodifikasinya; rollback() mengembalikan semua file
+    ke kondisi awal (dipakai saat task dibatalkan di tengah jalan).
+    """
+
+    def __init__(self):
+        self._backup_dir = None
+        self._backups = {}
+
+    def protect(self, *paths):
+        """Backup setiap file (sekali per file) sebelum dimodifikasi"""
+        for path in paths:
+            path = os.path.abspath(path)
+            if path in self._backups or not os.path.exists(path):
+                continue
+            if self._backup_dir is None:
+                self._backup_dir = tempfile.mkdtemp(prefix="diac_backup_")
+            backup_path = os.path.join(self._backup_dir, f"{len(self._backups)}_{os.path.basename(path)}")
+            shutil.copy2(path, backup_path)
+            self._backups[path] = backup_path
+
+    def rollback(self):
+        """Kembalikan semua file yang di-protect"""
+        for path, backup_path in self._backups.items():
+            try:
+                shutil.copy2(backup_path, path)
+                print(f"Restored {path}")
+            except Exception as e:
+                print(f"Error restoring {path}: {str(e)}")
+        self.close()
+
+    def close(self):
+        """Hapus backup (task selesai atau sudah di-rollback)"""
+        if self._backup_dir:
+            shutil.rmtree(self._backup_dir, ignore_errors=True)
+        self._backup_dir = None
+        self._backups = {}
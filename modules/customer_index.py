@@ -0,0 +1,122 @@
+# modules/customer_index.py - Index folder workspace customer (data/customers) di memori
+
+import os
+import re
+import threading
+from functools import lru_cache
+
+BDU_FILE_NAME = "SET_BDU.xlsx"
+
+
+@lru_cache(maxsize=16384)
+def clean_folder_name(name):
+    """
+    Create a valid Windows folder name by:
+    1. Removing trailing whitespace and newlines
+    2. Replacing invalid characters with underscores
+    3. Ensuring name isn't too long for Windows paths
+    """
+    # Trim whitespace and newlines
+    name = name.strip()
+
+    # Replace invalid Windows filename characters: \ / : * ? " < > |
+    name = re.sub(r'[\\/:*?"<>|\t\n\r]', '_', name)
+
+    # Replace multiple consecutive underscores with a single one
+    name = re.sub(r'_+', '_', name)
+
+    # Limit the length to avoid path too long errors (Windows MAX_PATH is 260)
+    # Use a reasonable limit like 100 chars for the folder name
+    if len(name) > 100:
+        name = name[:97] + '...'
+
+    return name
+
+
+class WorkspaceEntry:
+    """Status satu folder customer: ada/tidaknya SET_BDU.xlsx beserta mtime-nya"""
+    __slots__ = ("folder_name", "has_bdu_file", "mtime")
+
+    def __init__(self, folder_name, has_bdu_file=False, mtime=None):
+        self.folder_name = folder_name
+        self.has_bdu_file = has_bdu_file
+        self.mtime = mtime
+
+
+class CustomerWorkspaceIndex:
+    """
+    Peta nama folder (hasil clean_folder_name) -> WorkspaceEntry.
+
+    Dibangun dengan satu os.scandir atas data/customers, sehingga pengecekan
+    per item list adalah lookup dict tanpa akses filesystem. Perubahan
+    folder di-update lewat refresh_folder() (dipanggil watcher / setelah
+    aplikasi sendiri membuat file).
+    """
+
+    def __init__(self, base_path, file_name=BDU_FILE_NAME):
+        self.base_path = base_path
+        self.file_name = file_name
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._built = False
+
+    def _scan_folder(self, folder_path, folder_name):
+        try:
+            stat = os.stat(os.path.join(folder_path, self.file_name))
+            return WorkspaceEntry(folder_name, True, stat.st_mtime)
+        except OSError:
+            return WorkspaceEntry(folder_name)
+
+    def refresh(self):
+        """Bangun ulang seluruh index (satu scandir atas folder customers)"""
+        entries = {}
+        try:
+            with os.scandir(self.base_path) as iterator:
+                for entry in iterator:
+                    if entry.is_dir():
+                        entries[entry.name] = self._scan_folder(entry.path, entry.name)
+        except OSError as e:
+            print(f"Error scanning customer folders: {str(e)}")
+
+        with self._lock:
+            self._entries = entries
+            self._built = True
+        return len(entries)
+
+    def refresh_folder(self, folder_name):
+        """Update satu folder (dibuat, dihapus, atau isinya berubah)"""
+        folder_path = os.path.join(self.base_path, folder_name)
+        with self._lock:
+            if os.path.isdir(folder_path):
+                self._entries[folder_name] = self._scan_folder(folder_path, folder_name)
+            else:
+                self._entries.pop(folder_name, None)
+
+    def folder_names(self):
+        with self._lock:
+            return list(self._entries)
+
+    def lookup(self, customer_name):
+        """WorkspaceEntry untuk customer, atau None jika foldernya belum ada"""
+        if not self._built:
+            self.refresh()
+        return self._entries.get(clean_folder_name(customer_name))
+
+    def has_bdu_file(self, customer_name):
+        entry = self.lookup(customer_name)
+        return bool(entry and entry.has_bdu_file)
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_customer_index(base_path):
+    """Index bersama per folder customers"""
+    base_path = os.path.abspath(base_path)
+    with _indexes_lock:
+        index = _indexes.get(base_path)
+        if index is None:
+            index = CustomerWorkspaceIndex(base_path)
+            _indexes[base_path] = index
+        return index
@@ -0,0 +1,210 @@
+# modules/customer_onboarding.py - Import customer massal (CSV/XLSX) beserta workspace SET_BDU-nya
+
+import os
+import sys
+import csv
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import CUSTOMERS_DIR, BDU_TEMPLATE, ONBOARDING_WORKERS
+from modules.cancellation import current_token
+from modules.customer_index import BDU_FILE_NAME, clean_folder_name
+from modules.customer_search_index import normalize_name
+from modules.customer_store import NAME_COLUMN, get_customer_store
+from modules.workspace_template import create_workspace, get_compiled_template
+from modules.xlsx_records import read_xlsx_records
+
+STATUS_CREATED = "created"
+STATUS_DUPLICATE = "duplicate"
+STATUS_EXISTING_WORKSPACE = "workspace exists"
+STATUS_ERROR = "error"
+
+
+class OnboardingRow:
+    """Hasil satu baris file import"""
+
+    def __init__(self, row_number, company_name, data):
+        self.row_number = row_number
+        self.company_name = company_name
+        self.data = data
+        self.status = None
+        self.message = ""
+
+    def fail(self, message):
+        self.status = STATUS_ERROR
+        self.message = message
+
+
+class OnboardingReport:
+    """Ringkasan import: status per baris dan jumlah per status"""
+
+    def __init__(self, source_path, rows):
+        self.source_path = source_path
+        self.rows = rows
+
+    def count(self, status):
+        return sum(1 for row in self.rows if row.status == status)
+
+    def errors(self):
+        return [row for row in self.rows if row.status == STATUS_ERROR]
+
+    def summary(self):
+        return (f"{self.count(STATUS_CREATED)} created, {self.count(STATUS_DUPLICATE)} duplicates, "
+                f"{self.count(STATUS_EXISTING_WORKSPACE)} with existing workspace, "
+                f"{self.count(STATUS_ERROR)} errors ({len(self.rows)} rows)")
+
+    def write_csv(self, path):
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Row", NAME_COLUMN, "Status", "Message"])
+            for row in self.rows:
+                writer.writerow([row.row_number, row.company_name, row.status, row.message])
+        return path
+
+
+def read_leads(path):
+    """(kolom, list dict) dari file CSV atau XLSX; baris pertama adalah header"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.DictReader(f)
+            rows = []
+            for row in reader:
+                # Sel berlebih (lebih banyak dari header) disimpan DictReader di key None - dibuang
+                row.pop(None, None)
+                if any((value or "").strip() for value in row.values()):
+                    rows.append(row)
+            return list(reader.fieldnames or []), rows
+    if extension in (".xlsx", ".xlsm"):
+        return read_xlsx_records(path)
+    raise ValueError(f"Unsupported file type: {extension} (use .csv or .xlsx)")
+
+
+def onboard_customers(path, template_path=BDU_TEMPLATE, customers_dir=CUSTOMERS_DIR,
+                      workers=ONBOARDING_WORKERS, progress_callback=None):
+    """
+    Import customer dari `path`:
+    1. validasi dan de-duplikasi (di dalam file dan terhadap database),
+    2. insert semua customer baru dalam satu transaksi,
+    3. buat folder + SET_BDU.xlsx paralel dari template terkompilasi.
+
+    Error per baris dicatat di report, tidak menghentikan baris lain.
+    """
+    cancel_token = current_token()
+    store = get_customer_store()
+
+    def report_progress(percentage, message):
+        if progress_callback:
+            progress_callback(percentage, message)
+
+    report_progress(2, f"Reading {os.path.basename(path)}...")
+    columns, records = read_leads(path)
+    if NAME_COLUMN not in columns:
+        raise ValueError(f"Column '{NAME_COLUMN}' not found in {os.path.basename(path)}")
+
+    # Baris 1 adalah header
+    rows = []
+    seen = {}
+    for row_number, record in enumerate(records, start=2):
+        name = str(record.get(NAME_COLUMN) or "").strip()
+        row = OnboardingRow(row_number, name, record)
+        rows.append(row)
+
+        key = normalize_name(name)
+        if not key:
+            row.fail(f"Missing {NAME_COLUMN}")
+        elif key in seen:
+            row.status = STATUS_DUPLICATE
+            row.message = f"Duplicate of row {seen[key]} in this file"
+        else:
+            seen[key] = row_number
+            if store.exists(name):
+                row.status = STATUS_DUPLICATE
+                row.message = "Already in customer database"
+
+    cancel_token.raise_if_cancelled()
+    new_rows = [row for row in rows if row.status is None]
+    report_progress(10, f"Adding {len(new_rows)} new customers to database...")
+
+    # Kolom baru dari file import ikut di-export nanti
+    store.extend_columns(columns)
+
+    for row in new_rows:
+        row.data = dict(row.data, **{NAME_COLUMN: row.company_name})
+    inserted = store.add_many([row.data for row in new_rows])
+    for row in new_rows:
+        if row.company_name not in inserted:
+            # Disisipkan user lain di antara pengecekan dan insert
+            row.status = STATUS_DUPLICATE
+            row.message = "Already in customer database"
+
+    workspace_rows = [row for row in new_rows if row.status is None]
+    if not workspace_rows:
+        report_progress(100, "No new customers to create")
+        return OnboardingReport(path, rows)
+
+    # Nama panjang yang berbeda bisa menjadi folder yang sama (clean_folder_name memotong nama);
+    # hanya baris pertama per folder yang dibuat, sebelum worker paralel mulai
+    output_paths = {}
+    workspace_jobs = []
+    for row in workspace_rows:
+        output_path = os.path.join(customers_dir, clean_folder_name(row.company_name), BDU_FILE_NAME)
+        first = output_paths.get(os.path.normcase(output_path))
+        if first is not None:
+            row.fail(f"Workspace folder collides with row {first.row_number} ({first.company_name})")
+        else:
+            output_paths[os.path.normcase(output_path)] = row
+            workspace_jobs.append((row, output_path))
+
+    # Kompilasi template sekali sebelum worker mulai
+    get_compiled_template(template_path)
+    report_progress(20, f"Creating {len(workspace_jobs)} customer workspaces...")
+
+    def create(output_path, row):
+        cancel_token.raise_if_cancelled()
+        if os.path.exists(output_path):
+            return STATUS_EXISTING_WORKSPACE, output_path
+        create_workspace(template_path, output_path, row.data)
+        return STATUS_CREATED, output_path
+
+    done = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = {executor.submit(create, output_path, row): row for row, output_path in workspace_jobs}
+        try:
+            for future in as_completed(futures):
+                row = futures[future]
+                try:
+                    row.status, row.message = future.result()
+                except Exception as e:
+                    if cancel_token.is_cancelled():
+                        raise
+                    row.fail(f"Workspace not created: {str(e)}")
+                done += 1
+                report_progress(20 + int(80 * done / len(workspace_jobs)),
+                                f"Created {done}/{len(workspace_jobs)} workspaces ({row.company_name})")
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+
+    return OnboardingReport(path, rows)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Bulk import customers from CSV/XLSX and create their BDU workspaces')
+    parser.add_argument('path', help='CSV or XLSX file with a "Company Name" column')
+    parser.add_argument('--workers', type=int, default=ONBOARDING_WORKERS, help='Parallel workspace workers')
+    parser.add_argument('--report', help='Write per-row results to this CSV file')
+    args = parser.parse_args()
+
+    def print_progress(percentage, message):
+        print(f"[{percentage:3d}%] {message}")
+
+    result = onboard_customers(args.path, workers=args.workers, progress_callback=print_progress)
+    print(result.summary())
+    for error_row in result.errors():
+        print(f"  Row {error_row.row_number} ({error_row.company_name or '-'}): {error_row.message}")
+    if args.report:
+        print(f"Report written to {result.write_csv(args.report)}")
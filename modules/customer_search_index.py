@@ -0,0 +1,300 @@
+# modules/customer_search_index.py - Index pencarian customer dengan ranking (prefix + trigram)
+
+import heapq
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections import Counter
+from itertools import chain
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Batas jumlah hasil per query ("p" atau "jaya" cocok dengan ribuan nama)
+RESULT_LIMIT = 200
+# Lebih besar dari semua karakter key yang dinormalisasi ([0-9a-z ])
+_KEY_END = "\x7f"
+
+
+def normalize_name(name):
+    """Lowercase, hilangkan aksen dan tanda baca: 'PT. Café-Jaya ' -> 'pt cafe jaya'"""
+    name = str(name)
+    if not name.isascii():
+        name = unicodedata.normalize("NFKD", name)
+        name = "".join(ch for ch in name if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(" ", name.lower()).strip()
+
+
+def trigrams(key):
+    """Set trigram dari key yang sudah dinormalisasi (dengan padding spasi)"""
+    padded = f" {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class CustomerSearchIndex:
+    """
+    Index pencarian yang dibangun sekali saat data customer dimuat.
+
+    - Prefix lookup: array kata yang diurutkan + bisect (setara trie datar,
+      satu range kontigu per prefix tanpa node per karakter).
+    - Trigram index: kandidat substring untuk query >= 3 karakter diambil dari
+      posting list terpendek, lalu diverifikasi; juga dipakai untuk fuzzy match.
+      Dibangun di background thread - sampai siap, substring memakai scan
+      linear atas key yang sudah dinormalisasi.
+    - Incremental: jika query baru memuat query sebelumnya, hanya hasil
+      sebelumnya yang diperiksa ulang.
+    - Hasil dibatasi RESULT_LIMIT: exact/prefix dan prefix kata diambil
+      langsung dari range bisect, substring hanya mengisi sisa slot (tanpa
+      sort seluruh kandidat).
+    - add() menambah satu nama tanpa membangun ulang index.
+
+    search() mengembalikan list id (posisi di `names`) terurut per ranking.
+    """
+
+    def __init__(self, names, fuzzy_threshold=0.5, fuzzy_min_results=20, background=True,
+                 result_limit=RESULT_LIMIT):
+        self.names = list(names)
+        self.keys = [normalize_name(name) for name in self.names]
+        self.all_ids = list(range(len(self.names)))
+        self.fuzzy_threshold = fuzzy_threshold
+        self.fuzzy_min_results = fuzzy_min_results
+        self.result_limit = result_limit
+
+        # Prefix per kata: (kata, id) terurut
+        self._words = sorted((word, i) for i, key in enumerate(self.keys) for word in set(key.split()))
+        self._word_keys = [word for word, _ in self._words]
+        # Prefix seluruh key: (key, id) terurut
+        self._sorted = sorted((key, i) for i, key in enumerate(self.keys))
+        self._sorted_keys = [key for key, _ in self._sorted]
+
+        self._trigrams = None
+        self._trigram_lock = threading.Lock()
+        self._last_query = None
+        self._last_matches = None
+        self._short_cache = {}
+
+        if background:
+            threading.Thread(target=self._build_trigrams, daemon=True).start()
+        else:
+            self._build_trigrams()
+
+    def __len__(self):
+        return len(self.names)
+
+    def _build_trigrams(self):
+        """Trigram -> list id (ascending); dipasang sekaligus setelah selesai"""
+        index = {}
+        gram_counts = []
+        built = len(self.keys)
+        for i in range(built):
+            self._index_trigrams(index, gram_counts, i)
+
+        with self._trigram_lock:
+            # Nama yang ditambahkan lewat add() selama build berjalan
+            for i in range(built, len(self.keys)):
+                self._index_trigrams(index, gram_counts, i)
+            self._gram_counts = gram_counts
+            self._trigrams = index
+
+    def _index_trigrams(self, index, gram_counts, i):
+        grams = trigrams(self.keys[i])
+        gram_counts.append(len(grams))
+        for gram in grams:
+            postings = index.get(gram)
+            if postings is None:
+                index[gram] = [i]
+            else:
+                postings.append(i)
+
+    def add(self, name):
+        """Tambah satu nama ke index (incremental); return id barunya"""
+        i = len(self.names)
+        key = normalize_name(name)
+        self.names.append(name)
+        self.keys.append(key)
+
+        for word in set(key.split()):
+            position = bisect_left(self._words, (word, i))
+            self._words.insert(position, (word, i))
+            self._word_keys.insert(position, word)
+        position = bisect_left(self._sorted, (key, i))
+        self._sorted.insert(position, (key, i))
+        self._sorted_keys.insert(position, key)
+
+        with self._trigram_lock:
+            # Jika build background belum selesai, id ini ikut di-index saat build selesai
+            if self._trigrams is not None:
+                self._index_trigrams(self._trigrams, self._gram_counts, i)
+
+        # Daftar awal tetap urut nama; list baru karena list lama mungkin dipegang model
+        low, high = 0, len(self.all_ids)
+        while low < high:
+            middle = (low + high) // 2
+            if self.names[self.all_ids[middle]] <= name:
+                low = middle + 1
+            else:
+                high = middle
+        self.all_ids = self.all_ids[:low] + [i] + self.all_ids[low:]
+
+        # Hasil query sebelumnya tidak memuat nama baru
+        self._short_cache = {}
+        self._last_query = None
+        self._last_matches = None
+        return i
+
+    def is_ready(self):
+        return self._trigrams is not None
+
+    def _prefix_ids(self, query):
+        """
+        Sampai result_limit id teratas dari range bisect: exact dan prefix key
+        (urut key), lalu prefix kata (urut kata). Tidak ada sort atas seluruh kandidat.
+        """
+        limit = self.result_limit
+        start = bisect_left(self._sorted_keys, query)
+        end = bisect_left(self._sorted_keys, query + _KEY_END, start)
+        ranked = [i for _, i in self._sorted[start:min(end, start + limit)]]
+        if len(ranked) >= limit or " " in query:
+            # Prefix kata untuk query multi-kata diambil dari hasil substring (lihat search)
+            return ranked
+
+        keys = self.keys
+        seen = set(ranked)
+        position = bisect_left(self._word_keys, query)
+        for position in range(position, len(self._words)):
+            word, i = self._words[position]
+            if not word.startswith(query):
+                break
+            if i not in seen and not keys[i].startswith(query):
+                seen.add(i)
+                ranked.append(i)
+                if len(ranked) >= limit:
+                    break
+        return ranked
+
+    def _substring_ids(self, query):
+        """Semua id yang key-nya memuat query; None jika query terlalu pendek untuk trigram"""
+        # Query bertambah dari query sebelumnya - cukup saring hasil sebelumnya
+        if self._last_query and self._last_matches is not None and self._last_query in query:
+            return {i for i in self._last_matches if query in self.keys[i]}
+
+        if len(query) < 3:
+            return None
+
+        index = self._trigrams
+        if index is None:
+            return {i for i, key in enumerate(self.keys) if query in key}
+
+        # Posting list terpendek sudah cukup sebagai kandidat - sisanya diverifikasi langsung
+        shortest = None
+        for position in range(len(query) - 2):
+            ids = index.get(query[position:position + 3])
+            if not ids:
+                return set()
+            if shortest is None or len(ids) < len(shortest):
+                shortest = ids
+        return {i for i in shortest if query in self.keys[i]}
+
+    def _fuzzy_ids(self, query, exclude):
+        """Id dengan kemiripan trigram >= fuzzy_threshold (toleran salah ketik)"""
+        index = self._trigrams
+        if index is None:
+            return []
+
+        query_grams = trigrams(query)
+        postings = sorted((index.get(gram, ()) for gram in query_grams), key=len)
+        postings = [ids for ids in postings if ids]
+
+        if sum(len(ids) for ids in postings) <= max(65536, len(self.keys) // 2):
+            # Posting list cukup kecil - jumlah trigram bersama dihitung langsung (di C)
+            counts = Counter(chain.from_iterable(postings))
+            exact = True
+            common_count = 0
+        else:
+            # Kandidat hanya dari trigram yang jarang ("pt ", " cv" dll. muncul di ribuan nama)
+            limit = max(256, len(self.keys) // 100)
+            rare = [ids for ids in postings if len(ids) <= limit] or postings[:2]
+            counts = Counter(chain.from_iterable(rare))
+            exact = False
+            common_count = len(postings) - len(rare)
+
+        threshold = self.fuzzy_threshold * len(query_grams)
+        # Id per jumlah trigram bersama (tanpa tuple per kandidat - ribuan kandidat untuk kata umum)
+        by_shared = {}
+        for i, shared in counts.items():
+            # Skor = bagian trigram query yang ada di key, sehingga salah ketik satu kata
+            # tetap cocok dengan nama panjang. Tanpa hitungan lengkap, batas atasnya - semua
+            # trigram umum dianggap cocok - membuang kandidat tanpa membaca key
+            if shared + common_count < threshold or i in exclude:
+                continue
+            if not exact:
+                padded = f" {self.keys[i]} "
+                shared = len([gram for gram in query_grams if gram in padded])
+                if shared < threshold:
+                    continue
+            ids = by_shared.get(shared)
+            if ids is None:
+                by_shared[shared] = [i]
+            else:
+                ids.append(i)
+
+        # Skor sama: key dengan trigram lebih sedikit (Dice coefficient lebih tinggi) lebih dulu
+        gram_counts = self._gram_counts
+        ranked = []
+        for shared in sorted(by_shared, reverse=True):
+            ids = by_shared[shared]
+            ids.sort()
+            ids.sort(key=gram_counts.__getitem__)
+            ranked.extend(ids[:self.result_limit - len(ranked)])
+            if len(ranked) >= self.result_limit:
+                break
+        return ranked
+
+    def search(self, text):
+        """
+        Id customer yang cocok dengan `text`, diurutkan exact > prefix > kata > substring > fuzzy,
+        maksimal result_limit id
+        """
+        query = normalize_name(text)
+        if not query:
+            self._last_query = None
+            self._last_matches = None
+            return self.all_ids
+
+        matches = self._substring_ids(query)
+        if matches is None:
+            # Query 1-2 karakter: hanya prefix; hasil tidak lengkap sehingga tidak dipakai untuk narrowing
+            self._last_query = None
+            self._last_matches = None
+            ranked = self._short_cache.get(query)
+            if ranked is None:
+                ranked = self._prefix_ids(query)
+                self._short_cache[query] = ranked
+            return ranked
+
+        self._last_query = query
+        self._last_matches = matches
+
+        limit = self.result_limit
+        ranked = self._prefix_ids(query)
+        if len(ranked) < limit:
+            seen = set(ranked)
+            keys = self.keys
+            rest = [i for i in matches if i not in seen]
+            if " " in query:
+                # Query multi-kata: prefix kata dicek langsung pada key
+                word_query = f" {query}"
+                word_prefix = [i for i in rest if word_query in f" {keys[i]}"]
+                ranked.extend(heapq.nsmallest(limit - len(ranked), word_prefix))
+                seen.update(word_prefix)
+                rest = [i for i in rest if i not in seen]
+            if len(ranked) < limit:
+                # Sisa slot diisi substring, urut id
+                ranked.extend(heapq.nsmallest(limit - len(ranked), rest))
+
+        if len(matches) < self.fuzzy_min_results and len(query) >= 3:
+            ranked.extend(self._fuzzy_ids(query, matches))
+        return ranked
+
+    def search_names(self, text):
+        return [self.names[i] for i in self.search(text)]
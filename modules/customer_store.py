@@ -0,0 +1,330 @@
+# modules/customer_store.py - Database customer di SQLite; database_customer.xlsx sebagai format import/export
+
+import os
+import sys
+import json
+import sqlite3
+import threading
+import time
+
+# Add parent directory to path so we can import from config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import CUSTOMERS_DB, CUSTOMERS_XLSX
+from modules.customer_search_index import normalize_name
+from modules.xlsx_records import read_xlsx_records
+
+NAME_COLUMN = "Company Name"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS customers (
+    id INTEGER PRIMARY KEY,
+    company_name TEXT NOT NULL,
+    normalized_name TEXT NOT NULL UNIQUE,
+    data TEXT NOT NULL DEFAULT '{}',
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_customers_company_name ON customers(company_name);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class CustomerStore:
+    """
+    Tabel customers dengan key unik pada nama perusahaan yang dinormalisasi.
+
+    Lookup/insert adalah query ber-index; tidak ada lagi baca/tulis ulang
+    seluruh xlsx. Insert memakai INSERT OR IGNORE dalam transaksi
+    BEGIN IMMEDIATE sehingga dua user di share yang sama tidak saling
+    menimpa. Journal mode default (rollback journal) sengaja dipakai karena
+    WAL tidak aman di network share.
+
+    database_customer.xlsx tetap didukung: di-import saat file xlsx berubah
+    (mis. diedit di Excel) dan bisa di-export kapan saja.
+    """
+
+    def __init__(self, db_path=CUSTOMERS_DB, xlsx_path=CUSTOMERS_XLSX):
+        self.db_path = db_path
+        self.xlsx_path = xlsx_path
+        self._local = threading.local()
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        self.connection().executescript(SCHEMA)
+        self.sync_from_xlsx()
+
+    def connection(self):
+        """Satu koneksi per thread (sqlite3 tidak boleh dipakai lintas thread)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def _write(self, statements):
+        """Jalankan beberapa statement dalam satu transaksi tulis"""
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for sql, params in statements:
+                conn.execute(sql, params)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _get_meta(self, key, default=None):
+        row = self.connection().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row["value"]) if row else default
+
+    def _meta_statement(self, key, value):
+        return ("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, json.dumps(value)))
+
+    def columns(self):
+        """Urutan kolom xlsx asli (untuk export dan default field kosong)"""
+        return self._get_meta("columns", [NAME_COLUMN])
+
+    def extend_columns(self, columns):
+        """Tambahkan kolom baru (mis. dari file import massal) ke urutan kolom export"""
+        known = self.columns()
+        missing = [str(column) for column in columns if column and str(column) not in known]
+        if missing:
+            self._write([self._meta_statement("columns", known + missing)])
+
+    def count(self):
+        return self.connection().execute("SELECT COUNT(*) FROM customers").fetchone()[0]
+
+    def list_names(self):
+        """Semua nama customer, terurut"""
+        rows = self.connection().execute("SELECT company_name FROM customers ORDER BY company_name")
+        return [row[0] for row in rows]
+
+    def exists(self, company_name):
+        """True jika nama (setelah normalisasi) sudah terdaftar"""
+        row = self.connection().execute(
+            "SELECT 1 FROM customers WHERE normalized_name = ?", (normalize_name(company_name),)
+        ).fetchone()
+        return row is not None
+
+    def get(self, company_name):
+        """Semua field customer sebagai dict string; {} jika tidak ditemukan"""
+        row = self.connection().execute(
+            "SELECT company_name, data FROM customers WHERE normalized_name = ?",
+            (normalize_name(company_name),)
+        ).fetchone()
+        if row is None:
+            return {}
+
+        customer = {column: "" for column in self.columns()}
+        customer.update(json.loads(row["data"]))
+        customer[NAME_COLUMN] = row["company_name"]
+        return customer
+
+    def add(self, company_name, data=None):
+        """Tambah customer; False jika nama yang sama (dinormalisasi) sudah ada"""
+        company_name = str(company_name).strip()
+        if not normalize_name(company_name):
+            raise ValueError("Customer name is empty")
+
+        now = time.time()
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO customers (company_name, normalized_name, data, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (company_name, normalize_name(company_name), json.dumps(clean_row(data or {})), now, now)
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return cursor.rowcount == 1
+
+    def add_many(self, rows):
+        """
+        Insert banyak customer (dict per baris) dalam satu transaksi.
+
+        Return set nama yang benar-benar ditambahkan - nama yang sudah ada
+        (termasuk yang baru saja disisipkan user lain) dilewati.
+        """
+        now = time.time()
+        inserted = set()
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for row in rows:
+                name = str(row.get(NAME_COLUMN) or "").strip()
+                if not normalize_name(name):
+                    continue
+                data = clean_row({key: value for key, value in row.items() if key != NAME_COLUMN})
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO customers (company_name, normalized_name, data, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (name, normalize_name(name), json.dumps(data), now, now)
+                )
+                if cursor.rowcount == 1:
+                    inserted.add(name)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return inserted
+
+    def import_rows(self, rows, columns=None):
+        """
+        Upsert banyak baris (dict per customer) dalam satu transaksi.
+
+        Nama berbeda yang dinormalisasi menjadi key yang sama (mis. "PT. ABC" dan
+        "PT ABC") tidak digabung: baris pertama (atau customer yang sudah ada di
+        database) dipertahankan, baris lain dilewati dan dilaporkan.
+
+        Return (jumlah baris yang di-import, list (nama dilewati, nama yang dipertahankan)).
+        """
+        now = time.time()
+        imported = 0
+        collisions = []
+        kept = {}
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for row in rows:
+                name = str(row.get(NAME_COLUMN) or "").strip()
+                key = normalize_name(name)
+                if not key:
+                    continue
+                if key in kept:
+                    if kept[key] != name:
+                        collisions.append((name, kept[key]))
+                    continue
+
+                data = clean_row({k: value for k, value in row.items() if k != NAME_COLUMN})
+                cursor = conn.execute(
+                    "INSERT INTO customers (company_name, normalized_name, data, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?) "
+                    "ON CONFLICT(normalized_name) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at "
+                    "WHERE company_name = excluded.company_name",
+                    (name, key, json.dumps(data), now, now)
+                )
+                if cursor.rowcount == 1:
+                    kept[key] = name
+                    imported += 1
+                else:
+                    # Key sudah dipakai customer lain dengan nama berbeda
+                    existing = conn.execute(
+                        "SELECT company_name FROM customers WHERE normalized_name = ?", (key,)
+                    ).fetchone()[0]
+                    collisions.append((name, existing))
+            if columns:
+                # Digabung seperti extend_columns - kolom yang ditambahkan onboarding tidak hilang
+                known = self.columns()
+                missing = [str(column) for column in columns if column and str(column) not in known]
+                if missing:
+                    conn.execute(*self._meta_statement("columns", known + missing))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return imported, collisions
+
+    def sync_from_xlsx(self):
+        """Import database_customer.xlsx jika berubah sejak import terakhir"""
+        if not self.xlsx_path or not os.path.exists(self.xlsx_path):
+            return 0
+
+        mtime = os.path.getmtime(self.xlsx_path)
+        if self._get_meta("xlsx_mtime") == mtime:
+            return 0
+
+        try:
+            columns, rows = read_xlsx_records(self.xlsx_path)
+            if NAME_COLUMN not in columns:
+                print(f"Error: '{NAME_COLUMN}' column not found in {self.xlsx_path}")
+                return 0
+            imported, collisions = self.import_rows(rows, columns)
+            self._write([self._meta_statement("xlsx_mtime", mtime)])
+            print(f"Imported {imported} customers from {self.xlsx_path}")
+            print_collisions(collisions)
+            return imported
+        except Exception as e:
+            print(f"Error importing customer database: {str(e)}")
+            return 0
+
+    def export_xlsx(self, path=None):
+        """Tulis seluruh database ke xlsx (format kolom asli)"""
+        from openpyxl import Workbook
+
+        path = path or self.xlsx_path
+        columns = self.columns()
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet()
+        ws.append(columns)
+        rows = self.connection().execute("SELECT company_name, data FROM customers ORDER BY company_name")
+        for row in rows:
+            customer = json.loads(row["data"])
+            customer[NAME_COLUMN] = row["company_name"]
+            ws.append([customer.get(column, "") for column in columns])
+        wb.save(path)
+
+        # Export sendiri tidak perlu di-import ulang
+        if self.xlsx_path and os.path.abspath(path) == os.path.abspath(self.xlsx_path):
+            self._write([self._meta_statement("xlsx_mtime", os.path.getmtime(path))])
+        return path
+
+
+def print_collisions(collisions):
+    """Laporkan baris import yang dilewati karena namanya bentrok setelah normalisasi"""
+    if collisions:
+        print(f"Skipped {len(collisions)} rows whose names collide with another customer after normalization:")
+        for name, kept_name in collisions:
+            print(f"  '{name}' (kept '{kept_name}')")
+
+
+def clean_row(row):
+    """Nilai kosong/NaN -> "", angka -> string (sama seperti pembacaan pandas sebelumnya)"""
+    cleaned = {}
+    for key, value in row.items():
+        if value is None or (isinstance(value, float) and value != value):
+            cleaned[str(key)] = ""
+        else:
+            cleaned[str(key)] = value if isinstance(value, str) else str(value)
+    return cleaned
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_customer_store():
+    """Shared customer store"""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = CustomerStore()
+        return _store
+
+
+def customer_database_available():
+    """True jika database SQLite atau xlsx sumber import tersedia"""
+    return os.path.exists(CUSTOMERS_DB) or os.path.exists(CUSTOMERS_XLSX)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Import/export customer database (SQLite <-> database_customer.xlsx)')
+    parser.add_argument('command', choices=['import', 'export'])
+    parser.add_argument('path', nargs='?', default=CUSTOMERS_XLSX, help='xlsx path (default: data/database_customer.xlsx)')
+    args = parser.parse_args()
+
+    store = CustomerStore(xlsx_path=None)
+    if args.command == 'import':
+        columns, rows = read_xlsx_records(args.path)
+        imported, collisions = store.import_rows(rows, columns)
+        print(f"Imported {imported} customers from {args.path}")
+        print_collisions(collisions)
+    else:
+        print(f"Exported {store.count()} customers to {store.export_xlsx(args.path)}")
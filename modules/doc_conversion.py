@@ -0,0 +1,235 @@
+# modules/doc_conversion.py - Konversi dokumen Word ke PDF dengan backend yang bisa diganti
+
+import glob
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+from urllib.parse import urljoin
+from urllib.request import pathname2url
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import CONVERSION_BACKENDS, CONVERSION_WORKERS, CONVERSION_TIMEOUT, SOFFICE_PATH, CACHE_DIR
+from modules.cancellation import current_token
+
+
+class ConversionError(Exception):
+    """Dokumen tidak bisa dikonversi oleh backend mana pun"""
+    pass
+
+
+class ConversionBackend:
+    """Interface backend: konversi satu dokumen ke PDF di `pdf_path`"""
+    name = "base"
+
+    def is_available(self):
+        return False
+
+    def convert(self, source_path, pdf_path):
+        raise NotImplementedError
+
+
+class LibreOfficeBackend(ConversionBackend):
+    """
+    soffice --headless --convert-to pdf dengan pool worker.
+
+    Setiap slot worker memakai profil LibreOffice sendiri (-env:UserInstallation)
+    yang disimpan permanen di cache, sehingga beberapa konversi bisa berjalan
+    paralel dan inisialisasi profil (bagian startup paling lambat) hanya terjadi
+    sekali per slot. warm_up() menyiapkan profil tersebut di background.
+    """
+    name = "libreoffice"
+
+    def __init__(self, soffice_path=None, workers=CONVERSION_WORKERS, timeout=CONVERSION_TIMEOUT):
+        self.soffice_path = soffice_path or self.find_soffice()
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.profile_root = os.path.join(CACHE_DIR, "lo_profiles")
+
+        self._slots = queue.Queue()
+        for slot in range(self.workers):
+            self._slots.put(slot)
+
+    @staticmethod
+    def find_soffice():
+        """Cari executable soffice dari config, PATH, lalu lokasi instalasi umum"""
+        if SOFFICE_PATH and os.path.exists(SOFFICE_PATH):
+            return SOFFICE_PATH
+
+        for name in ("soffice", "libreoffice"):
+            found = shutil.which(name)
+            if found:
+                return found
+
+        candidates = [
+            r"C:\Program Files\LibreOffice\program\soffice.exe",
+            r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+            "/Applications/LibreOffice.app/Contents/MacOS/soffice",
+        ]
+        for candidate in candidates:
+            if os.path.exists(candidate):
+                return candidate
+        return None
+
+    def is_available(self):
+        return bool(self.soffice_path)
+
+    def _profile_url(self, slot):
+        profile_dir = os.path.join(self.profile_root, f"worker_{slot}")
+        os.makedirs(profile_dir, exist_ok=True)
+        return urljoin("file:", pathname2url(os.path.abspath(profile_dir)))
+
+    def _base_command(self, slot):
+        return [
+            self.soffice_path,
+            f"-env:UserInstallation={self._profile_url(slot)}",
+            "--headless", "--invisible", "--norestore", "--nolockcheck", "--nodefault",
+        ]
+
+    def warm_up(self):
+        """Inisialisasi profil semua slot di background (tidak memblokir caller)"""
+        if not self.is_available():
+            return
+
+        def warm(slot):
+            try:
+                subprocess.run(self._base_command(slot) + ["--terminate_after_init"],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                               timeout=self.timeout)
+            except Exception as e:
+                print(f"LibreOffice warm-up slot {slot} gagal: {str(e)}")
+
+        for slot in range(self.workers):
+            threading.Thread(target=warm, args=(slot,), daemon=True).start()
+
+    def convert(self, source_path, pdf_path):
+        if not self.is_available():
+            raise ConversionError("LibreOffice (soffice) tidak ditemukan")
+
+        slot = self._slots.get()
+        out_dir = tempfile.mkdtemp(prefix="diac_lo_")
+        try:
+            command = self._base_command(slot) + ["--convert-to", "pdf", "--outdir", out_dir, source_path]
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+            # soffice dimatikan jika task pemanggil dibatalkan
+            cancel_token = current_token()
+            cancel_token.register_process(process)
+            try:
+                _, stderr = process.communicate(timeout=self.timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.communicate()
+                raise ConversionError(f"LibreOffice timeout setelah {self.timeout} detik")
+            finally:
+                cancel_token.unregister_process(process)
+            cancel_token.raise_if_cancelled()
+
+            produced = glob.glob(os.path.join(out_dir, "*.pdf"))
+            if process.returncode != 0 or not produced:
+                message = stderr.decode(errors="ignore").strip() or f"exit code {process.returncode}"
+                raise ConversionError(f"LibreOffice gagal mengkonversi dokumen: {message}")
+
+            shutil.move(produced[0], pdf_path)
+        finally:
+            shutil.rmtree(out_dir, ignore_errors=True)
+            self._slots.put(slot)
+
+
+class WordBackend(ConversionBackend):
+    """docx2pdf via Microsoft Word automation (Windows saja, satu konversi per thread)"""
+    name = "word"
+
+    def __init__(self):
+        # Word tidak aman dipanggil paralel - konversi diserialkan
+        self._lock = threading.Lock()
+
+    def is_available(self):
+        try:
+            import docx2pdf
+            import pythoncom
+            return True
+        except ImportError:
+            return False
+
+    def convert(self, source_path, pdf_path):
+        import docx2pdf
+        import pythoncom
+
+        with self._lock:
+            pythoncom.CoInitialize()
+            try:
+                docx2pdf.convert(source_path, pdf_path)
+            finally:
+                pythoncom.CoUninitialize()
+
+
+BACKEND_CLASSES = {
+    LibreOfficeBackend.name: LibreOfficeBackend,
+    WordBackend.name: WordBackend,
+}
+
+
+class DocumentConverter:
+    """
+    Konversi dokumen ke PDF: backend dicoba sesuai urutan CONVERSION_BACKENDS.
+
+    Converter tidak menyimpan cache sendiri - PDF di-cache per hash isi
+    dokumen oleh PageRenderService.ensure_pdf.
+    """
+
+    def __init__(self, backends=None):
+        if backends is None:
+            backends = [BACKEND_CLASSES[name]() for name in CONVERSION_BACKENDS if name in BACKEND_CLASSES]
+        self.backends = backends
+        self._warmed_up = False
+
+    def available_backends(self):
+        return [backend for backend in self.backends if backend.is_available()]
+
+    def is_available(self):
+        return bool(self.available_backends())
+
+    def warm_up(self):
+        """Siapkan backend di background; cukup sekali per proses"""
+        if self._warmed_up:
+            return
+        self._warmed_up = True
+        for backend in self.available_backends():
+            if hasattr(backend, "warm_up"):
+                backend.warm_up()
+
+    def convert_to_pdf(self, source_path, output_path):
+        """Konversi `source_path` ke PDF di `output_path` dengan backend pertama yang berhasil"""
+        errors = []
+        for backend in self.available_backends():
+            temp_path = f"{output_path}.{threading.get_ident()}.tmp.pdf"
+            try:
+                backend.convert(source_path, temp_path)
+                os.replace(temp_path, output_path)
+                return output_path
+            except Exception as e:
+                errors.append(f"{backend.name}: {str(e)}")
+                print(f"Konversi dengan backend {backend.name} gagal: {str(e)}")
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+
+        if not errors:
+            raise ConversionError("Tidak ada backend konversi PDF yang tersedia (LibreOffice / Microsoft Word)")
+        raise ConversionError("; ".join(errors))
+
+
+_converter = None
+_converter_lock = threading.Lock()
+
+
+def get_document_converter():
+    """Shared converter (satu pool worker untuk seluruh aplikasi)"""
+    global _converter
+    with _converter_lock:
+        if _converter is None:
+            _converter = DocumentConverter()
+        return _converter
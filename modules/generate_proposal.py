@@ -9,6 +9,10 @@ from docx.oxml.ns import nsdecls
 from docx.oxml import parse_xml
 from docx.shared import RGBColor
 from docx.enum.text import WD_COLOR_INDEX
+from modules.cancellation import OperationCancelled, current_token
+from modules.proposal_template import (MODE_FOOTER, MODE_FOOTER_FIELDS, PlaceholderResolver,
+                                       find_placeholder_spans, get_placeholder_index,
+                                       paragraph_has_page_field)
 
 def clean_filename(filename):
     """
@@ -911,9 +915,6 @@ def excel_to_word_by_cell(excel_path, template_path, output_path, selected_user_
         
         def replace_in_paragraph_runs(self, paragraph, is_footer=False):
             """Replace placeholders in paragraphs while maintaining formatting"""
-            # Pattern to detect Excel placeholders, e.g.: {{Sheet1.A1}}, {{DATE.NOW}}, {{USER_CODE.NAME}}, {{QUOTATION_NO.NO}}, or {{EFFLUENT.PARAM_1_NAME}}
-            pattern = r'\{\{([^}]+)\.([A-Z0-9_]+)\}\}'
-            
             # Before processing Excel placeholders, check if there are mathematical placeholders
             for i, run in enumerate(paragraph.runs):
                 # Check and replace mathematical placeholders
@@ -924,53 +925,41 @@ def excel_to_word_by_cell(excel_path, template_path, output_path, selected_user_
             
             # We need to track changes in run structure, as this can change when we modify
             orig_runs = list(paragraph.runs)
+            
+            # Identify which runs contain parts of placeholders (split runs are combined)
+            spans = find_placeholder_spans([run.text for run in orig_runs])
+            self.apply_placeholder_spans(paragraph, orig_runs, spans, is_footer)
+        
+        def apply_placeholder_spans(self, paragraph, orig_runs, spans, is_footer=False):
+            """Replace placeholders at known run spans (start_run, end_run, placeholder, sheet, cell)"""
             placeholder_runs = {}  # Store info about placeholders in which run
             
-            # Identify which runs contain parts of placeholders
-            for i, run in enumerate(orig_runs):
-                if '{{' in run.text:
-                    # Possible start of placeholder
-                    full_placeholder = run.text
-                    run_index = i
-                    
-                    # If placeholder is split across multiple runs, we need to combine them
-                    while '}}' not in full_placeholder and run_index < len(orig_runs) - 1:
-                        run_index += 1
-                        full_placeholder += orig_runs[run_index].text
+            for start_run, end_run, placeholder_text, sheet_name, cell_ref in spans:
+                # Get value from Excel, USER_CODE, QUOTATION_NO, EFFLUENT, or date placeholder
+                value = self.get_cell_value(sheet_name, cell_ref)
+                if value is not None:
+                    value = str(value)
+                    # If in footer, convert to uppercase
+                    if is_footer:
+                        value = value.upper()
                     
-                    # Extract placeholder parts using regex
-                    matches = list(re.finditer(pattern, full_placeholder))
-                    for match in matches:
-                        # Store information about this placeholder
-                        placeholder_text = match.group(0)  # {{Sheet1.A1}}, {{USER_CODE.NAME}}, {{QUOTATION_NO.NO}}, {{EFFLUENT.PARAM_1_NAME}}, etc
-                        sheet_name = match.group(1)        # Sheet1, USER_CODE, DATE, QUOTATION_NO, EFFLUENT
-                        cell_ref = match.group(2)          # A1, NAME, NOW, NO, PARAM_1_NAME
-                        
-                        # Get value from Excel, USER_CODE, QUOTATION_NO, EFFLUENT, or date placeholder
-                        value = self.get_cell_value(sheet_name, cell_ref)
-                        if value is not None:
-                            value = str(value)
-                            # If in footer, convert to uppercase
-                            if is_footer:
-                                value = value.upper()
-                            
-                            # Check if value contains mathematical placeholders and replace if necessary
-                            for math_ph, math_val in math_placeholders.items():
-                                if math_ph in value:
-                                    value = value.replace(math_ph, math_val)
-                                    self.math_replacement_count += 1
-                        else:
-                            value = ""
-                        
-                        # Store information for later processing
-                        placeholder_runs[i] = {
-                            'start_run': i,
-                            'end_run': run_index,
-                            'placeholder': placeholder_text,
-                            'value': value,
-                            'contains_umlaut': 'ü' in value
-                        }
-                        self.replacement_count += 1
+                    # Check if value contains mathematical placeholders and replace if necessary
+                    for math_ph, math_val in math_placeholders.items():
+                        if math_ph in value:
+                            value = value.replace(math_ph, math_val)
+                            self.math_replacement_count += 1
+                else:
+                    value = ""
+                
+                # Store information for later processing
+                placeholder_runs[start_run] = {
+                    'start_run': start_run,
+                    'end_run': end_run,
+                    'placeholder': placeholder_text,
+                    'value': value,
+                    'contains_umlaut': 'ü' in value
+                }
+                self.replacement_count += 1
             
             # Process replacements starting from last run to prevent index shifting
             for start_run_idx in sorted(placeholder_runs.keys(), reverse=True):
@@ -1070,52 +1059,73 @@ def excel_to_word_by_cell(excel_path, template_path, output_path, selected_user_
                 # Footer - with is_footer=True parameter for uppercase conversion
                 footer = section.footer
                 for para in footer.paragraphs:
-                    # Check if paragraph contains page number field
-                    contains_page_field = False
-                    for run in para.runs:
-                        # Page number field is usually represented with special characters or patterns
-                        if run._element.xpath('.//w:fldChar') or "PAGE" in run.text or run._element.xpath('.//w:instrText'):
-                            contains_page_field = True
-                            break
-                    
                     # Only process paragraphs that don't contain page number fields
-                    if not contains_page_field:
+                    if not paragraph_has_page_field(para):
                         self.replace_in_paragraph_runs(para, is_footer=True)
                     else:
-                        # For paragraphs with page number fields, only convert normal text to uppercase
-                        # without disturbing page number fields
-                        for run in para.runs:
-                            if not (run._element.xpath('.//w:fldChar') or run._element.xpath('.//w:instrText')):
-                                # Convert to uppercase only if not part of field
-                                run.text = run.text.upper()
+                        self.uppercase_footer_text(para)
                 
                 self.replace_in_tables(footer.tables, is_footer=True)
         
-        def process_document(self, doc):
-            """Enhanced process_document method"""
+        def uppercase_footer_text(self, para):
+            """For paragraphs with page number fields, only convert normal text to uppercase
+            without disturbing page number fields"""
+            for run in para.runs:
+                if not (run._element.xpath('.//w:fldChar') or run._element.xpath('.//w:instrText')):
+                    # Convert to uppercase only if not part of field
+                    run.text = run.text.upper()
+        
+        def replace_indexed_locations(self, doc, index):
+            """Replace placeholders only in paragraphs recorded in the compiled template index"""
+            resolver = PlaceholderResolver(doc)
+            for location in index['locations']:
+                para = resolver.paragraph(location['part'], location['path'])
+                if location['mode'] == MODE_FOOTER_FIELDS:
+                    self.uppercase_footer_text(para)
+                    continue
+                
+                is_footer = location['mode'] == MODE_FOOTER
+                runs = list(para.runs)
+                # Paragraph differs from the compiled template (e.g. a linked header
+                # visited twice) or has math placeholders - use the full replacement
+                if location['math'] or [run.text for run in runs] != location['texts']:
+                    self.replace_in_paragraph_runs(para, is_footer)
+                else:
+                    self.apply_placeholder_spans(para, runs, location['spans'], is_footer)
+        
+        def process_document(self, doc, index=None):
+            """Enhanced process_document method; `index` is the compiled placeholder index (optional)"""
             # IMPORTANT: Process effluent table BEFORE text replacement
             # This ensures we can still find the placeholder patterns
             if self.effluent_data and '_PARAM_COUNT' in self.effluent_data:
                 param_count = self.effluent_data.get('_PARAM_COUNT', 0)
                 
                 # Find and mark effluent table before text replacement
-                effluent_table = self.find_effluent_table_before_replacement(doc)
+                if index is not None:
+                    table_index = index['effluent_table']
+                    effluent_table = doc.tables[table_index] if table_index is not None else None
+                else:
+                    effluent_table = self.find_effluent_table_before_replacement(doc)
                 if effluent_table:
                     # Store reference for later processing
                     self.marked_effluent_table = effluent_table
                 else:
                     self.marked_effluent_table = None
             
-            # Process all text replacements
-            # Process main paragraphs
-            for para in doc.paragraphs:
-                self.replace_in_paragraph_runs(para)
-            
-            # Process tables (including effluent table text replacement)
-            self.replace_in_tables(doc.tables)
-            
-            # Process headers and footers
-            self.replace_in_section_headers_footers(doc)
+            if index is not None:
+                # Jump straight to the recorded placeholder locations
+                self.replace_indexed_locations(doc, index)
+            else:
+                # Process all text replacements
+                # Process main paragraphs
+                for para in doc.paragraphs:
+                    self.replace_in_paragraph_runs(para)
+                
+                # Process tables (including effluent table text replacement)
+                self.replace_in_tables(doc.tables)
+                
+                # Process headers and footers
+                self.replace_in_section_headers_footers(doc)
             
             # After text replacements, remove unused rows from the marked effluent table
             if hasattr(self, 'marked_effluent_table') and self.marked_effluent_table:
@@ -1154,9 +1164,26 @@ def excel_to_word_by_cell(excel_path, template_path, output_path, selected_user_
                 print(f"Error in pre-scan: {str(e)}")
                 return None
     
+    # Checkpoint pembatalan sebelum langkah yang berat
+    current_token().raise_if_cancelled()
+    
+    # Placeholder locations compiled once per template version (None -> full document walk)
+    placeholder_index = get_placeholder_index(template_path, doc)
+    
     # Use enhanced Replacer class to process document
     replacer = Replacer(effluent_data)
-    replacer.process_document(doc)
+    try:
+        replacer.process_document(doc, placeholder_index)
+    except (IndexError, KeyError, TypeError) as e:
+        if placeholder_index is None:
+            raise
+        # Index does not match this document - reopen the template and walk it fully
+        print(f"Placeholder index mismatch, using full scan: {str(e)}")
+        doc = Document(template_path)
+        replacer = Replacer(effluent_data)
+        replacer.process_document(doc)
+    
+    current_token().raise_if_cancelled()
     
     # Save result to new file
     try:
@@ -1233,7 +1260,15 @@ def generate_proposal(excel_path, template_path, output_dir, selected_user_code=
         output_path = os.path.join(output_dir, clean_filename(fallback_filename))
             
     # Run function to create document
-    success = excel_to_word_by_cell(excel_path, template_path, output_path, selected_user_code)
+    existed_before = os.path.exists(output_path)
+    try:
+        success = excel_to_word_by_cell(excel_path, template_path, output_path, selected_user_code)
+        current_token().raise_if_cancelled()
+    except OperationCancelled:
+        # Dokumen yang baru dibuat oleh proses yang dibatalkan dihapus lagi
+        if not existed_before and os.path.exists(output_path):
+            os.remove(output_path)
+        raise
     
     # If successful in generating proposal, update cell A1 in DATA_PROPOSAL sheet
     if success:
@@ -1305,7 +1340,7 @@ if __name__ == "__main__":
     
     if args.customer_name:
         # If customer_name is provided, use customer-specific path
-        from modules.fix_customer_system import clean_folder_name
+        from modules.customer_index import clean_folder_name
         
         # Create customer folder path
         customer_folder = os.path.join(root_dir, "data", "customers", clean_folder_name(args.customer_name))
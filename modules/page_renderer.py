@@ -0,0 +1,168 @@
+# modules/page_renderer.py - Render halaman dokumen (PDF) ke PNG dengan cache di disk
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import RENDER_CACHE_DIR, THUMBNAIL_DPI, FULL_PAGE_DPI
+
+# Pengecekan opsional untuk modul PyMuPDF (fitz)
+HAS_PYMUPDF = False
+try:
+    import fitz
+    HAS_PYMUPDF = True
+except ImportError:
+    pass
+
+
+def file_content_hash(file_path, chunk_size=1024 * 1024):
+    """SHA-256 dari isi file - kunci cache tetap valid walau file di-copy / di-rename"""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PageRenderService:
+    """
+    Render service untuk pratinjau dokumen.
+
+    Setiap dokumen punya folder cache sendiri (<cache_dir>/<content hash>/) berisi
+    PDF hasil konversi, meta.json (jumlah halaman) dan PNG per halaman per DPI.
+    Thumbnail dirender di THUMBNAIL_DPI; resolusi penuh hanya saat diminta.
+    """
+
+    def __init__(self, cache_dir=RENDER_CACHE_DIR, max_documents=20):
+        self.cache_dir = cache_dir
+        self.max_documents = max_documents
+        self._lock = threading.Lock()
+        self._pdf_locks = {}
+
+    def document_dir(self, doc_hash):
+        return os.path.join(self.cache_dir, doc_hash)
+
+    def pdf_path(self, doc_hash):
+        return os.path.join(self.document_dir(doc_hash), "document.pdf")
+
+    def page_path(self, doc_hash, page_num, dpi):
+        return os.path.join(self.document_dir(doc_hash), f"page_{page_num:04d}_{dpi}dpi.png")
+
+    def ensure_pdf(self, source_path, doc_hash, convert):
+        """
+        Return path PDF untuk dokumen; `convert(source_path, pdf_path)` hanya
+        dipanggil jika PDF untuk hash ini belum ada di cache.
+        """
+        pdf_path = self.pdf_path(doc_hash)
+        if os.path.exists(pdf_path):
+            return pdf_path
+
+        # Dokumen yang sama tidak dikonversi dua kali secara bersamaan
+        with self._lock:
+            pdf_lock = self._pdf_locks.setdefault(doc_hash, threading.Lock())
+
+        with pdf_lock:
+            if os.path.exists(pdf_path):
+                return pdf_path
+
+            os.makedirs(self.document_dir(doc_hash), exist_ok=True)
+
+            if source_path.lower().endswith(".pdf"):
+                shutil.copy2(source_path, pdf_path)
+            else:
+                # Konversi ke file sementara dulu supaya PDF setengah jadi tidak masuk cache
+                temp_path = pdf_path + ".tmp.pdf"
+                convert(source_path, temp_path)
+                os.replace(temp_path, pdf_path)
+
+        self.prune()
+        return pdf_path
+
+    def document_info(self, doc_hash):
+        """
+        {'page_count': n, 'page_ratio': tinggi/lebar halaman pertama} untuk PDF di cache.
+        Dibaca dari meta.json jika ada sehingga dokumen tidak perlu dibuka ulang.
+        """
+        meta_path = os.path.join(self.document_dir(doc_hash), "meta.json")
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                info = json.load(f)
+            if "page_count" in info and "page_ratio" in info:
+                return info
+        except (OSError, ValueError):
+            pass
+
+        if not HAS_PYMUPDF:
+            raise RuntimeError("PyMuPDF (modul fitz) tidak tersedia")
+
+        with fitz.open(self.pdf_path(doc_hash)) as doc:
+            info = {"page_count": doc.page_count, "page_ratio": 297 / 210}
+            if doc.page_count:
+                rect = doc.load_page(0).rect
+                if rect.width:
+                    info["page_ratio"] = rect.height / rect.width
+
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump(info, f)
+        return info
+
+    def page_count(self, doc_hash):
+        """Jumlah halaman PDF yang sudah ada di cache"""
+        return self.document_info(doc_hash)["page_count"]
+
+    def is_cached(self, doc_hash, page_num, dpi=THUMBNAIL_DPI):
+        return os.path.exists(self.page_path(doc_hash, page_num, dpi))
+
+    def render_page(self, doc_hash, page_num, dpi=THUMBNAIL_DPI):
+        """Render satu halaman ke PNG (atau ambil dari cache) dan return path-nya"""
+        png_path = self.page_path(doc_hash, page_num, dpi)
+        if os.path.exists(png_path):
+            return png_path
+
+        if not HAS_PYMUPDF:
+            raise RuntimeError("PyMuPDF (modul fitz) tidak tersedia")
+
+        with fitz.open(self.pdf_path(doc_hash)) as doc:
+            page = doc.load_page(page_num)
+            pix = page.get_pixmap(matrix=fitz.Matrix(dpi / 72, dpi / 72), alpha=False)
+
+            # Nama sementara unik per thread - halaman yang sama bisa dirender paralel
+            temp_path = f"{png_path}.{threading.get_ident()}.tmp.png"
+            pix.save(temp_path)
+            os.replace(temp_path, png_path)
+
+        return png_path
+
+    def render_full_page(self, doc_hash, page_num):
+        """Render resolusi penuh - hanya dipanggil saat user membuka satu halaman"""
+        return self.render_page(doc_hash, page_num, FULL_PAGE_DPI)
+
+    def prune(self):
+        """Hapus cache dokumen paling lama jika jumlahnya melebihi max_documents"""
+        with self._lock:
+            try:
+                entries = [entry for entry in os.scandir(self.cache_dir) if entry.is_dir()]
+            except FileNotFoundError:
+                return
+
+            if len(entries) <= self.max_documents:
+                return
+
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+            for entry in entries[:len(entries) - self.max_documents]:
+                shutil.rmtree(entry.path, ignore_errors=True)
+
+
+_render_service = None
+
+
+def get_render_service():
+    """Shared render service (satu cache untuk seluruh aplikasi)"""
+    global _render_service
+    if _render_service is None:
+        _render_service = PageRenderService()
+    return _render_service
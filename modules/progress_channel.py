@@ -0,0 +1,33 @@
+# modules/progress_channel.py - Progress terbaru dari worker thread, dibaca GUI pada frame rate tetap
+
+
+class ProgressChannel:
+    """
+    Worker menulis progress sesering apa pun; GUI membaca dengan timer (mis. 30 Hz).
+
+    Tidak ada lock maupun signal per update: write() hanya mengganti satu
+    referensi tuple (atomik di CPython), sehingga biayanya bagi task hampir nol.
+    Update di antara dua pembacaan digabung - hanya nilai terakhir yang tampil.
+    """
+
+    def __init__(self):
+        self._latest = None
+        self._version = 0
+        self._read_version = 0
+
+    def write(self, percentage, message=""):
+        """Dipanggil dari worker thread"""
+        self._latest = (int(percentage), message)
+        self._version += 1
+
+    def has_updates(self):
+        """True jika pernah ada progress yang ditulis worker"""
+        return self._version > 0
+
+    def read(self):
+        """(percentage, message) terbaru sejak pembacaan terakhir, atau None jika tidak berubah"""
+        version = self._version
+        if version == self._read_version:
+            return None
+        self._read_version = version
+        return self._latest
@@ -0,0 +1,200 @@
+# modules/proposal_template.py - Index placeholder template proposal Word, dikompilasi sekali per versi template
+
+import os
+import re
+import sys
+import json
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import TEMPLATE_CACHE_DIR
+from modules.page_renderer import file_content_hash
+
+# Dinaikkan jika logika kompilasi berubah - cache JSON lama otomatis diabaikan
+INDEX_VERSION = 1
+
+# Excel placeholders, e.g.: {{Sheet1.A1}}, {{DATE.NOW}}, {{USER_CODE.NAME}}, {{EFFLUENT.PARAM_1_NAME}}
+PLACEHOLDER_PATTERN = re.compile(r'\{\{([^}]+)\.([A-Z0-9_]+)\}\}')
+# Mathematical placeholders $P1$ - $P4$
+MATH_PLACEHOLDER_PATTERN = re.compile(r'\$P\d+\$')
+
+# Mode per lokasi paragraf
+MODE_BODY = "body"
+MODE_FOOTER = "footer"              # placeholder di footer, nilai di-uppercase
+MODE_FOOTER_FIELDS = "footer_fields"  # paragraf footer dengan field PAGE, hanya teks biasa di-uppercase
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def find_placeholder_spans(run_texts):
+    """
+    Placeholder per paragraf: list (start_run, end_run, placeholder, sheet, cell).
+
+    Placeholder yang terpecah ke beberapa run digabung mulai dari run yang
+    berisi '{{' sampai run yang berisi '}}'.
+    """
+    spans = []
+    for i, text in enumerate(run_texts):
+        if '{{' not in text:
+            continue
+        full_placeholder = text
+        run_index = i
+        while '}}' not in full_placeholder and run_index < len(run_texts) - 1:
+            run_index += 1
+            full_placeholder += run_texts[run_index]
+        for match in PLACEHOLDER_PATTERN.finditer(full_placeholder):
+            spans.append((i, run_index, match.group(0), match.group(1), match.group(2)))
+    return spans
+
+
+def paragraph_has_page_field(paragraph):
+    """True jika paragraf footer berisi field nomor halaman"""
+    for run in paragraph.runs:
+        if run._element.xpath('.//w:fldChar') or "PAGE" in run.text or run._element.xpath('.//w:instrText'):
+            return True
+    return False
+
+
+def find_effluent_table_index(doc):
+    """Index tabel (doc.tables) yang berisi placeholder {{EFFLUENT.*}}, atau None"""
+    for table_index, table in enumerate(doc.tables):
+        for row in table.rows:
+            for cell in row.cells:
+                cell_text = " ".join(para.text for para in cell.paragraphs)
+                if "{{EFFLUENT." in cell_text:
+                    return table_index
+    return None
+
+
+def _story_paragraphs(story):
+    """(path, paragraph) untuk paragraf langsung dan paragraf di sel tabel, urutan sama dengan Replacer"""
+    for paragraph_index, paragraph in enumerate(story.paragraphs):
+        yield ["p", paragraph_index], paragraph
+    for table_index, table in enumerate(story.tables):
+        for row_index, row in enumerate(table.rows):
+            for cell_index, cell in enumerate(row.cells):
+                for paragraph_index, paragraph in enumerate(cell.paragraphs):
+                    yield ["t", table_index, row_index, cell_index, paragraph_index], paragraph
+
+
+def compile_placeholder_index(doc):
+    """
+    Catat setiap paragraf yang perlu diproses saat generate: part (body,
+    header/footer per section), path paragraf, teks run saat kompilasi,
+    span run setiap placeholder, apakah ada placeholder matematika, serta
+    index tabel effluent. Paragraf lain tidak pernah disentuh lagi.
+    """
+    locations = []
+
+    def add_story(part, story, is_footer=False):
+        for path, paragraph in _story_paragraphs(story):
+            run_texts = [run.text for run in paragraph.runs]
+            if is_footer and path[0] == "p" and paragraph_has_page_field(paragraph):
+                locations.append({"part": part, "path": path, "mode": MODE_FOOTER_FIELDS})
+                continue
+
+            has_math = any(MATH_PLACEHOLDER_PATTERN.search(text) for text in run_texts)
+            if not has_math and not any('{{' in text for text in run_texts):
+                continue
+            locations.append({
+                "part": part,
+                "path": path,
+                "mode": MODE_FOOTER if is_footer else MODE_BODY,
+                "texts": run_texts,
+                "spans": [list(span) for span in find_placeholder_spans(run_texts)],
+                "math": has_math
+            })
+
+    add_story(["body"], doc)
+    for section_index, section in enumerate(doc.sections):
+        add_story(["header", section_index], section.header)
+        add_story(["footer", section_index], section.footer, is_footer=True)
+
+    return {
+        "index_version": INDEX_VERSION,
+        "locations": locations,
+        "effluent_table": find_effluent_table_index(doc)
+    }
+
+
+class PlaceholderResolver:
+    """Ambil paragraf dokumen dari path di index tanpa menelusuri seluruh dokumen"""
+
+    def __init__(self, doc):
+        self.doc = doc
+        self._stories = {}
+        self._paragraphs = {}
+        self._tables = {}
+        self._cells = {}
+
+    def _story(self, part):
+        key = tuple(part)
+        story = self._stories.get(key)
+        if story is None:
+            if part[0] == "body":
+                story = self.doc
+            else:
+                section = self.doc.sections[part[1]]
+                story = section.header if part[0] == "header" else section.footer
+            self._stories[key] = story
+        return story
+
+    def paragraph(self, part, path):
+        key = tuple(part)
+        story = self._story(part)
+        if path[0] == "p":
+            if key not in self._paragraphs:
+                self._paragraphs[key] = story.paragraphs
+            return self._paragraphs[key][path[1]]
+
+        _, table_index, row_index, cell_index, paragraph_index = path
+        if key not in self._tables:
+            self._tables[key] = story.tables
+        row_key = (key, table_index, row_index)
+        if row_key not in self._cells:
+            self._cells[row_key] = self._tables[key][table_index].rows[row_index].cells
+        return self._cells[row_key][cell_index].paragraphs[paragraph_index]
+
+
+def get_placeholder_index(template_path, doc=None, cache_dir=TEMPLATE_CACHE_DIR):
+    """
+    Index placeholder template, dari memori / cache JSON per hash template.
+    Jika belum ada, dikompilasi dari `doc` (template yang baru dibuka, belum diubah).
+    Return None jika index tidak tersedia - pemanggil memakai penelusuran penuh.
+    """
+    try:
+        stat = os.stat(template_path)
+        memory_key = (os.path.abspath(template_path), stat.st_mtime, stat.st_size)
+        with _indexes_lock:
+            index = _indexes.get(memory_key)
+            if index is not None:
+                return index
+
+            template_hash = file_content_hash(template_path)
+            cache_path = os.path.join(cache_dir, f"{template_hash}.placeholders.json")
+            index = None
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("index_version") == INDEX_VERSION:
+                    index = data
+            except (OSError, ValueError):
+                pass
+
+            if index is None:
+                if doc is None:
+                    return None
+                index = compile_placeholder_index(doc)
+                try:
+                    os.makedirs(cache_dir, exist_ok=True)
+                    with open(cache_path, "w", encoding="utf-8") as f:
+                        json.dump(index, f)
+                except OSError as e:
+                    print(f"Error writing placeholder index cache: {str(e)}")
+
+            _indexes[memory_key] = index
+            return index
+    except Exception as e:
+        print(f"Error loading placeholder index: {str(e)}")
+        return None
@@ -0,0 +1,116 @@
+# modules/reference_data.py - Data referensi (wilayah, industri, pompa, baku mutu) dari file JSON berversi
+
+import json
+import os
+import sys
+import threading
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import DATA_DIR
+
+REFERENCE_DIR = os.path.join(DATA_DIR, "reference")
+
+# Versi format file yang dipahami loader ini
+SUPPORTED_SCHEMA_VERSION = 1
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def load_reference(name):
+    """
+    Load data/reference/<name>.json sekali lalu simpan di cache memori.
+
+    Format file: {"name": ..., "schema": 1, "version": <versi data>, "data": {...}}
+    """
+    with _cache_lock:
+        entry = _cache.get(name)
+        if entry is None:
+            entry = _read_reference_file(name)
+            _cache[name] = entry
+        return entry["data"]
+
+
+def get_reference_version(name):
+    """Versi data dari file referensi (naikkan saat isi file diubah)"""
+    load_reference(name)
+    return _cache[name].get("version")
+
+
+def reload_reference(name=None):
+    """Buang cache agar file referensi dibaca ulang pada akses berikutnya"""
+    with _cache_lock:
+        if name is None:
+            _cache.clear()
+        else:
+            _cache.pop(name, None)
+
+
+def _read_reference_file(name):
+    file_path = os.path.join(REFERENCE_DIR, f"{name}.json")
+
+    with open(file_path, "r", encoding="utf-8") as f:
+        entry = json.load(f)
+
+    schema = entry.get("schema", 1)
+    if schema > SUPPORTED_SCHEMA_VERSION:
+        raise ValueError(f"Reference file {file_path} uses schema {schema}, "
+                         f"only schema <= {SUPPORTED_SCHEMA_VERSION} is supported")
+    if not isinstance(entry.get("data"), dict):
+        raise ValueError(f"Reference file {file_path} has no 'data' object")
+
+    return entry
+
+
+# Accessor per tabel - dipanggil saat data pertama kali dibutuhkan
+
+def get_industry_subtypes():
+    """{industry classification: [sub industry, ...]}"""
+    return load_reference("industry")["subtypes"]
+
+
+def get_provinces():
+    return load_reference("regions")["provinces"]
+
+
+def get_cities():
+    """{province: [city, ...]}"""
+    return load_reference("regions")["cities"]
+
+
+def get_seismic_zone_descriptions():
+    return load_reference("site_conditions")["seismic_zones"]
+
+
+def get_wind_speed_descriptions():
+    return load_reference("site_conditions")["wind_speeds"]
+
+
+def get_effluent_warranty_options():
+    return load_reference("effluent_warranty")["options"]
+
+
+def get_effluent_warranty_parameters(warranty_type):
+    """Daftar parameter baku mutu untuk satu jenis effluent warranty"""
+    return load_reference("effluent_warranty")["parameters"].get(warranty_type, [])
+
+
+def get_pump_brands():
+    return load_reference("pumps")["brands"]
+
+
+def get_pump_types():
+    """{brand: [pump type, ...]} - brand tanpa entry tidak memiliki turunan"""
+    return load_reference("pumps")["types"]
+
+
+def get_pump_models(brand, pump_type):
+    """Daftar model untuk kombinasi brand + type, atau None jika tidak ada mapping"""
+    return load_reference("pumps")["models"].get(brand, {}).get(pump_type)
+
+
+def iter_pump_model_keys():
+    """Semua kombinasi (brand, type) yang memiliki daftar model"""
+    for brand, types in load_reference("pumps")["models"].items():
+        for pump_type in types:
+            yield (brand, pump_type)
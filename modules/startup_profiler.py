@@ -0,0 +1,87 @@
+# modules/startup_profiler.py - Ukur waktu import per modul saat startup (python main.py --profile-startup)
+
+import builtins
+import sys
+import time
+
+PROFILE_FLAG = "--profile-startup"
+
+
+class StartupProfiler:
+    """
+    Membungkus builtins.__import__ dan mencatat waktu setiap modul yang baru
+    pertama kali di-load. `self` = waktu modul itu sendiri, `total` = termasuk
+    import turunannya (sama seperti `python -X importtime`, tapi bisa dipakai
+    dari executable hasil build).
+    """
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.records = {}
+        self.milestones = []
+        self._stack = []
+        self._original_import = None
+
+    def install(self):
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def uninstall(self):
+        if self._original_import is not None:
+            builtins.__import__ = self._original_import
+            self._original_import = None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        # Hanya import absolut yang belum pernah di-load yang diukur
+        if level != 0 or name in sys.modules:
+            return self._original_import(name, globals, locals, fromlist, level)
+
+        self._stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - started
+            child_time = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += total
+            if name not in self.records:
+                self.records[name] = (total - child_time, total)
+
+    def mark(self, label):
+        """Catat milestone (mis. 'login shown') relatif terhadap awal proses"""
+        self.milestones.append((label, time.perf_counter() - self.start_time))
+
+    def report(self, limit=30, stream=None):
+        """Print milestone dan modul dengan waktu import terbesar"""
+        stream = stream or sys.stdout
+        print("=== Startup profile ===", file=stream)
+        for label, elapsed in self.milestones:
+            print(f"{elapsed * 1000:9.1f} ms  {label}", file=stream)
+
+        print(f"\n{'self ms':>9} {'total ms':>9}  module", file=stream)
+        ranked = sorted(self.records.items(), key=lambda item: item[1][1], reverse=True)
+        for name, (self_time, total) in ranked[:limit]:
+            print(f"{self_time * 1000:9.1f} {total * 1000:9.1f}  {name}", file=stream)
+        print(f"({len(self.records)} modules imported)", file=stream)
+
+
+_profiler = None
+
+
+def start_if_requested(argv):
+    """Aktifkan profiler jika flag ada di argv (flag dihapus dari argv untuk Qt)"""
+    global _profiler
+    if PROFILE_FLAG not in argv:
+        return None
+    argv.remove(PROFILE_FLAG)
+    _profiler = StartupProfiler()
+    _profiler.install()
+    return _profiler
+
+
+def get_profiler():
+    """Profiler aktif, atau None jika startup tidak sedang diprofil"""
+    return _profiler
@@ -0,0 +1,156 @@
+# modules/user_repository.py - Data pengguna di memori (dict per username) dengan backend SQLite
+
+import os
+import sys
+import sqlite3
+import threading
+import time
+
+# Add parent directory to path so we can import from config
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import USERS_DB, USERS_SQLITE
+from modules.xlsx_records import read_xlsx_records
+
+USER_FIELDS = ['username', 'password', 'name', 'department', 'access_level', 'email']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    password TEXT NOT NULL,
+    name TEXT NOT NULL DEFAULT '',
+    department TEXT NOT NULL DEFAULT '',
+    access_level TEXT NOT NULL DEFAULT 'user',
+    email TEXT NOT NULL DEFAULT '',
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class UserRepository:
+    """
+    Semua user dimuat sekali ke dict {username: record}.
+
+    Perubahan dari proses lain (user lain di share yang sama, admin tool)
+    dideteksi dengan PRAGMA data_version - murah, tanpa membaca tabel - dan
+    baru saat itu dict dimuat ulang. Update ditulis sebagai satu UPDATE
+    dalam transaksi, bukan menulis ulang seluruh file.
+
+    users.xlsx lama di-import sekali saat database SQLite pertama kali dibuat.
+    """
+
+    def __init__(self, db_path=USERS_SQLITE, xlsx_path=USERS_DB):
+        self.db_path = db_path
+        self.xlsx_path = xlsx_path
+        self._lock = threading.RLock()
+        self._users = {}
+        self._data_version = None
+
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+        # Satu koneksi dipakai bersama (login berjalan di worker thread), dijaga lock
+        self._conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(SCHEMA)
+        self._reload()
+
+    def _reload(self):
+        rows = self._conn.execute(f"SELECT {', '.join(USER_FIELDS)} FROM users").fetchall()
+        self._users = {row['username']: dict(row) for row in rows}
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _refresh_if_changed(self):
+        """Muat ulang hanya jika koneksi lain mengubah database sejak pembacaan terakhir"""
+        if self._conn.execute("PRAGMA data_version").fetchone()[0] != self._data_version:
+            self._reload()
+
+    def is_empty(self):
+        with self._lock:
+            self._refresh_if_changed()
+            return not self._users
+
+    def get(self, username):
+        """Salinan record user, atau None"""
+        with self._lock:
+            self._refresh_if_changed()
+            user = self._users.get(username)
+            return dict(user) if user else None
+
+    def usernames(self):
+        with self._lock:
+            self._refresh_if_changed()
+            return list(self._users)
+
+    def add_many(self, users):
+        """Insert/replace beberapa user dalam satu transaksi"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for user in users:
+                    values = [str(user.get(field) or "") for field in USER_FIELDS]
+                    self._conn.execute(
+                        f"INSERT OR REPLACE INTO users ({', '.join(USER_FIELDS)}, updated_at) "
+                        f"VALUES ({', '.join('?' * len(USER_FIELDS))}, ?)",
+                        values + [now]
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._reload()
+
+    def update_password(self, username, hashed_password):
+        """Simpan hash password baru untuk satu user"""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = self._conn.execute(
+                    "UPDATE users SET password = ?, updated_at = ? WHERE username = ?",
+                    (hashed_password, time.time(), username)
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            if cursor.rowcount != 1:
+                return False
+            self._refresh_if_changed()
+            if username in self._users:
+                self._users[username]['password'] = hashed_password
+            return True
+
+    def import_xlsx(self, path=None):
+        """Import users.xlsx (format lama); return jumlah user"""
+        columns, records = read_xlsx_records(path or self.xlsx_path)
+        missing = [field for field in ('username', 'password') if field not in columns]
+        if missing:
+            raise ValueError(f"Column {', '.join(missing)} not found in {path or self.xlsx_path}")
+        users = [record for record in records if record.get('username')]
+        self.add_many(users)
+        return len(users)
+
+    def migrate_from_xlsx(self):
+        """Import users.xlsx sekali, saat database SQLite masih kosong"""
+        if not self.is_empty() or not self.xlsx_path or not os.path.exists(self.xlsx_path):
+            return 0
+        try:
+            imported = self.import_xlsx()
+            print(f"Migrated {imported} users from {self.xlsx_path}")
+            return imported
+        except Exception as e:
+            print(f"Error migrating users from {self.xlsx_path}: {str(e)}")
+            return 0
+
+
+_repository = None
+_repository_lock = threading.Lock()
+
+
+def get_user_repository():
+    """Shared user repository"""
+    global _repository
+    with _repository_lock:
+        if _repository is None:
+            _repository = UserRepository()
+            _repository.migrate_from_xlsx()
+        return _repository
@@ -0,0 +1,172 @@
+# modules/workbook_cache.py - Cache snapshot SET_BDU.xlsx dan prefetch spekulatif di background
+
+import os
+import threading
+from collections import OrderedDict
+
+from modules.workbook_reader import read_bdu_workbook
+from modules.xlsx_images import get_image_index
+
+
+def cache_key(excel_path):
+    """(path absolut, mtime) - snapshot otomatis basi jika file disimpan ulang"""
+    path = os.path.abspath(excel_path)
+    return path, os.path.getmtime(path)
+
+
+class PrefetchJob:
+    """Satu prefetch yang sedang berjalan; bisa dibatalkan atau ditunggu"""
+
+    def __init__(self, key):
+        self.key = key
+        self.done = threading.Event()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def is_cancelled(self):
+        return self._cancelled.is_set()
+
+
+class WorkbookCache:
+    """
+    Menyimpan hasil read_bdu_workbook per (path, mtime).
+
+    prefetch() dipanggil saat customer dipilih di CustomerSearchView sehingga
+    workbook sudah diparsing sebelum user menekan Continue. Prefetch lama
+    dibatalkan begitu pilihan customer berubah.
+    """
+
+    def __init__(self, max_entries=3):
+        self.max_entries = max_entries
+        self._snapshots = OrderedDict()
+        self._jobs = {}
+        self._active_prefetch = None
+        self._lock = threading.Lock()
+
+    def get(self, excel_path):
+        """Snapshot lengkap untuk versi file saat ini, atau None"""
+        try:
+            key = cache_key(excel_path)
+        except OSError:
+            return None
+
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            if snapshot is not None:
+                self._snapshots.move_to_end(key)
+            return snapshot
+
+    def put(self, snapshot):
+        """Simpan snapshot hasil read_bdu_workbook (hanya jika semua sheet terbaca)"""
+        if len(snapshot['sheets']) != len(snapshot['sheet_names']):
+            return
+
+        key = (os.path.abspath(snapshot['path']), snapshot['mtime'])
+        with self._lock:
+            self._snapshots[key] = snapshot
+            self._snapshots.move_to_end(key)
+            while len(self._snapshots) > self.max_entries:
+                self._snapshots.popitem(last=False)
+
+    def invalidate(self, excel_path=None):
+        with self._lock:
+            if excel_path is None:
+                self._snapshots.clear()
+                return
+            path = os.path.abspath(excel_path)
+            for key in [key for key in self._snapshots if key[0] == path]:
+                del self._snapshots[key]
+
+    def prefetch(self, excel_path):
+        """Mulai parsing workbook di background thread; prefetch file lain dibatalkan"""
+        try:
+            key = cache_key(excel_path)
+        except OSError:
+            self.cancel_prefetch()
+            return None
+
+        with self._lock:
+            active = self._active_prefetch
+            # Customer yang sama dipilih lagi - prefetch yang berjalan tetap dipakai
+            if active is not None and active.key == key and not active.is_cancelled():
+                return active
+        self.cancel_prefetch()
+
+        with self._lock:
+            if key in self._snapshots:
+                return None
+            job = self._jobs.get(key)
+            # Job yang sudah dibatalkan tidak akan mengisi cache - mulai job baru
+            if job is None or job.is_cancelled():
+                job = PrefetchJob(key)
+                self._jobs[key] = job
+                threading.Thread(target=self._run_prefetch, args=(job,), daemon=True).start()
+            self._active_prefetch = job
+        return job
+
+    def cancel_prefetch(self):
+        with self._lock:
+            job = self._active_prefetch
+            self._active_prefetch = None
+        if job is not None:
+            job.cancel()
+
+    def _run_prefetch(self, job):
+        path = job.key[0]
+        try:
+            snapshot = read_bdu_workbook(path, should_cancel=job.is_cancelled)
+            if not job.is_cancelled():
+                self.put(snapshot)
+                # Index gambar (zip) ikut disiapkan untuk tab DATA_
+                get_image_index(path)
+        except Exception as e:
+            print(f"Error prefetching workbook {path}: {str(e)}")
+        finally:
+            with self._lock:
+                if self._jobs.get(job.key) is job:
+                    del self._jobs[job.key]
+                if self._active_prefetch is job:
+                    self._active_prefetch = None
+            job.done.set()
+
+    def get_or_wait(self, excel_path, should_cancel=None, poll_interval=0.05):
+        """
+        Snapshot dari cache; jika file yang sama sedang di-prefetch, tunggu hasilnya
+        daripada memparsing ulang. Return None jika harus dibaca sendiri.
+        """
+        try:
+            key = cache_key(excel_path)
+        except OSError:
+            return None
+
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.is_cancelled():
+                # Prefetch yang dibatalkan tidak mengisi cache - tidak perlu ditunggu
+                job = None
+            if job is not None:
+                # Loader sekarang memakai prefetch ini - jangan dibatalkan oleh pilihan baru
+                if self._active_prefetch is job:
+                    self._active_prefetch = None
+
+        if job is not None:
+            while not job.done.wait(poll_interval):
+                if should_cancel and should_cancel():
+                    return None
+
+        return self.get(excel_path)
+
+
+_workbook_cache = None
+_workbook_cache_lock = threading.Lock()
+
+
+def get_workbook_cache():
+    """Shared cache (dipakai CustomerSearchView untuk prefetch dan BDU view untuk load)"""
+    global _workbook_cache
+    with _workbook_cache_lock:
+        if _workbook_cache is None:
+            _workbook_cache = WorkbookCache()
+        return _workbook_cache
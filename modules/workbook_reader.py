@@ -0,0 +1,183 @@
+# modules/workbook_reader.py - Parsing SET_BDU.xlsx ke struktur data biasa (tanpa Qt)
+
+import os
+import pandas as pd
+
+# Hanya sheet dengan prefix ini yang ditampilkan di BDU view
+BDU_SHEET_PREFIXES = ("DATA_", "DIP_")
+
+
+def is_bdu_sheet(sheet_name):
+    """Check apakah sheet ditampilkan sebagai tab di BDU view"""
+    return sheet_name.startswith(BDU_SHEET_PREFIXES)
+
+
+def read_user_codes(excel_path, reader=None):
+    """Read the list of user codes from the 'User Code' sheet"""
+    source = reader if reader is not None else excel_path
+
+    # Kolom Code dibaca sebagai string agar leading zeros tidak hilang
+    df = pd.read_excel(source, sheet_name='User Code', dtype={'Code': str})
+
+    if 'Code' not in df.columns:
+        print("'Code' column not found in 'User Code' sheet")
+        print(f"Available columns: {df.columns.tolist()}")
+        return []
+
+    user_codes = []
+    for code in df['Code'].dropna().tolist():
+        code_str = str(code).strip()
+        if code_str and code_str.lower() != 'nan':
+            user_codes.append(code_str)
+
+    return user_codes
+
+
+def _validation_list_options(workbook, sheet, formula):
+    """Pilihan dropdown dari formula1 data validation bertipe list"""
+    if formula.startswith('"') and formula.endswith('"'):
+        # Direct list: "option1,option2,option3"
+        return [val.strip() for val in formula[1:-1].split(',')]
+
+    if not formula.startswith('='):
+        # Simple list without quotes
+        return [val.strip() for val in formula.split(',')]
+
+    # Reference to another range, e.g. =Sheet1!A1:A10
+    ref_range = formula[1:]
+    ref_sheet = sheet
+    if '!' in ref_range:
+        ref_sheet_name, ref_range = ref_range.split('!', 1)
+        ref_sheet = workbook[ref_sheet_name]
+
+    ref_cells = ref_sheet[ref_range]
+    if not isinstance(ref_cells, tuple):
+        ref_cells = ((ref_cells,),)
+    options = []
+    for cell_row in ref_cells:
+        if not isinstance(cell_row, tuple):
+            cell_row = (cell_row,)
+        for cell in cell_row:
+            if cell.value is not None:
+                options.append(str(cell.value).strip())
+    return options
+
+
+def read_validation_index(excel_path):
+    """
+    Pilihan dropdown (data validation list) untuk semua sheet BDU:
+    {sheet_name: {cell_address: [options]}}.
+
+    Workbook dibuka sekali dengan openpyxl; range validasi dibatasi ke area
+    sheet yang terpakai. Jika beberapa validasi mencakup sel yang sama,
+    validasi pertama yang dipakai.
+    """
+    from openpyxl import load_workbook
+    from openpyxl.utils import get_column_letter
+
+    index = {}
+    # data_only=False agar validasi bisa diakses (tidak tersedia di mode read_only)
+    workbook = load_workbook(excel_path, data_only=False)
+    try:
+        for sheet_name in workbook.sheetnames:
+            if not is_bdu_sheet(sheet_name):
+                continue
+
+            sheet = workbook[sheet_name]
+            cells = {}
+            index[sheet_name] = cells
+            if not sheet.data_validations:
+                continue
+
+            for validation in sheet.data_validations.dataValidation:
+                if validation.type != "list" or not validation.formula1:
+                    continue
+                try:
+                    options = _validation_list_options(workbook, sheet, validation.formula1)
+                except Exception as e:
+                    print(f"Error processing validation formula {validation.formula1}: {str(e)}")
+                    continue
+
+                for coord_range in validation.sqref.ranges:
+                    max_row = min(coord_range.max_row, sheet.max_row)
+                    max_col = min(coord_range.max_col, sheet.max_column)
+                    for col in range(coord_range.min_col, max_col + 1):
+                        col_letter = get_column_letter(col)
+                        for row in range(coord_range.min_row, max_row + 1):
+                            cells.setdefault(f"{col_letter}{row}", options)
+    finally:
+        workbook.close()
+
+    return index
+
+
+def read_bdu_workbook(excel_path, on_progress=None, on_sheet_list=None, on_sheet=None, should_cancel=None,
+                      on_validations=None):
+    """
+    Parse SET_BDU.xlsx menjadi dict berisi data biasa:
+    {'path', 'mtime', 'user_codes', 'validations', 'sheet_names', 'sheets': {sheet_name: DataFrame}}
+    Sheet yang gagal dibaca disimpan sebagai Exception-nya, bukan DataFrame.
+    'validations' adalah hasil read_validation_index, dibaca sebelum sheet pertama.
+
+    Callback dipanggil dari thread pemanggil sehingga konsumen (GUI) bisa
+    membangun widget secara bertahap sebelum seluruh workbook selesai dibaca.
+    """
+    if not os.path.exists(excel_path):
+        raise FileNotFoundError("File SET_BDU.xlsx not found in the data directory.")
+
+    def report(value, message):
+        if on_progress:
+            on_progress(value, message)
+
+    snapshot = {
+        'path': excel_path,
+        'mtime': os.path.getmtime(excel_path),
+        'user_codes': [],
+        'validations': {},
+        'sheet_names': [],
+        'sheets': {},
+    }
+
+    report(10, "Reading Excel file structure...")
+    reader = pd.ExcelFile(excel_path)
+
+    try:
+        report(15, "Loading user codes...")
+        try:
+            snapshot['user_codes'] = read_user_codes(excel_path, reader)
+        except Exception as e:
+            print(f"Error loading user codes from Excel: {str(e)}")
+
+        report(17, "Reading dropdown validations...")
+        try:
+            snapshot['validations'] = read_validation_index(excel_path)
+        except Exception as e:
+            print(f"Error reading data validations from Excel: {str(e)}")
+        if on_validations:
+            on_validations(snapshot['validations'])
+
+        snapshot['sheet_names'] = [name for name in reader.sheet_names if is_bdu_sheet(name)]
+        if on_sheet_list:
+            on_sheet_list(list(snapshot['sheet_names']))
+
+        total = len(snapshot['sheet_names'])
+        for i, sheet_name in enumerate(snapshot['sheet_names']):
+            if should_cancel and should_cancel():
+                break
+
+            report(20 + int(75 * i / max(total, 1)), f"Reading sheet: {sheet_name}")
+
+            try:
+                df = reader.parse(sheet_name, header=None)
+            except Exception as e:
+                print(f"Error reading sheet {sheet_name}: {str(e)}")
+                df = e
+
+            snapshot['sheets'][sheet_name] = df
+            if on_sheet:
+                on_sheet(sheet_name, df)
+    finally:
+        reader.close()
+
+    report(100, "Excel data loaded successfully!")
+    return snapshot
@@ -0,0 +1,387 @@
+# modules/workspace_template.py - Template SET_BDU terkompilasi untuk membuat workspace customer dengan cepat
+
+import os
+import re
+import sys
+import json
+import tempfile
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import TEMPLATE_CACHE_DIR
+from modules.page_renderer import file_content_hash
+from modules.xlsx_images import NS_MAIN, workbook_sheet_parts
+
+# Dinaikkan jika logika kompilasi berubah - cache JSON lama otomatis diabaikan
+COMPILER_VERSION = 1
+
+CUSTOMER_SHEET = 'DIP_Customer Information'
+
+# Sel di DIP_Customer Information -> kolom database customer
+CUSTOMER_FIELD_CELLS = {
+    'B4': 'Company Name',
+    'B8': 'Country',
+    'B9': 'Province',
+    'B10': 'City',
+    'B11': 'Site Address',
+    'B12': 'Correspondence Address (HO)',
+    'B13': 'Postal Code (HO)',
+    'B16': 'Name',
+    'C16': 'Phone No./Email',
+}
+
+# Sheet yang dicari label customer/client/company di kolom A-B baris 1-29
+LABEL_SHEETS = ['DATA_GENERAL', 'DATA_CUSTOMER', 'DIP_General Information']
+LABEL_KEYWORDS = ['customer', 'client', 'company']
+
+_CELL_REF = re.compile(r"([A-Z]+)(\d+)")
+
+
+def split_ref(ref):
+    """'B16' -> (2, 16)"""
+    letters, row = _CELL_REF.fullmatch(ref).groups()
+    column = 0
+    for letter in letters:
+        column = column * 26 + ord(letter) - 64
+    return column, int(row)
+
+
+def column_letter(column):
+    letters = ""
+    while column:
+        column, remainder = divmod(column - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def has_label_keyword(value):
+    return isinstance(value, str) and any(keyword in value.lower() for keyword in LABEL_KEYWORDS)
+
+
+class CompiledTemplate:
+    """
+    Hasil kompilasi satu versi template: daftar sel target per sheet XML.
+
+    Dibuat sekali per hash isi template (disimpan sebagai JSON di cache), lalu
+    dipakai berulang kali oleh instantiate() tanpa membuka workbook.
+    """
+
+    def __init__(self, template_hash, targets, fast_path=True, reason=""):
+        self.template_hash = template_hash
+        self.targets = targets
+        self.fast_path = fast_path
+        self.reason = reason
+
+    def to_dict(self):
+        return {
+            "compiler_version": COMPILER_VERSION,
+            "template_hash": self.template_hash,
+            "fast_path": self.fast_path,
+            "reason": self.reason,
+            "targets": self.targets,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["template_hash"], data["targets"], data["fast_path"], data.get("reason", ""))
+
+    def cell_values(self, values):
+        """{part: {ref: value}} untuk customer ini (field kosong dilewati, seperti sebelumnya)"""
+        company_name = str(values.get('Company Name') or "")
+        patches = {}
+        for target in self.targets:
+            value = values.get(target["field"])
+            if value is None or value == "":
+                continue
+            # Sel yang hanya terisi jika nama customer sendiri memuat kata kunci label
+            if target.get("requires_keyword") and not has_label_keyword(company_name):
+                continue
+            patches.setdefault(target["part"], {})[target["cell"]] = str(value)
+        return patches
+
+
+def _read_shared_strings(archive):
+    try:
+        root = ET.fromstring(archive.read("xl/sharedStrings.xml"))
+    except KeyError:
+        return []
+    return ["".join(t.text or "" for t in si.iter(f"{{{NS_MAIN}}}t")) for si in root.iter(f"{{{NS_MAIN}}}si")]
+
+
+def _read_sheet_cells(archive, part, shared_strings):
+    """{ref: (nilai seperti openpyxl - string/'=formula'/None, info formula)} dan (max_row, max_column)"""
+    root = ET.fromstring(archive.read(part))
+    cells = {}
+    max_row = max_column = 0
+    for c in root.iter(f"{{{NS_MAIN}}}c"):
+        ref = c.get("r")
+        if not ref:
+            continue
+        column, row = split_ref(ref)
+        max_row = max(max_row, row)
+        max_column = max(max_column, column)
+
+        formula = c.find(f"{{{NS_MAIN}}}f")
+        value = None
+        if formula is not None:
+            value = "=" + (formula.text or "")
+        elif c.get("t") == "s":
+            v = c.find(f"{{{NS_MAIN}}}v")
+            if v is not None and v.text is not None:
+                value = shared_strings[int(v.text)]
+        elif c.get("t") == "inlineStr":
+            value = "".join(t.text or "" for t in c.iter(f"{{{NS_MAIN}}}t"))
+        elif c.get("t") == "str":
+            v = c.find(f"{{{NS_MAIN}}}v")
+            value = v.text if v is not None else None
+
+        formula_info = None
+        if formula is not None:
+            formula_info = {"type": formula.get("t", "normal"), "ref": formula.get("ref")}
+        cells[ref] = (value, formula_info)
+    return cells, (max_row, max_column)
+
+
+def compile_template(template_path):
+    """Cari semua sel yang diisi saat membuat workspace customer (logika sama dengan versi openpyxl)"""
+    template_hash = file_content_hash(template_path)
+    targets = []
+    unsafe = []
+
+    with zipfile.ZipFile(template_path) as archive:
+        parts = workbook_sheet_parts(archive)
+        shared_strings = _read_shared_strings(archive)
+
+        def add_target(sheet_name, part, cells, ref, field, requires_keyword=False):
+            formula_info = cells.get(ref, (None, None))[1]
+            if formula_info and (formula_info["type"] in ("shared", "array") and formula_info["ref"]):
+                # Sel master shared/array formula - menimpanya butuh terjemahan formula openpyxl
+                unsafe.append(f"{sheet_name}!{ref}")
+            targets.append({
+                "sheet": sheet_name,
+                "part": part,
+                "cell": ref,
+                "field": field,
+                "requires_keyword": requires_keyword,
+                "had_formula": formula_info is not None,
+            })
+
+        if CUSTOMER_SHEET in parts:
+            part = parts[CUSTOMER_SHEET]
+            cells, _ = _read_sheet_cells(archive, part, shared_strings)
+            for ref, field in CUSTOMER_FIELD_CELLS.items():
+                add_target(CUSTOMER_SHEET, part, cells, ref, field)
+
+        for sheet_name in LABEL_SHEETS:
+            if sheet_name not in parts:
+                continue
+            part = parts[sheet_name]
+            cells, (max_row, max_column) = _read_sheet_cells(archive, part, shared_strings)
+
+            for row in range(1, min(30, max_row + 1)):
+                written_column = None
+                for column in range(1, min(3, max_column + 1)):
+                    ref = f"{column_letter(column)}{row}"
+                    if column == written_column:
+                        # Sel ini baru saja diisi nama customer di langkah sebelumnya
+                        next_column = column + 1
+                        if next_column <= max_column:
+                            add_target(sheet_name, part, cells, f"{column_letter(next_column)}{row}",
+                                       'Company Name', requires_keyword=True)
+                        continue
+
+                    if has_label_keyword(cells.get(ref, (None, None))[0]):
+                        next_column = column + 1
+                        if next_column <= max_column:
+                            add_target(sheet_name, part, cells, f"{column_letter(next_column)}{row}", 'Company Name')
+                            written_column = next_column
+
+    reason = f"shared/array formula master at {', '.join(unsafe)}" if unsafe else ""
+    return CompiledTemplate(template_hash, targets, fast_path=not unsafe, reason=reason)
+
+
+_compiled = {}
+_compiled_lock = threading.Lock()
+
+
+def get_compiled_template(template_path, cache_dir=TEMPLATE_CACHE_DIR):
+    """Template terkompilasi, dari memori / cache JSON per hash, dikompilasi ulang jika template berubah"""
+    stat = os.stat(template_path)
+    memory_key = (os.path.abspath(template_path), stat.st_mtime, stat.st_size)
+    with _compiled_lock:
+        compiled = _compiled.get(memory_key)
+        if compiled is not None:
+            return compiled
+
+        template_hash = file_content_hash(template_path)
+        cache_path = os.path.join(cache_dir, f"{template_hash}.json")
+        compiled = None
+        try:
+            with open(cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("compiler_version") == COMPILER_VERSION:
+                compiled = CompiledTemplate.from_dict(data)
+        except (OSError, ValueError, KeyError):
+            pass
+
+        if compiled is None:
+            compiled = compile_template(template_path)
+            try:
+                os.makedirs(cache_dir, exist_ok=True)
+                with open(cache_path, "w", encoding="utf-8") as f:
+                    json.dump(compiled.to_dict(), f, indent=2)
+            except OSError as e:
+                print(f"Error writing template cache: {str(e)}")
+
+        _compiled[memory_key] = compiled
+        return compiled
+
+
+def _cell_xml(ref, value, style):
+    style_attr = f' s="{style}"' if style else ""
+    return f'<c r="{ref}"{style_attr} t="inlineStr"><is><t xml:space="preserve">{escape(value)}</t></is></c>'
+
+
+def patch_sheet_xml(xml, cell_values):
+    """
+    Ganti/sisipkan sel string di XML sheet.
+
+    XML di-splice sebagai teks (bukan di-serialize ulang lewat ElementTree)
+    supaya deklarasi namespace seperti mc:Ignorable="x14ac xr xr2 xr3" tetap
+    utuh - Excel menolak file jika prefix tersebut hilang.
+    """
+    for ref, value in cell_values.items():
+        column, row = split_ref(ref)
+        cell_pattern = re.compile(rf'<c r="{ref}"(?=[\s/>])[^>]*?(?:/>|>.*?</c>)', re.S)
+        match = cell_pattern.search(xml)
+        if match:
+            style = re.search(r'\ss="(\d+)"', match.group(0)[:match.group(0).find(">") + 1])
+            xml = xml[:match.start()] + _cell_xml(ref, value, style.group(1) if style else None) + xml[match.end():]
+            continue
+
+        new_cell = _cell_xml(ref, value, None)
+        row_match = re.search(rf'<row r="{row}"(?=[\s/>])[^>]*?(/?)>', xml)
+        if row_match:
+            if row_match.group(1):
+                # <row .../> -> <row ...>cell</row>
+                opening = row_match.group(0)[:-2] + ">"
+                xml = xml[:row_match.start()] + opening + new_cell + "</row>" + xml[row_match.end():]
+                continue
+            row_end = xml.index("</row>", row_match.end())
+            insert_at = row_end
+            for cell in re.finditer(r'<c r="([A-Z]+)\d+"', xml[row_match.end():row_end]):
+                if split_ref(cell.group(1) + str(row))[0] > column:
+                    insert_at = row_match.end() + cell.start()
+                    break
+            xml = xml[:insert_at] + new_cell + xml[insert_at:]
+            continue
+
+        # Baris belum ada - sisipkan sesuai urutan nomor baris
+        new_row = f'<row r="{row}">{new_cell}</row>'
+        if "<sheetData/>" in xml:
+            xml = xml.replace("<sheetData/>", f"<sheetData>{new_row}</sheetData>", 1)
+            continue
+        insert_at = xml.index("</sheetData>")
+        for existing in re.finditer(r'<row r="(\d+)"', xml):
+            if int(existing.group(1)) > row:
+                insert_at = existing.start()
+                break
+        xml = xml[:insert_at] + new_row + xml[insert_at:]
+    return xml
+
+
+def _drop_calc_chain(part, data):
+    """Hapus referensi calcChain.xml (Excel membangunnya ulang) setelah sel formula ditimpa"""
+    text = data.decode("utf-8")
+    if part == "[Content_Types].xml":
+        text = re.sub(r'<Override [^>]*PartName="/xl/calcChain\.xml"[^>]*/>', "", text)
+    elif part == "xl/_rels/workbook.xml.rels":
+        text = re.sub(r'<Relationship [^>]*Target="[^"]*calcChain\.xml"[^>]*/>', "", text)
+    return text.encode("utf-8")
+
+
+def _force_recalculation(data):
+    """Set fullCalcOnLoad supaya formula yang bergantung pada sel customer dihitung ulang saat dibuka"""
+    text = data.decode("utf-8")
+    match = re.search(r"<calcPr\b[^>]*?/?>", text)
+    if match is None:
+        text = text.replace("</workbook>", '<calcPr fullCalcOnLoad="1"/></workbook>', 1)
+    elif "fullCalcOnLoad" not in match.group(0):
+        tag = match.group(0)
+        closing = "/>" if tag.endswith("/>") else ">"
+        patched = tag[:-len(closing)].rstrip() + ' fullCalcOnLoad="1"' + closing
+        text = text[:match.start()] + patched + text[match.end():]
+    return text.encode("utf-8")
+
+
+def instantiate(compiled, template_path, output_path, values):
+    """Tulis workspace baru: template disalin per entry zip, hanya sheet target yang di-patch"""
+    patches = compiled.cell_values(values)
+    patched_refs = {(target["part"], target["cell"]) for target in compiled.targets if target["had_formula"]}
+    drop_calc_chain = any((part, ref) in patched_refs for part, cells in patches.items() for ref in cells)
+
+    folder = os.path.dirname(os.path.abspath(output_path))
+    os.makedirs(folder, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(suffix=".xlsx", dir=folder)
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(template_path) as source, zipfile.ZipFile(temp_path, "w") as target:
+            for info in source.infolist():
+                if drop_calc_chain and info.filename == "xl/calcChain.xml":
+                    continue
+                data = source.read(info)
+                if info.filename in patches:
+                    data = patch_sheet_xml(data.decode("utf-8"), patches[info.filename]).encode("utf-8")
+                elif info.filename == "xl/workbook.xml":
+                    data = _force_recalculation(data)
+                elif drop_calc_chain and info.filename in ("[Content_Types].xml", "xl/_rels/workbook.xml.rels"):
+                    data = _drop_calc_chain(info.filename, data)
+                target.writestr(info, data, compress_type=info.compress_type)
+        os.replace(temp_path, output_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return output_path
+
+
+def stamp_with_openpyxl(compiled, template_path, output_path, values):
+    """Jalur lambat: load template dengan openpyxl dan isi sel target yang sama"""
+    from openpyxl import load_workbook
+
+    parts = {target["part"]: target["sheet"] for target in compiled.targets}
+    workbook = load_workbook(template_path)
+    for part, cells in compiled.cell_values(values).items():
+        sheet = workbook[parts[part]]
+        for ref, value in cells.items():
+            sheet[ref] = value
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    workbook.save(output_path)
+    return output_path
+
+
+def create_workspace(template_path, output_path, values):
+    """Buat SET_BDU customer: stamp XML jika aman, openpyxl jika tidak (dipakai onboarding massal)"""
+    compiled = get_compiled_template(template_path)
+    if compiled.fast_path:
+        return instantiate(compiled, template_path, output_path, values)
+    return stamp_with_openpyxl(compiled, template_path, output_path, values)
+
+
+def instantiate_workspace(template_path, output_path, values):
+    """
+    Buat SET_BDU customer dari template terkompilasi.
+
+    Return False jika template tidak bisa di-stamp langsung (mis. sel target
+    adalah master shared formula) - pemanggil memakai jalur openpyxl.
+    """
+    compiled = get_compiled_template(template_path)
+    if not compiled.fast_path:
+        print(f"Template fast path disabled: {compiled.reason}")
+        return False
+    instantiate(compiled, template_path, output_path, values)
+    return True
+
@@ -0,0 +1,134 @@
+# modules/xlsx_images.py - Ambil gambar per sheet langsung dari zip .xlsx tanpa load workbook
+
+import hashlib
+import os
+import posixpath
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+NS_DRAWING_MAIN = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+REL_DRAWING = NS_REL + "/drawing"
+REL_IMAGE = NS_REL + "/image"
+
+
+def _rels_path(part_path):
+    """xl/worksheets/sheet1.xml -> xl/worksheets/_rels/sheet1.xml.rels"""
+    folder, name = posixpath.split(part_path)
+    return posixpath.join(folder, "_rels", name + ".rels")
+
+
+def _resolve_target(part_path, target):
+    """Target relationship relatif terhadap folder part, atau absolut dari root zip"""
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join(posixpath.dirname(part_path), target))
+
+
+def _read_relationships(archive, part_path):
+    """{rId: (type, target path di zip)} untuk satu part; kosong jika tidak ada rels"""
+    try:
+        root = ET.fromstring(archive.read(_rels_path(part_path)))
+    except KeyError:
+        return {}
+
+    relationships = {}
+    for rel in root.iter(f"{{{NS_PKG_REL}}}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        relationships[rel.get("Id")] = (rel.get("Type"), _resolve_target(part_path, rel.get("Target")))
+    return relationships
+
+
+def workbook_sheet_parts(archive):
+    """{nama sheet: path XML sheet di zip} dari workbook.xml + rels-nya"""
+    workbook_part = "xl/workbook.xml"
+    workbook_rels = _read_relationships(archive, workbook_part)
+    workbook = ET.fromstring(archive.read(workbook_part))
+
+    parts = {}
+    for sheet in workbook.iter(f"{{{NS_MAIN}}}sheet"):
+        rel = workbook_rels.get(sheet.get(f"{{{NS_REL}}}id"))
+        if rel is not None:
+            parts[sheet.get("name")] = rel[1]
+    return parts
+
+
+class XlsxImageIndex:
+    """
+    Peta sheet -> daftar file media (xl/media/*) untuk satu workbook.
+
+    Dibangun dari workbook.xml -> sheet rels -> drawing rels, sehingga hanya
+    beberapa file XML kecil yang dibaca; isi sheet tidak pernah diparsing.
+    """
+
+    def __init__(self, excel_path):
+        self.excel_path = excel_path
+        self.mtime = os.path.getmtime(excel_path)
+        self._sheet_media = {}
+
+        with zipfile.ZipFile(excel_path) as archive:
+            for sheet_name, sheet_part in workbook_sheet_parts(archive).items():
+                self._sheet_media[sheet_name] = self._media_for_sheet(archive, sheet_part)
+
+    def _media_for_sheet(self, archive, sheet_part):
+        media = []
+        for rel_type, drawing_part in _read_relationships(archive, sheet_part).values():
+            if rel_type != REL_DRAWING:
+                continue
+
+            drawing_rels = _read_relationships(archive, drawing_part)
+            try:
+                drawing = ET.fromstring(archive.read(drawing_part))
+            except KeyError:
+                continue
+
+            # Urutan sesuai kemunculan di drawing (sama dengan urutan sheet._images openpyxl)
+            for blip in drawing.iter(f"{{{NS_DRAWING_MAIN}}}blip"):
+                rel = drawing_rels.get(blip.get(f"{{{NS_REL}}}embed"))
+                if rel and rel[0] == REL_IMAGE and rel[1] not in media:
+                    media.append(rel[1])
+        return media
+
+    def sheet_names(self):
+        return list(self._sheet_media)
+
+    def media_for_sheet(self, sheet_name):
+        """Path media di dalam zip untuk satu sheet (kosong jika sheet tidak punya gambar)"""
+        return list(self._sheet_media.get(sheet_name, []))
+
+    def read_media(self, media_paths):
+        """Baca beberapa file media sekaligus (satu kali buka zip); return [(sha1, bytes)]"""
+        results = []
+        with zipfile.ZipFile(self.excel_path) as archive:
+            for media_path in media_paths:
+                data = archive.read(media_path)
+                results.append((hashlib.sha1(data).hexdigest(), data))
+        return results
+
+
+_index_cache = {}
+_index_lock = threading.Lock()
+
+
+def get_image_index(excel_path):
+    """Index gambar untuk workbook, dibangun ulang hanya jika file berubah (mtime)"""
+    with _index_lock:
+        index = _index_cache.get(excel_path)
+        if index is None or index.mtime != os.path.getmtime(excel_path):
+            index = XlsxImageIndex(excel_path)
+            _index_cache[excel_path] = index
+        return index
+
+
+def read_sheet_images(excel_path, sheet_name):
+    """[(sha1, bytes)] untuk semua gambar di sheet, langsung dari zip"""
+    index = get_image_index(excel_path)
+    media_paths = index.media_for_sheet(sheet_name)
+    if not media_paths:
+        return []
+    return index.read_media(media_paths)
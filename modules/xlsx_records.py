@@ -0,0 +1,20 @@
+# modules/xlsx_records.py - Baca sheet xlsx sebagai list dict (header di baris pertama), tanpa pandas
+
+
+def read_xlsx_records(path):
+    """(kolom, list dict per baris) dari sheet pertama file xlsx; baris pertama adalah header"""
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb.worksheets[0].iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        columns = [str(column) for column in header if column is not None]
+        records = []
+        for values in rows:
+            record = {column: value for column, value in zip(columns, values)}
+            if any(value is not None for value in record.values()):
+                records.append(record)
+        return columns, records
+    finally:
+        wb.close()
@@ -4,15 +4,20 @@ import io
 import pandas as pd
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QLabel, QPushButton, QFrame, QGridLayout, QSpacerItem,
+                             QLabel, QPushButton, QGridLayout, QSpacerItem,
                              QSizePolicy, QScrollArea, QApplication, QMenu, QAction,
-                             QTabWidget, QLineEdit, QComboBox, QTableWidget, QTableWidgetItem,
-                             QHeaderView, QMessageBox, QFileDialog, QDateEdit, QCheckBox)
+                             QTabWidget, QLineEdit, QComboBox,
+                             QTableView, QHeaderView, QMessageBox, QFileDialog, QDateEdit, QCheckBox, QDialog)
 from PyQt5.QtGui import QPixmap, QIcon, QFont, QColor, QPalette, QCursor, QImage
 from PyQt5.QtCore import Qt, QSize, pyqtSignal, QPoint, QDate, QThread
-from views.loading_screen import LoadingScreen, QuickLoadingDialog, show_loading_dialog
-import tempfile
-import shutil
+from views.loading_screen import QuickLoadingDialog, show_loading_dialog
+from views.data_table_model import DataFrameTableModel
+from views.workbook_loader import WorkbookLoader
+from views.cascade_dropdowns import CascadeEngine, CascadeRule, is_placeholder
+from views.proposal_preview import ProposalPreviewWidget
+from views.image_thumbnails import get_thumbnail
+from views.job_manager import get_job_manager, PRIORITY_NORMAL, PRIORITY_HIGH
+from views.jobs_panel import JobsPanel
 import subprocess
 
 # Import local modules
@@ -25,398 +30,76 @@ try:
 except ImportError:
     HAS_FORMULA_HELPER = False
     print("Formula helper not available")
+
+from modules.workbook_reader import read_user_codes
+from modules.xlsx_images import read_sheet_images
+from modules.cancellation import FileTransaction, OperationCancelled, current_token
+from modules import reference_data
     
-INDUSTRY_SUBTYPE_MAPPING = {
-    "Business A - Palm Oil": [
-        "Palm Oil - CPO", 
-        "Palm Oil - CPKO", 
-        "Palm Oil - EFB", 
-        "Palm Oil - Plantation"
-    ],
-    "Business B - Mining, Oil & Gas, NFI A": [
-        "Mining - Coal", 
-        "Mining - Gold", 
-        "Mining - Nickel", 
-        "Mining - Tin", 
-        "Mining - Bauxite", 
-        "O&G - Upstream", 
-        "O&G - Midstream", 
-        "O&G - Downstream", 
-        "Non Food - Textile", 
-        "Non Food - Manufacturing / Heavy", 
-        "Non Food - Tech & Telecom", 
-        "Non Food - Transport & Log"
-    ],
-    "Business C - Food Beverage & Dairy, Agroindustry": [
-        "F&B - Processed Food", 
-        "F&B - Beverages", 
-        "F&B - Dairy Product", 
-        "F&B - Confectionery", 
-        "F&B - Meat Processing", 
-        "F&B - Seasoning", 
-        "Agroindustry - Fishery & Aquaculture", 
-        "Agroindustry - Food Crops", 
-        "Agroindustry - Tobacco", 
-        "Agroindustry - Sugar", 
-        "Agroindustry - Livestock & Poultry"
-    ],
-    "Business D - OM, BOO, BOT": [],
-    "Business E - NFI B": [
-        "Non Food - Tourism & Hospitality", 
-        "Non Food - Residential", 
-        "Non Food - Construction & Real Estate", 
-        "Non Food - PDAM/SPAM"
-    ]
-}
+# Tabel referensi (wilayah, industri, pompa, baku mutu) ada di data/reference/*.json
+# dan baru dibaca saat pertama kali dibutuhkan - lihat modules/reference_data.py
 
-SEISMIC_ZONE_DESCRIPTIONS = {
-    "ZONE-1": "2.5 or less. Usually not felt, but can be recorded by seismographs",
-    "ZONE-2": "2.5 - 5.4. Often felt, but causes only minor damage",
-    "ZONE-3": "5.5 - 6.0. Can cause slight damage to buildings and other structures",
-    "ZONE-4": "6.6 - 6.9. Can cause significant damage in populated areas",
-    "Zone-5": "7.0 - 7.9. Major earthquake with serious damage.",
-    "Zone-6": "8.0 or larger. Great earthquake. Can destroy communities near the epicenter."
-}
+def get_cascade_field_name(field_name):
+    """Nama kanonik field fd_ yang ikut dalam dropdown bertingkat, selain itu None"""
+    if field_name in ("Industry Classification", "Sub Industry Specification",
+                      "1Province", "1City", "2Province", "2City"):
+        return field_name
+    if "Pump Brand" in field_name:
+        return "Pump Brand"
+    if "Pump Type" in field_name:
+        return "Pump Type"
+    if "Pump Model" in field_name:
+        return "Pump Model"
+    return None
 
-WIND_SPEED_DESCRIPTIONS = {
-    "LEVEL-1": "0 - 2,0 m/s",
-    "LEVEL-2": "2,0 - 4,0 m/s",
-    "LEVEL-3": "4,0 - 6,0 m/s",
-    "LEVEL-4": "6,0 - 8,0 m/s",
-    "LEVEL-5": "8,0 - 10,0 m/s",
-    "LEVEL-6": "10,0 m/s"
-}
+def _pump_brand_without_types(brand, *_):
+    return not is_placeholder(brand) and brand not in reference_data.get_pump_types()
 
-# Daftar provinsi di Indonesia
-INDONESIA_PROVINCES = [
-    "Aceh", "Sumatera Utara", "Sumatera Barat", "Riau", "Jambi", "Sumatera Selatan", 
-    "Bengkulu", "Lampung", "Kepulauan Bangka Belitung", "Kepulauan Riau", 
-    "DKI Jakarta", "Jawa Barat", "Jawa Tengah", "DI Yogyakarta", "Jawa Timur", "Banten", 
-    "Bali", "Nusa Tenggara Barat", "Nusa Tenggara Timur", 
-    "Kalimantan Barat", "Kalimantan Tengah", "Kalimantan Selatan", "Kalimantan Timur", "Kalimantan Utara", 
-    "Sulawesi Utara", "Sulawesi Tengah", "Sulawesi Selatan", "Sulawesi Tenggara", "Gorontalo", "Sulawesi Barat", 
-    "Maluku", "Maluku Utara", "Papua", "Papua Barat"
-]
-
-# Kota-kota dan kabupaten di Indonesia berdasarkan provinsi
-INDONESIA_CITIES = {
-    "Aceh": [
-        "Kota Banda Aceh", "Kota Langsa", "Kota Lhokseumawe", "Kota Sabang", "Kota Subulussalam",
-        "Kabupaten Aceh Barat", "Kabupaten Aceh Barat Daya", "Kabupaten Aceh Besar", 
-        "Kabupaten Aceh Jaya", "Kabupaten Aceh Selatan", "Kabupaten Aceh Singkil", 
-        "Kabupaten Aceh Tamiang", "Kabupaten Aceh Tengah", "Kabupaten Aceh Tenggara", 
-        "Kabupaten Aceh Timur", "Kabupaten Aceh Utara", "Kabupaten Bener Meriah", 
-        "Kabupaten Bireuen", "Kabupaten Gayo Lues", "Kabupaten Nagan Raya", 
-        "Kabupaten Pidie", "Kabupaten Pidie Jaya", "Kabupaten Simeulue"
-    ],
-    
-    "Sumatera Utara": [
-        "Kota Medan", "Kota Binjai", "Kota Gunungsitoli", "Kota Padang Sidempuan", 
-        "Kota Pematangsiantar", "Kota Sibolga", "Kota Tanjungbalai", "Kota Tebing Tinggi",
-        "Kabupaten Asahan", "Kabupaten Batu Bara", "Kabupaten Dairi", "Kabupaten Deli Serdang", 
-        "Kabupaten Humbang Hasundutan", "Kabupaten Karo", "Kabupaten Labuhanbatu", 
-        "Kabupaten Labuhanbatu Selatan", "Kabupaten Labuhanbatu Utara", "Kabupaten Langkat", 
-        "Kabupaten Mandailing Natal", "Kabupaten Nias", "Kabupaten Nias Barat", 
-        "Kabupaten Nias Selatan", "Kabupaten Nias Utara", "Kabupaten Padang Lawas", 
-        "Kabupaten Padang Lawas Utara", "Kabupaten Pakpak Bharat", "Kabupaten Samosir", 
-        "Kabupaten Serdang Bedagai", "Kabupaten Simalungun", "Kabupaten Tapanuli Selatan", 
-        "Kabupaten Tapanuli Tengah", "Kabupaten Tapanuli Utara", "Kabupaten Toba Samosir"
-    ],
-    
-    "Sumatera Barat": [
-        "Kota Bukittinggi", "Kota Padang", "Kota Padang Panjang", "Kota Pariaman", 
-        "Kota Payakumbuh", "Kota Sawahlunto", "Kota Solok",
-        "Kabupaten Agam", "Kabupaten Dharmasraya", "Kabupaten Kepulauan Mentawai", 
-        "Kabupaten Lima Puluh Kota", "Kabupaten Padang Pariaman", "Kabupaten Pasaman", 
-        "Kabupaten Pasaman Barat", "Kabupaten Pesisir Selatan", "Kabupaten Sijunjung", 
-        "Kabupaten Solok", "Kabupaten Solok Selatan", "Kabupaten Tanah Datar"
-    ],
-    
-    "Riau": [
-        "Kota Dumai", "Kota Pekanbaru",
-        "Kabupaten Bengkalis", "Kabupaten Indragiri Hilir", "Kabupaten Indragiri Hulu", 
-        "Kabupaten Kampar", "Kabupaten Kepulauan Meranti", "Kabupaten Kuantan Singingi", 
-        "Kabupaten Pelalawan", "Kabupaten Rokan Hilir", "Kabupaten Rokan Hulu", 
-        "Kabupaten Siak"
-    ],
-    
-    "Jambi": [
-        "Kota Jambi", "Kota Sungai Penuh",
-        "Kabupaten Batanghari", "Kabupaten Bungo", "Kabupaten Kerinci", 
-        "Kabupaten Merangin", "Kabupaten Muaro Jambi", "Kabupaten Sarolangun", 
-        "Kabupaten Tanjung Jabung Barat", "Kabupaten Tanjung Jabung Timur", 
-        "Kabupaten Tebo"
-    ],
-    
-    "Sumatera Selatan": [
-        "Kota Lubuklinggau", "Kota Pagar Alam", "Kota Palembang", "Kota Prabumulih",
-        "Kabupaten Banyuasin", "Kabupaten Empat Lawang", "Kabupaten Lahat", 
-        "Kabupaten Muara Enim", "Kabupaten Musi Banyuasin", "Kabupaten Musi Rawas", 
-        "Kabupaten Musi Rawas Utara", "Kabupaten Ogan Ilir", "Kabupaten Ogan Komering Ilir", 
-        "Kabupaten Ogan Komering Ulu", "Kabupaten Ogan Komering Ulu Selatan", 
-        "Kabupaten Ogan Komering Ulu Timur", "Kabupaten Penukal Abab Lematang Ilir"
-    ],
-    
-    "Bengkulu": [
-        "Kota Bengkulu",
-        "Kabupaten Bengkulu Selatan", "Kabupaten Bengkulu Tengah", "Kabupaten Bengkulu Utara", 
-        "Kabupaten Kaur", "Kabupaten Kepahiang", "Kabupaten Lebong", 
-        "Kabupaten Mukomuko", "Kabupaten Rejang Lebong", "Kabupaten Seluma"
-    ],
-    
-    "Lampung": [
-        "Kota Bandar Lampung", "Kota Metro",
-        "Kabupaten Lampung Barat", "Kabupaten Lampung Selatan", "Kabupaten Lampung Tengah", 
-        "Kabupaten Lampung Timur", "Kabupaten Lampung Utara", "Kabupaten Mesuji", 
-        "Kabupaten Pesawaran", "Kabupaten Pesisir Barat", "Kabupaten Pringsewu", 
-        "Kabupaten Tanggamus", "Kabupaten Tulang Bawang", "Kabupaten Tulang Bawang Barat", 
-        "Kabupaten Way Kanan"
-    ],
-    
-    "Kepulauan Bangka Belitung": [
-        "Kota Pangkalpinang",
-        "Kabupaten Bangka", "Kabupaten Bangka Barat", "Kabupaten Bangka Selatan", 
-        "Kabupaten Bangka Tengah", "Kabupaten Belitung", "Kabupaten Belitung Timur"
-    ],
-    
-    "Kepulauan Riau": [
-        "Kota Batam", "Kota Tanjungpinang",
-        "Kabupaten Bintan", "Kabupaten Karimun", "Kabupaten Kepulauan Anambas", 
-        "Kabupaten Lingga", "Kabupaten Natuna"
-    ],
-    
-    "DKI Jakarta": [
-        "Kota Jakarta Barat", "Kota Jakarta Pusat", "Kota Jakarta Selatan", 
-        "Kota Jakarta Timur", "Kota Jakarta Utara", "Kabupaten Kepulauan Seribu"
-    ],
-    
-    "Jawa Barat": [
-        "Kota Bandung", "Kota Banjar", "Kota Bekasi", "Kota Bogor", "Kota Cimahi", 
-        "Kota Cirebon", "Kota Depok", "Kota Sukabumi", "Kota Tasikmalaya",
-        "Kabupaten Bandung", "Kabupaten Bandung Barat", "Kabupaten Bekasi", "Kabupaten Bogor", 
-        "Kabupaten Ciamis", "Kabupaten Cianjur", "Kabupaten Cirebon", "Kabupaten Garut", 
-        "Kabupaten Indramayu", "Kabupaten Karawang", "Kabupaten Kuningan", "Kabupaten Majalengka", 
-        "Kabupaten Pangandaran", "Kabupaten Purwakarta", "Kabupaten Subang", "Kabupaten Sukabumi", 
-        "Kabupaten Sumedang", "Kabupaten Tasikmalaya"
-    ],
-    
-    "Jawa Tengah": [
-        "Kota Magelang", "Kota Pekalongan", "Kota Salatiga", "Kota Semarang", "Kota Surakarta", "Kota Tegal",
-        "Kabupaten Banjarnegara", "Kabupaten Banyumas", "Kabupaten Batang", "Kabupaten Blora", 
-        "Kabupaten Boyolali", "Kabupaten Brebes", "Kabupaten Cilacap", "Kabupaten Demak", 
-        "Kabupaten Grobogan", "Kabupaten Jepara", "Kabupaten Karanganyar", "Kabupaten Kebumen", 
-        "Kabupaten Kendal", "Kabupaten Klaten", "Kabupaten Kudus", "Kabupaten Magelang", 
-        "Kabupaten Pati", "Kabupaten Pekalongan", "Kabupaten Pemalang", "Kabupaten Purbalingga", 
-        "Kabupaten Purworejo", "Kabupaten Rembang", "Kabupaten Semarang", "Kabupaten Sragen", 
-        "Kabupaten Sukoharjo", "Kabupaten Tegal", "Kabupaten Temanggung", "Kabupaten Wonogiri", 
-        "Kabupaten Wonosobo"
-    ],
-    
-    "DI Yogyakarta": [
-        "Kota Yogyakarta",
-        "Kabupaten Bantul", "Kabupaten Gunungkidul", "Kabupaten Kulon Progo", 
-        "Kabupaten Sleman"
-    ],
-    
-    "Jawa Timur": [
-        "Kota Batu", "Kota Blitar", "Kota Kediri", "Kota Madiun", "Kota Malang", 
-        "Kota Mojokerto", "Kota Pasuruan", "Kota Probolinggo", "Kota Surabaya",
-        "Kabupaten Bangkalan", "Kabupaten Banyuwangi", "Kabupaten Blitar", "Kabupaten Bojonegoro", 
-        "Kabupaten Bondowoso", "Kabupaten Gresik", "Kabupaten Jember", "Kabupaten Jombang", 
-        "Kabupaten Kediri", "Kabupaten Lamongan", "Kabupaten Lumajang", "Kabupaten Madiun", 
-        "Kabupaten Magetan", "Kabupaten Malang", "Kabupaten Mojokerto", "Kabupaten Nganjuk", 
-        "Kabupaten Ngawi", "Kabupaten Pacitan", "Kabupaten Pamekasan", "Kabupaten Pasuruan", 
-        "Kabupaten Ponorogo", "Kabupaten Probolinggo", "Kabupaten Sampang", "Kabupaten Sidoarjo", 
-        "Kabupaten Situbondo", "Kabupaten Sumenep", "Kabupaten Trenggalek", "Kabupaten Tuban", 
-        "Kabupaten Tulungagung"
-    ],
-    
-    "Banten": [
-        "Kota Cilegon", "Kota Serang", "Kota Tangerang", "Kota Tangerang Selatan",
-        "Kabupaten Lebak", "Kabupaten Pandeglang", "Kabupaten Serang", "Kabupaten Tangerang"
-    ],
-    
-    "Bali": [
-        "Kota Denpasar",
-        "Kabupaten Badung", "Kabupaten Bangli", "Kabupaten Buleleng", "Kabupaten Gianyar", 
-        "Kabupaten Jembrana", "Kabupaten Karangasem", "Kabupaten Klungkung", "Kabupaten Tabanan"
-    ],
-    
-    "Nusa Tenggara Barat": [
-        "Kota Bima", "Kota Mataram",
-        "Kabupaten Bima", "Kabupaten Dompu", "Kabupaten Lombok Barat", "Kabupaten Lombok Tengah", 
-        "Kabupaten Lombok Timur", "Kabupaten Lombok Utara", "Kabupaten Sumbawa", 
-        "Kabupaten Sumbawa Barat"
-    ],
-    
-    "Nusa Tenggara Timur": [
-        "Kota Kupang",
-        "Kabupaten Alor", "Kabupaten Belu", "Kabupaten Ende", "Kabupaten Flores Timur", 
-        "Kabupaten Kupang", "Kabupaten Lembata", "Kabupaten Malaka", "Kabupaten Manggarai", 
-        "Kabupaten Manggarai Barat", "Kabupaten Manggarai Timur", "Kabupaten Nagekeo", 
-        "Kabupaten Ngada", "Kabupaten Rote Ndao", "Kabupaten Sabu Raijua", "Kabupaten Sikka", 
-        "Kabupaten Sumba Barat", "Kabupaten Sumba Barat Daya", "Kabupaten Sumba Tengah", 
-        "Kabupaten Sumba Timur", "Kabupaten Timor Tengah Selatan", "Kabupaten Timor Tengah Utara"
-    ],
-    
-    "Kalimantan Barat": [
-        "Kota Pontianak", "Kota Singkawang",
-        "Kabupaten Bengkayang", "Kabupaten Kapuas Hulu", "Kabupaten Kayong Utara", 
-        "Kabupaten Ketapang", "Kabupaten Kubu Raya", "Kabupaten Landak", "Kabupaten Melawi", 
-        "Kabupaten Mempawah", "Kabupaten Sambas", "Kabupaten Sanggau", "Kabupaten Sekadau", 
-        "Kabupaten Sintang"
-    ],
-    
-    "Kalimantan Tengah": [
-        "Kota Palangka Raya",
-        "Kabupaten Barito Selatan", "Kabupaten Barito Timur", "Kabupaten Barito Utara", 
-        "Kabupaten Gunung Mas", "Kabupaten Kapuas", "Kabupaten Katingan", 
-        "Kabupaten Kotawaringin Barat", "Kabupaten Kotawaringin Timur", "Kabupaten Lamandau", 
-        "Kabupaten Murung Raya", "Kabupaten Pulang Pisau", "Kabupaten Sukamara", 
-        "Kabupaten Seruyan"
-    ],
-    
-    "Kalimantan Selatan": [
-        "Kota Banjarbaru", "Kota Banjarmasin",
-        "Kabupaten Balangan", "Kabupaten Banjar", "Kabupaten Barito Kuala", "Kabupaten Hulu Sungai Selatan", 
-        "Kabupaten Hulu Sungai Tengah", "Kabupaten Hulu Sungai Utara", "Kabupaten Kotabaru", 
-        "Kabupaten Tabalong", "Kabupaten Tanah Bumbu", "Kabupaten Tanah Laut", "Kabupaten Tapin"
-    ],
-    
-    "Kalimantan Timur": [
-        "Kota Balikpapan", "Kota Bontang", "Kota Samarinda",
-        "Kabupaten Berau", "Kabupaten Kutai Barat", "Kabupaten Kutai Kartanegara", 
-        "Kabupaten Kutai Timur", "Kabupaten Mahakam Ulu", "Kabupaten Paser", 
-        "Kabupaten Penajam Paser Utara"
-    ],
-    
-    "Kalimantan Utara": [
-        "Kota Tarakan",
-        "Kabupaten Bulungan", "Kabupaten Malinau", "Kabupaten Nunukan", "Kabupaten Tana Tidung"
-    ],
-    
-    "Sulawesi Utara": [
-        "Kota Bitung", "Kota Kotamobagu", "Kota Manado", "Kota Tomohon",
-        "Kabupaten Bolaang Mongondow", "Kabupaten Bolaang Mongondow Selatan", 
-        "Kabupaten Bolaang Mongondow Timur", "Kabupaten Bolaang Mongondow Utara", 
-        "Kabupaten Kepulauan Sangihe", "Kabupaten Kepulauan Siau Tagulandang Biaro", 
-        "Kabupaten Kepulauan Talaud", "Kabupaten Minahasa", "Kabupaten Minahasa Selatan", 
-        "Kabupaten Minahasa Tenggara", "Kabupaten Minahasa Utara"
-    ],
-    
-    "Sulawesi Tengah": [
-        "Kota Palu",
-        "Kabupaten Banggai", "Kabupaten Banggai Kepulauan", "Kabupaten Banggai Laut", 
-        "Kabupaten Buol", "Kabupaten Donggala", "Kabupaten Morowali", "Kabupaten Morowali Utara", 
-        "Kabupaten Parigi Moutong", "Kabupaten Poso", "Kabupaten Sigi", "Kabupaten Tojo Una-Una", 
-        "Kabupaten Tolitoli"
-    ],
-    
-    "Sulawesi Selatan": [
-        "Kota Makassar", "Kota Palopo", "Kota Parepare",
-        "Kabupaten Bantaeng", "Kabupaten Barru", "Kabupaten Bone", "Kabupaten Bulukumba", 
-        "Kabupaten Enrekang", "Kabupaten Gowa", "Kabupaten Jeneponto", "Kabupaten Kepulauan Selayar", 
-        "Kabupaten Luwu", "Kabupaten Luwu Timur", "Kabupaten Luwu Utara", "Kabupaten Maros", 
-        "Kabupaten Pangkajene dan Kepulauan", "Kabupaten Pinrang", "Kabupaten Sidenreng Rappang", 
-        "Kabupaten Sinjai", "Kabupaten Soppeng", "Kabupaten Takalar", "Kabupaten Tana Toraja", 
-        "Kabupaten Toraja Utara", "Kabupaten Wajo"
-    ],
-    
-    "Sulawesi Tenggara": [
-        "Kota Baubau", "Kota Kendari",
-        "Kabupaten Bombana", "Kabupaten Buton", "Kabupaten Buton Selatan", "Kabupaten Buton Tengah", 
-        "Kabupaten Buton Utara", "Kabupaten Kolaka", "Kabupaten Kolaka Timur", "Kabupaten Kolaka Utara", 
-        "Kabupaten Konawe", "Kabupaten Konawe Kepulauan", "Kabupaten Konawe Selatan", 
-        "Kabupaten Konawe Utara", "Kabupaten Muna", "Kabupaten Muna Barat", "Kabupaten Wakatobi"
-    ],
-    
-    "Gorontalo": [
-        "Kota Gorontalo",
-        "Kabupaten Boalemo", "Kabupaten Bone Bolango", "Kabupaten Gorontalo", 
-        "Kabupaten Gorontalo Utara", "Kabupaten Pohuwato"
-    ],
-    
-    "Sulawesi Barat": [
-        "Kabupaten Majene", "Kabupaten Mamasa", "Kabupaten Mamuju", "Kabupaten Mamuju Tengah", 
-        "Kabupaten Pasangkayu", "Kabupaten Polewali Mandar"
-    ],
-    
-    "Maluku": [
-        "Kota Ambon", "Kota Tual",
-        "Kabupaten Buru", "Kabupaten Buru Selatan", "Kabupaten Kepulauan Aru", 
-        "Kabupaten Maluku Barat Daya", "Kabupaten Maluku Tengah", "Kabupaten Maluku Tenggara", 
-        "Kabupaten Maluku Tenggara Barat", "Kabupaten Seram Bagian Barat", "Kabupaten Seram Bagian Timur"
-    ],
-    
-    "Maluku Utara": [
-        "Kota Ternate", "Kota Tidore Kepulauan",
-        "Kabupaten Halmahera Barat", "Kabupaten Halmahera Tengah", "Kabupaten Halmahera Timur", 
-        "Kabupaten Halmahera Selatan", "Kabupaten Halmahera Utara", "Kabupaten Kepulauan Sula", 
-        "Kabupaten Pulau Morotai", "Kabupaten Pulau Taliabu"
-    ],
-    
-    "Papua": [
-        "Kota Jayapura",
-        "Kabupaten Asmat", "Kabupaten Biak Numfor", "Kabupaten Boven Digoel", "Kabupaten Deiyai", 
-        "Kabupaten Dogiyai", "Kabupaten Intan Jaya", "Kabupaten Jayapura", "Kabupaten Jayawijaya", 
-        "Kabupaten Keerom", "Kabupaten Kepulauan Yapen", "Kabupaten Lanny Jaya", "Kabupaten Mamberamo Raya", 
-        "Kabupaten Mamberamo Tengah", "Kabupaten Mappi", "Kabupaten Merauke", "Kabupaten Mimika", 
-        "Kabupaten Nabire", "Kabupaten Nduga", "Kabupaten Paniai", "Kabupaten Pegunungan Bintang", 
-        "Kabupaten Puncak", "Kabupaten Puncak Jaya", "Kabupaten Sarmi", "Kabupaten Supiori", 
-        "Kabupaten Tolikara", "Kabupaten Waropen", "Kabupaten Yahukimo", "Kabupaten Yalimo"
-    ],
-    
-    "Papua Barat": [
-        "Kota Sorong",
-        "Kabupaten Fakfak", "Kabupaten Kaimana", "Kabupaten Manokwari", "Kabupaten Manokwari Selatan", 
-        "Kabupaten Maybrat", "Kabupaten Pegunungan Arfak", "Kabupaten Raja Ampat", "Kabupaten Sorong", 
-        "Kabupaten Sorong Selatan", "Kabupaten Tambrauw", "Kabupaten Teluk Bintuni", "Kabupaten Teluk Wondama"
-    ]
+# Pilihan untuk dropdown paling atas (tanpa parent)
+CASCADE_ROOT_OPTIONS = {
+    "Industry Classification": lambda: list(reference_data.get_industry_subtypes().keys()),
+    "1Province": reference_data.get_provinces,
+    "2Province": reference_data.get_provinces,
+    "Pump Brand": reference_data.get_pump_brands,
 }
 
-EFFLUENT_WARRANTY_OPTIONS = [
-    "PERMENKES No. 2 Tahun 2023 (Parameter Wajib Air Minum)",
-    "PERMENKES No. 2 Tahun 2023 (Parameter Air untuk Keperluan Higiene dan Sanitasi)",
-    "PERMENLHK RI No. P.68 Tahun 2016 (Baku Mutu Air Limbah Domestik)",
-    "PP RI No. 22 Tahun 2021 (Baku Mutu Air Sungai Kelas 1 dan Sejenisnya)",
-    "PP RI No. 22 Tahun 2021 (Baku Mutu Air Sungai Kelas 2 dan Sejenisnya)",
-    "PP RI No. 22 Tahun 2021 (Baku Mutu Air Sungai Kelas 3 dan Sejenisnya)",
-    "PP RI No. 22 Tahun 2021 (Baku Mutu Air Sungai Kelas 4 dan Sejenisnya)"
+# Semua dependensi dropdown parent -> child dideklarasikan di sini
+CASCADE_RULES = [
+    CascadeRule("sub_industry", ["Industry Classification"], "Sub Industry Specification",
+                options=lambda industry: reference_data.get_industry_subtypes().get(industry),
+                waiting_text="-- Select Industry First --",
+                parent_keys=lambda: [(industry,) for industry in reference_data.get_industry_subtypes()]),
+    CascadeRule("city1", ["1Province"], "1City",
+                options=lambda province: reference_data.get_cities().get(province),
+                waiting_text="-- Select Province First --",
+                parent_keys=lambda: [(province,) for province in reference_data.get_cities()]),
+    CascadeRule("city2", ["2Province"], "2City",
+                options=lambda province: reference_data.get_cities().get(province),
+                waiting_text="-- Select Province First --",
+                parent_keys=lambda: [(province,) for province in reference_data.get_cities()]),
+    CascadeRule("pump_type", ["Pump Brand"], "Pump Type",
+                options=lambda brand: reference_data.get_pump_types().get(brand),
+                waiting_text="-- Select Pump Brand First --",
+                not_applicable=_pump_brand_without_types,
+                parent_keys=lambda: [(brand,) for brand in reference_data.get_pump_brands()]),
+    CascadeRule("pump_model", ["Pump Brand", "Pump Type"], "Pump Model",
+                options=reference_data.get_pump_models,
+                waiting_text="-- Select Pump Brand and Type First --",
+                missing_text="-- No Models Available --",
+                disable_when_missing=True,
+                not_applicable=_pump_brand_without_types,
+                parent_keys=lambda: list(reference_data.iter_pump_model_keys())),
 ]
 
-PUMP_BRAND_TYPE_MAPPING = {
-    "GRUNDFOS": [
-        "Vertical Multistage Centrifugal Pump",
-        "End Suction Centrifugal Pump"
-    ],
-    "EBARA": [
-        "Vertical Multistage Centrifugal Pump", 
-        "End Suction Centrifugal Pump"
-    ],
-    "CNP": [
-        "Vertical Multistage Centrifugal Pump",
-        "Horizontal Multistage Centrifugal Pump",
-        "Submersible Pump"
-    ],
-    "LEO": [
-        "Vertical Multistage Centrifugal Pump",
-        "End Suction Centrifugal Pump", 
-        "Submersible Pump"
-    ]
-}
+_cascade_engine = None
 
-PUMP_BRAND_TYPE_MODEL_MAPPING = {
-    ("GRUNDFOS", "Vertical Multistage Centrifugal Pump"): ["CR", "CRN"],
-    ("GRUNDFOS", "End Suction Centrifugal Pump"): ["NKG"],
-    ("EBARA", "Vertical Multistage Centrifugal Pump"): ["3S"],
-    ("EBARA", "End Suction Centrifugal Pump"): ["FSSC"],
-    ("CNP", "Vertical Multistage Centrifugal Pump"): ["CDMF"],
-    ("CNP", "Horizontal Multistage Centrifugal Pump"): ["CHL"],
-    ("CNP", "Submersible Pump"): ["WQ"],
-    ("LEO", "Vertical Multistage Centrifugal Pump"): ["LVRS"],
-    ("LEO", "End Suction Centrifugal Pump"): ["LEP"],
-    ("LEO", "Submersible Pump"): ["SWE", "XSP"]
-}
+def get_cascade_engine():
+    """Shared cascade engine - model per parent key dibuat sekali untuk semua sheet"""
+    global _cascade_engine
+    if _cascade_engine is None:
+        _cascade_engine = CascadeEngine(CASCADE_RULES, get_cascade_field_name)
+        _cascade_engine.precompute()
+    return _cascade_engine
 
 def get_effluent_warranty_parameters_for_tooltip(warranty_type):
     """
@@ -429,147 +112,8 @@ def get_effluent_warranty_parameters_for_tooltip(warranty_type):
     - str: Formatted parameter string for tooltip (vertical format)
     """
     
-    # Data parameter berdasarkan tabel yang Anda berikan
-    parameter_data = {
-        "PERMENKES No. 2 Tahun 2023 (Parameter Wajib Air Minum)": [
-            "pH: 6.5-8.5",
-            "TDS: <300 mg/L",
-            "Turbidity: <3 NTU", 
-            "Color: 10 TCU",
-            "Nitrate: 20 mg/L",
-            "Nitrite: 3 mg/L",
-            "Cr6+: 0.01 mg/L",
-            "Fe: 0.2 mg/L",
-            "Mn: 0.1 mg/L",
-            "Sisa Cl: 0.2-0.5 mg/L",
-            "As: 0.01 mg/L",
-            "Cd: 0.003 mg/L",
-            "Pb: 0.01 mg/L",
-            "F: 1.5 mg/L",
-            "Al: 0.2 mg/L",
-            "E.Coli: 0 CFU/100 mL",
-            "Total Coliform: 0 CFU/100 mL",
-            "Odor: odorless"
-        ],
-        
-        "PERMENKES No. 2 Tahun 2023 (Parameter Air untuk Keperluan Higiene dan Sanitasi)": [
-            "pH: 6.5-8.5",
-            "TDS: <300 mg/L",
-            "Turbidity: <3 NTU",
-            "Color: 10 TCU", 
-            "Nitrate: 20 mg/L",
-            "Nitrite: 3 mg/L",
-            "Cr6+: 0.01 mg/L",
-            "Fe: 0.2 mg/L",
-            "Mn: 0.1 mg/L",
-            "E.Coli: 0 CFU/100 mL",
-            "Total Coliform: 0 CFU/100 mL",
-            "Odor: odorless"
-        ],
-        
-        "PERMENLHK RI No. P.68 Tahun 2016 (Baku Mutu Air Limbah Domestik)": [
-            "pH: 6-9",
-            "BOD: 30 mg/L",
-            "COD: 100 mg/L",
-            "TSS: 30 mg/L",
-            "FOG: 5 mg/L",
-            "Ammonia: 10 mg/L",
-            "Total Coliform: 3000 jumlah/100 mL"
-        ],
-        
-        "PP RI No. 22 Tahun 2021 (Baku Mutu Air Sungai Kelas 1 dan Sejenisnya)": [
-            "pH: 6-9",
-            "TDS: 1000 mg/L",
-            "TSS: 40 mg/L",
-            "Color: 15 Pt-Co Unit",
-            "BOD: 2 mg/L",
-            "COD: 10 mg/L",
-            "DO: 6 mg/L",
-            "Sulfate: 300 mg/L",
-            "Chloride: 300 mg/L",
-            "Nitrate: 10 mg/L",
-            "Nitrite: 0.06 mg/L",
-            "Ammonia: 0.1 mg/L",
-            "Total Nitrogen: 15 mg/L",
-            "Total Phospate: 0.2 mg/L",
-            "Fluoride: 1 mg/L",
-            "Sulphure as H2S: 0.002 mg/L",
-            "Cyanide: 0.02 mg/L",
-            "Free Chlorine: 0.03 mg/L",
-            "Oil and Grease: 1 mg/L",
-            "Total Detergent: 0.2 mg/L",
-            "Fecal Coliform: 100 MPN/100 mL",
-            "Total Coliform: 1000 MPN/100 mL"
-        ],
-        
-        "PP RI No. 22 Tahun 2021 (Baku Mutu Air Sungai Kelas 2 dan Sejenisnya)": [
-            "pH: 6-9",
-            "TDS: 1000 mg/L",
-            "TSS: 50 mg/L",
-            "Color: 50 Pt-Co Unit",
-            "BOD: 3 mg/L",
-            "COD: 25 mg/L",
-            "DO: 4 mg/L",
-            "Sulfate: 300 mg/L",
-            "Chloride: 300 mg/L",
-            "Nitrate: 10 mg/L",
-            "Nitrite: 0.06 mg/L",
-            "Ammonia: 0.2 mg/L",
-            "Total Nitrogen: 15 mg/L",
-            "Total Phospate: 0.2 mg/L",
-            "Fluoride: 1.5 mg/L",
-            "Sulphure as H2S: 0.002 mg/L",
-            "Cyanide: 0.02 mg/L",
-            "Free Chlorine: 0.03 mg/L",
-            "Oil and Grease: 1 mg/L",
-            "Total Detergent: 0.2 mg/L",
-            "Fecal Coliform: 1000 MPN/100 mL",
-            "Total Coliform: 5000 MPN/100 mL"
-        ],
-        
-        "PP RI No. 22 Tahun 2021 (Baku Mutu Air Sungai Kelas 3 dan Sejenisnya)": [
-            "pH: 6-9",
-            "TDS: 1000 mg/L",
-            "TSS: 100 mg/L",
-            "Color: 100 Pt-Co Unit",
-            "BOD: 6 mg/L",
-            "COD: 40 mg/L",
-            "DO: 3 mg/L",
-            "Sulfate: 300 mg/L",
-            "Chloride: 300 mg/L",
-            "Nitrate: 20 mg/L",
-            "Nitrite: 0.06 mg/L",
-            "Ammonia: 0.5 mg/L",
-            "Total Nitrogen: 25 mg/L",
-            "Total Phospate: 1 mg/L",
-            "Fluoride: 1.5 mg/L",
-            "Sulphure as H2S: 0.002 mg/L",
-            "Cyanide: 0.02 mg/L",
-            "Free Chlorine: 0.03 mg/L",
-            "Oil and Grease: 1 mg/L",
-            "Total Detergent: 0.2 mg/L",
-            "Fecal Coliform: 2000 MPN/100 mL",
-            "Total Coliform: 10000 MPN/100 mL"
-        ],
-        
-        "PP RI No. 22 Tahun 2021 (Baku Mutu Air Sungai Kelas 4 dan Sejenisnya)": [
-            "pH: 6-9",
-            "TDS: 2000 mg/L",
-            "TSS: 400 mg/L",
-            "BOD: 12 mg/L",
-            "COD: 80 mg/L",
-            "DO: 1 mg/L",
-            "Sulfate: 400 mg/L",
-            "Chloride: 600 mg/L",
-            "Nitrate: 20 mg/L",
-            "Oil and Grease: 10 mg/L",
-            "Fecal Coliform: 2000 MPN/100 mL",
-            "Total Coliform: 10000 MPN/100 mL"
-        ]
-    }
-    
-    # Ambil parameter untuk warranty type yang dipilih
-    parameters = parameter_data.get(warranty_type, [])
+    # Ambil parameter untuk warranty type yang dipilih (data/reference/effluent_warranty.json)
+    parameters = reference_data.get_effluent_warranty_parameters(warranty_type)
     
     if not parameters:
         return "No parameters available"
@@ -607,107 +151,102 @@ def setup_effluent_warranty_item_tooltips(dropdown_widget):
     except Exception as e:
         print(f"Error setting up item tooltips: {str(e)}")
         
-# Pengecekan opsional untuk modul docx2pdf
-HAS_DOCX2PDF = False
-try:
-    import docx2pdf
-    HAS_DOCX2PDF = True
-except ImportError:
-    pass
-
 # Pengecekan opsional untuk modul PyMuPDF (fitz)
-HAS_PYMUPDF = False
-try:
-    import fitz
-    HAS_PYMUPDF = True
-except ImportError:
-    pass
+from modules.page_renderer import HAS_PYMUPDF, get_render_service, file_content_hash
+# Konversi Word -> PDF (LibreOffice headless atau Microsoft Word, sesuai config)
+from modules.doc_conversion import get_document_converter
 
-# Kelas thread untuk mengkonversi dokumen Word ke gambar thumbnail
+class FieldSnapshot:
+    """Nilai satu widget form, dibaca di GUI thread - aman dipakai job save di worker thread"""
+    TEXT = "text"
+    DROPDOWN = "dropdown"
+    CHECKBOX = "checkbox"
+    
+    def __init__(self, kind, value="", placeholder="", options=(), checked=False,
+                 cascade_field=None, field_name="", label=""):
+        self.kind = kind
+        self.value = value
+        self.placeholder = placeholder
+        self.options = options
+        self.checked = checked
+        self.cascade_field = cascade_field
+        self.field_name = field_name
+        self.label = label
+    
+    @classmethod
+    def from_widget(cls, widget, label=""):
+        """Snapshot dari QLineEdit / QComboBox / QCheckBox; None untuk widget lain"""
+        if isinstance(widget, QComboBox):
+            return cls(cls.DROPDOWN, value=widget.currentText(),
+                       options=tuple(widget.itemText(i) for i in range(widget.count())),
+                       cascade_field=widget.property("cascade_field"),
+                       field_name=widget.property("field_name") or "", label=label)
+        if isinstance(widget, QLineEdit):
+            return cls(cls.TEXT, value=widget.text(), placeholder=widget.placeholderText())
+        if isinstance(widget, QCheckBox):
+            return cls(cls.CHECKBOX, checked=widget.isChecked())
+        return None
+
+def close_excel_app(app, wb, cancel_token):
+    """Tutup workbook dan instance Excel xlwings, lalu lepas PID-nya dari cancel token"""
+    # PID diambil dulu - instance yang sudah dimatikan mungkin tidak bisa ditanya lagi
+    pid = app.pid
+    try:
+        if wb is not None:
+            wb.close()
+    except Exception as e:
+        print(f"Error closing workbook: {str(e)}")
+    try:
+        app.quit()
+    except Exception as e:
+        # Bisa gagal jika proses sudah dimatikan oleh pembatalan - pastikan tetap mati
+        print(f"Error quitting Excel: {str(e)}")
+        try:
+            app.kill()
+        except Exception:
+            pass
+    finally:
+        cancel_token.unregister_process(pid)
+
+# Kelas thread untuk menyiapkan pratinjau dokumen Word. Halaman PDF dirender
+# oleh ProposalPreviewWidget sesuai posisi scroll; thread ini hanya menyiapkan
+# PDF di cache, atau membuat halaman alternatif jika PDF tidak bisa dibuat.
 class ThumbnailGeneratorThread(QThread):
-    # Signal saat thumbnail siap
-    thumbnail_ready = pyqtSignal(int, QPixmap)
+    # Signal saat thumbnail alternatif siap (QImage - QPixmap hanya boleh dibuat di GUI thread)
+    thumbnail_ready = pyqtSignal(int, QImage)
     finished = pyqtSignal()
     error = pyqtSignal(str)
+    # Signal PDF siap di cache: hash isi dokumen, jumlah halaman, rasio tinggi/lebar halaman
+    document_ready = pyqtSignal(str, int, float)
     
     def __init__(self, file_path, max_pages=100):  # Ubah max_pages menjadi 100
         super().__init__()
         self.file_path = file_path
         self.max_pages = max_pages
-        self.temp_dir = None
+        self.render_service = get_render_service()
+        self.converter = get_document_converter()
         
     def run(self):
         try:
-             # Inisialisasi COM library untuk thread ini
-            import pythoncom
-            pythoncom.CoInitialize()
-            
-            # Buat direktori sementara
-            self.temp_dir = tempfile.mkdtemp()
-            
-            # Konversi Word ke PDF jika itu docx dan modul docx2pdf tersedia
             _, ext = os.path.splitext(self.file_path)
-            if ext.lower() == '.docx' and HAS_DOCX2PDF:
-                pdf_path = os.path.join(self.temp_dir, "temp.pdf")
-                docx2pdf.convert(self.file_path, pdf_path)
+            if ext.lower() in ('.docx', '.pdf') and HAS_PYMUPDF:
+                # Dokumen yang isinya tidak berubah langsung diambil dari cache render
+                doc_hash = file_content_hash(self.file_path)
                 
-                # Gunakan PDF untuk menghasilkan thumbnail jika PyMuPDF tersedia
-                if HAS_PYMUPDF:
-                    self.generate_thumbnails_from_pdf(pdf_path)
-                else:
+                if not os.path.exists(self.render_service.pdf_path(doc_hash)) and ext.lower() == '.docx' and not self.converter.is_available():
                     self.generate_thumbnails_alternative()
+                else:
+                    self.render_service.ensure_pdf(self.file_path, doc_hash, self.converter.convert_to_pdf)
+                    info = self.render_service.document_info(doc_hash)
+                    self.document_ready.emit(doc_hash, min(self.max_pages, info['page_count']), info['page_ratio'])
             else:
-                # Gunakan pendekatan alternatif untuk file non-PDF dan jika docx2pdf tidak tersedia
+                # Gunakan pendekatan alternatif untuk file non-PDF dan jika konversi PDF tidak tersedia
                 self.generate_thumbnails_alternative()
                 
             self.finished.emit()
         except Exception as e:
             self.error.emit(str(e))
-        finally:
-            # Bersihkan direktori sementara saat selesai
-            if self.temp_dir and os.path.exists(self.temp_dir):
-                try:
-                    shutil.rmtree(self.temp_dir)
-                except:
-                    pass
-                
-            # Uninisialisasi COM library
-            try:
-                import pythoncom
-                pythoncom.CoUninitialize()
-            except:
-                pass
 
-    def generate_thumbnails_from_pdf(self, pdf_path):
-        """Menghasilkan thumbnail dari file PDF menggunakan PyMuPDF jika tersedia"""
-        try:
-            # Pastikan PyMuPDF tersedia
-            if not HAS_PYMUPDF:
-                self.error.emit("PyMuPDF (modul fitz) tidak tersedia. Menggunakan metode alternatif.")
-                self.generate_thumbnails_alternative()
-                return
-                
-            doc = fitz.open(pdf_path)
-            # Proses semua halaman tanpa batasan 10
-            for page_num in range(min(self.max_pages, doc.page_count)):
-                page = doc.load_page(page_num)
-                
-                # Render halaman sebagai gambar
-                pix = page.get_pixmap(matrix=fitz.Matrix(300/72, 300/72))
-                img_data = pix.samples
-                
-                # Buat QImage dari data piksel
-                img = QImage(img_data, pix.width, pix.height, pix.stride, QImage.Format_RGB888)
-                pixmap = QPixmap.fromImage(img)
-                
-                # Kirim thumbnail ke UI
-                self.thumbnail_ready.emit(page_num, pixmap)
-            
-            doc.close()
-        except Exception as e:
-            self.error.emit(f"Error PyMuPDF: {str(e)}. Menggunakan metode alternatif.")
-            self.generate_thumbnails_alternative()
-    
     def generate_thumbnails_alternative(self):
         """Metode alternatif untuk menghasilkan thumbnail sederhana"""
         try:
@@ -757,11 +296,8 @@ class ThumbnailGeneratorThread(QThread):
                 
                 painter.end()
                 
-                # Konversi ke QPixmap
-                pixmap = QPixmap.fromImage(img)
-                
                 # Kirim thumbnail ke UI
-                self.thumbnail_ready.emit(page_num, pixmap)
+                self.thumbnail_ready.emit(page_num, img)
         except Exception as e:
             self.error.emit(f"Gagal membuat thumbnail alternatif: {str(e)}")
             
@@ -796,11 +332,8 @@ class ThumbnailGeneratorThread(QThread):
                 
                 painter.end()
                 
-                # Konversi ke QPixmap
-                pixmap = QPixmap.fromImage(img)
-                
                 # Kirim thumbnail ke UI
-                self.thumbnail_ready.emit(page_num, pixmap)
+                self.thumbnail_ready.emit(page_num, img)
         except Exception as e:
             self.error.emit(f"Gagal membuat thumbnail fallback: {str(e)}")
     
@@ -827,6 +360,8 @@ class ThumbnailGeneratorThread(QThread):
 class BDUGroupView(QMainWindow):
     """View untuk BDU Group"""
     back_to_dashboard = pyqtSignal()
+    # Sheet pertama sudah tersedia (atau loading selesai/gagal) - view siap ditampilkan
+    workspace_ready = pyqtSignal()
     
     def __init__(self, auth_manager):
         super().__init__()
@@ -835,16 +370,55 @@ class BDUGroupView(QMainWindow):
         self.excel_data = None
         self.sheet_tabs = {}
         self.data_fields = {}
-        self.linked_dropdowns = {}
+        self.cascade_engine = get_cascade_engine()
         self.user_codes = []
+        # Pilihan dropdown per sheet/sel dari data validation, dibaca sekali oleh loader
+        self.validation_index = {}
         self.formula_evaluator = None
         self.formula_widgets = {}
         
+        # Lazy tab state - isi sheet dibangun saat tab pertama kali dibuka
+        self.prefetch_tabs = True
+        self._sheet_frames = {}
+        self._tab_prefetch_timer = None
+        self._refresh_pending = False
+        self._workspace_ready = False
+        
+        # Workbook diparsing di QThreadPool, widget dibangun di GUI thread dari signal
+        self.workbook_loader = WorkbookLoader(self)
+        self.workbook_loader.progress.connect(self.on_workbook_progress)
+        self.workbook_loader.sheet_list_ready.connect(self.on_workbook_sheet_list)
+        self.workbook_loader.user_codes_ready.connect(self.on_workbook_user_codes)
+        self.workbook_loader.validations_ready.connect(self.on_workbook_validations)
+        self.workbook_loader.sheet_ready.connect(self.on_workbook_sheet_ready)
+        self.workbook_loader.evaluator_ready.connect(self.on_workbook_evaluator)
+        self.workbook_loader.finished.connect(self.on_workbook_loaded)
+        
         # Excel path
         self.excel_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "SET_BDU.xlsx")
         
         self.initUI()
+        
+        # Panel job background (projection, proposal, save) - muncul saat ada job
+        self.jobs_panel = JobsPanel(self)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.jobs_panel)
+        self.jobs_panel.hide()
+        
         self.load_excel_data()
+        
+        # Siapkan profil LibreOffice di background supaya pratinjau proposal pertama tidak lambat
+        get_document_converter().warm_up()
+    
+    def submit_job(self, title, task_function, resource="default", priority=PRIORITY_NORMAL, on_complete=None,
+                   target=None):
+        """
+        Antrikan operasi panjang ke JobManager bersama; view tetap bisa dipakai selama job berjalan.
+        Job yang menulis workbook memberi `target` path-nya agar tidak berjalan bersamaan.
+        """
+        job = get_job_manager().submit(title, task_function, resource=resource,
+                                       priority=priority, on_complete=on_complete, target=target)
+        self.statusBar().showMessage(f"{title}: queued in background jobs", 3000)
+        return job
     
     def initUI(self):
         """Initialize the UI"""
@@ -1000,6 +574,8 @@ class BDUGroupView(QMainWindow):
             }}
         """)
         
+        self.tab_widget.currentChanged.connect(self.on_sheet_tab_changed)
+        
         content_layout.addWidget(self.tab_widget)
         
         # Loading message
@@ -1025,31 +601,10 @@ class BDUGroupView(QMainWindow):
                 print(f"Excel file not found: {self.excel_path}")
                 return
             
-            # SOLUSI: Specify dtype untuk kolom Code sebagai string
-            # Ini akan mempertahankan leading zeros
-            dtype_dict = {'Code': str}  # Force Code column to be read as string
-            
-            # Read the 'User Code' sheet dengan dtype specification
-            df = pd.read_excel(self.excel_path, sheet_name='User Code', dtype=dtype_dict)
+            self.user_codes = read_user_codes(self.excel_path)
             
-            # Check if 'Code' column exists
-            if 'Code' in df.columns:
-                # Get all codes, filter out NaN values - sudah dalam format string
-                codes = df['Code'].dropna().tolist()
-                
-                # Filter out empty strings dan pastikan format string
-                self.user_codes = []
-                for code in codes:
-                    code_str = str(code).strip()
-                    if code_str and code_str.lower() != 'nan':
-                        self.user_codes.append(code_str)
-                
-                # Update dropdown
-                self.update_user_code_dropdown()
-            else:
-                print("'Code' column not found in 'User Code' sheet")
-                print(f"Available columns: {df.columns.tolist()}")
-                self.user_codes = []
+            # Update dropdown
+            self.update_user_code_dropdown()
                 
         except Exception as e:
             print(f"Error loading user codes from Excel: {str(e)}")
@@ -1255,327 +810,250 @@ class BDUGroupView(QMainWindow):
         self.back_to_dashboard.emit()
         self.close()
     
-    def update_dependent_dropdown(self, parent_value, child_dropdown):
-        """Update dropdown yang bergantung berdasarkan nilai dropdown utama"""
-        # Bersihkan dropdown anak
-        child_dropdown.clear()
+    def get_absolute_path(self, relative_path):
+        """Konversi path relatif menjadi absolut relatif terhadap root project"""
+        if os.path.isabs(relative_path):
+            return relative_path
         
-        # Simpan nilai saat ini agar bisa digunakan nanti
-        current_value = getattr(child_dropdown, "_last_value", None)
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        return os.path.join(project_root, relative_path)
+    
+    def refresh_with_calculation(self):
+        """Refresh data and process formulas in background"""
+        # Loader sudah membaca workbook dan mengevaluasi formula di worker thread
+        self._refresh_pending = True
+        self.statusBar().showMessage("Refreshing Excel data...")
+        self.load_excel_data()
+    
+    def load_excel_data(self):
+        """Load data from SET_BDU.xlsx"""
+        # Fase 1: workbook diparsing di worker. Fase 2: tab dibangun dari signal loader.
+        self.stop_tab_prefetch()
+        self._workspace_ready = False
         
-        # Cek jenis dropdown berdasarkan property
-        dropdown_type = child_dropdown.property("pump_dropdown_type")
+        # Clear existing tabs
+        self.tab_widget.clear()
+        self.sheet_tabs = {}
+        self.data_fields = {}
+        self._sheet_frames = {}
+        self.validation_index = {}
         
-        # Isi dengan nilai-nilai yang sesuai berdasarkan pilihan pada dropdown utama
-        if parent_value in INDUSTRY_SUBTYPE_MAPPING:
-            # Ini adalah dropdown industry -> sub industry
-            child_dropdown.addItem("-- Select Value --")
-            child_dropdown.addItems(INDUSTRY_SUBTYPE_MAPPING[parent_value])
-            child_dropdown.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-            child_dropdown.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-        elif parent_value in INDONESIA_CITIES:
-            # Ini adalah dropdown province -> city
-            child_dropdown.addItem("-- Select Value --")
-            child_dropdown.addItems(INDONESIA_CITIES[parent_value])
-            child_dropdown.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-            child_dropdown.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-        elif dropdown_type == "pump_type" and parent_value in PUMP_BRAND_TYPE_MAPPING:
-            # Ini adalah dropdown pump brand -> pump type
-            child_dropdown.addItem("-- Select Value --")
-            child_dropdown.addItems(PUMP_BRAND_TYPE_MAPPING[parent_value])
-            child_dropdown.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-            child_dropdown.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-            child_dropdown.setEnabled(True)
-        elif dropdown_type == "pump_type" and parent_value not in PUMP_BRAND_TYPE_MAPPING:
-            # Brand yang tidak memiliki turunan - disable type dropdown
-            child_dropdown.addItem("-- Not Required for this Brand --")
-            child_dropdown.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-            child_dropdown.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-            child_dropdown.setEnabled(False)
-        else:
-            # Default jika tidak ada mapping
-            child_dropdown.addItem("-- Select Value --")
-            child_dropdown.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-            child_dropdown.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-                    
-    def update_pump_model_dropdown(self, pump_brand, pump_type, model_dropdown):
-        """Update pump model dropdown berdasarkan brand dan type yang dipilih"""
-        model_dropdown.clear()
+        if self.formula_evaluator:
+            self.formula_evaluator.close()
+            self.formula_evaluator = None
         
-        # Cek apakah brand memiliki turunan
-        if pump_brand not in PUMP_BRAND_TYPE_MAPPING:
-            # Brand tidak memiliki turunan - disable model dropdown
-            model_dropdown.addItem("-- Not Required for this Brand --")
-            model_dropdown.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-            model_dropdown.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-            model_dropdown.setEnabled(False)
+        if not os.path.exists(self.excel_path):
+            self.show_load_error("Error: File SET_BDU.xlsx not found in the data directory.")
+            self.mark_workspace_ready()
             return
         
-        # Skip jika nilai masih placeholder
-        if (pump_brand == "-- Select Value --" or pump_type == "-- Select Value --" or
-            pump_type == "-- Not Required for this Brand --" or
-            not pump_brand or not pump_type):
-            model_dropdown.addItem("-- Select Pump Brand and Type First --")
-            model_dropdown.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-            model_dropdown.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-            model_dropdown.setEnabled(True)
+        self.loading_label.setText("Loading data from SET_BDU.xlsx...")
+        self.loading_label.setStyleSheet("color: #666; margin: 20px;")
+        self.loading_label.setVisible(True)
+        
+        self.workbook_loader.load(self.excel_path, load_formulas=HAS_FORMULA_HELPER)
+    
+    def is_workspace_ready(self):
+        return self._workspace_ready
+    
+    def mark_workspace_ready(self):
+        """Emit workspace_ready sekali per load"""
+        if not self._workspace_ready:
+            self._workspace_ready = True
+            self.workspace_ready.emit()
+    
+    def show_load_error(self, message):
+        """Tampilkan error loading di label utama"""
+        self.loading_label.setText(message)
+        self.loading_label.setStyleSheet("color: #E74C3C; margin: 20px;")
+        self.loading_label.setVisible(True)
+        print(f"Error loading Excel data: {message}")
+    
+    def on_workbook_progress(self, value, message):
+        """Progress dari worker loader ditampilkan di status bar"""
+        self.statusBar().showMessage(f"{message} ({value}%)")
+    
+    def on_workbook_sheet_list(self, sheet_names):
+        """Buat tab placeholder segera setelah daftar sheet diketahui"""
+        if not sheet_names:
             return
         
-        model_key = (pump_brand, pump_type)
+        # Hide loading label as we have data
+        self.loading_label.setVisible(False)
         
-        if model_key in PUMP_BRAND_TYPE_MODEL_MAPPING:
-            model_dropdown.addItem("-- Select Value --")
-            model_dropdown.addItems(PUMP_BRAND_TYPE_MODEL_MAPPING[model_key])
-            model_dropdown.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-            model_dropdown.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-            model_dropdown.setEnabled(True)
-        else:
-            # Jika tidak ada mapping spesifik untuk brand+type ini
-            model_dropdown.addItem("-- No Models Available --")
-            model_dropdown.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-            model_dropdown.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-            model_dropdown.setEnabled(False)
+        for sheet_name in sheet_names:
+            self.tab_widget.addTab(self.create_placeholder_tab(sheet_name), self.get_sheet_display_name(sheet_name))
     
-    def get_absolute_path(self, relative_path):
-        """Konversi path relatif menjadi absolut relatif terhadap root project"""
-        if os.path.isabs(relative_path):
-            return relative_path
-        
-        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        return os.path.join(project_root, relative_path)
+    def on_workbook_user_codes(self, user_codes):
+        """Isi dropdown user code dari hasil parsing worker"""
+        self.user_codes = user_codes
+        self.update_user_code_dropdown()
     
-    def refresh_with_calculation(self):
-        """Refresh data and process formulas in background"""
+    def on_workbook_validations(self, validation_index):
+        """Index data validation dari worker - diterima sebelum sheet pertama"""
+        self.validation_index = validation_index
+    
+    def on_workbook_sheet_ready(self, sheet_name, df):
+        """Simpan data sheet; bangun langsung jika tab-nya sedang dibuka"""
+        self._sheet_frames[sheet_name] = df
         
-        def refresh_process(progress_callback=None):
-            try:
-                if progress_callback:
-                    progress_callback(20, "Refreshing Excel data...")
-                
-                # Reload Excel data
-                self.load_excel_data()
-                
-                if progress_callback:
-                    progress_callback(60, "Processing formulas...")
-                
-                # Process formulas in background
-                if hasattr(self, 'formula_evaluator') and self.formula_evaluator and HAS_FORMULA_HELPER:
-                    evaluate_formulas_background(self.formula_evaluator)
-                
-                if progress_callback:
-                    progress_callback(100, "Refresh completed!")
-                
-                return "Data refreshed successfully with background formula processing"
-                    
-            except Exception as e:
-                if progress_callback:
-                    progress_callback(100, f"Error: {str(e)}")
-                return f"Error during refresh: {str(e)}"
+        current = self.tab_widget.currentWidget()
+        if isinstance(current, QScrollArea) and current.property("sheet_name") == sheet_name:
+            self.build_sheet_tab(self.tab_widget.currentIndex())
         
-        # Show loading screen
-        loading_screen = LoadingScreen(
-            parent=self,
-            title="Refreshing Data",
-            message="Reloading data and processing formulas..."
-        )
-        loading_screen.show()
-        loading_screen.start_loading(refresh_process)
+        self.mark_workspace_ready()
+    
+    def on_workbook_evaluator(self, evaluator):
+        """Formula evaluator siap dipakai (dimuat di worker)"""
+        if self.formula_evaluator:
+            self.formula_evaluator.close()
+        self.formula_evaluator = evaluator
+    
+    def on_workbook_loaded(self, success, message):
+        """Parsing selesai - sisa tab dibangun saat idle"""
+        refresh_requested = self._refresh_pending
+        self._refresh_pending = False
+        self.mark_workspace_ready()
         
-        # Connect completion handler
-        def on_refresh_complete(success, message):
-            if success:
+        if success:
+            self.statusBar().showMessage(f"BDU Group Module | User: {self.current_user['username']}")
+            if refresh_requested:
                 self.statusBar().showMessage("Data refreshed successfully", 3000)
+            self.start_tab_prefetch()
+        else:
+            self.statusBar().clearMessage()
+            if self.tab_widget.count() == 0:
+                self.show_load_error(message)
             else:
+                print(f"Error loading Excel data: {message}")
+            if refresh_requested:
                 QMessageBox.critical(self, "Error", f"Error during refresh: {message}")
-                self.statusBar().clearMessage()
+    
+    def get_sheet_display_name(self, sheet_name):
+        """Nama tab tanpa prefix DIP_ / DATA_"""
+        if sheet_name.startswith("DIP_"):
+            return sheet_name[4:]
+        elif sheet_name.startswith("DATA_"):
+            return sheet_name[5:]
+        return sheet_name
+    
+    def create_placeholder_tab(self, sheet_name):
+        """Create a lightweight scroll area that is filled on first activation"""
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setProperty("sheet_name", sheet_name)
+        scroll_area.setProperty("sheet_built", False)
+        
+        placeholder = QLabel(f"Loading {self.get_sheet_display_name(sheet_name)}...")
+        placeholder.setFont(QFont("Segoe UI", 11))
+        placeholder.setAlignment(Qt.AlignCenter)
+        placeholder.setStyleSheet("color: #666; margin: 20px;")
+        scroll_area.setWidget(placeholder)
         
-        loading_screen.worker.task_completed.connect(on_refresh_complete)    
+        return scroll_area
     
-    def load_excel_data(self):
-        """Load data from SET_BDU.xlsx"""
+    def on_sheet_tab_changed(self, index):
+        """Build sheet content when its tab is opened for the first time"""
+        if index >= 0:
+            self.build_sheet_tab(index)
+    
+    def build_sheet_tab(self, index):
+        """Build the widgets for the sheet behind tab `index` (once)"""
+        scroll_area = self.tab_widget.widget(index)
+        if not isinstance(scroll_area, QScrollArea) or scroll_area.property("sheet_built") is not False:
+            return
         
-        def load_data_process(progress_callback=None):
-            try:
-                if progress_callback:
-                    progress_callback(5, "Checking Excel file...")
-                
-                if not os.path.exists(self.excel_path):
-                    return f"Error: File SET_BDU.xlsx not found in the data directory."
-                
-                if progress_callback:
-                    progress_callback(10, "Loading user codes...")
-
-                # Load user codes first
-                self.load_user_codes_from_excel()
-
-                if progress_callback:
-                    progress_callback(15, "Preparing data loading...")
-                
-                # Initialize formula evaluator
-                if HAS_FORMULA_HELPER:
-                    self.formula_evaluator = SimpleFormulaEvaluator(self.excel_path)
-                    if self.formula_evaluator.load_workbook():
-                        # TAMBAHKAN INI - Process formulas di background
-                        if progress_callback:
-                            progress_callback(20, "Processing formulas in background...")
-                        evaluate_formulas_background(self.formula_evaluator)
-                    else:
-                        print("Warning: Could not initialize formula evaluator")
-                        self.formula_evaluator = None
-                 
-                if progress_callback:
-                    progress_callback(35, "Reading Excel file structure...")
-                
-                # Clear existing tabs
-                self.tab_widget.clear()
-                self.sheet_tabs = {}
-                self.data_fields = {}
-                
-                # Hide loading message when tabs exist
-                self.loading_label.setVisible(True)
-                
-                # Read Excel file
-                xl = pd.ExcelFile(self.excel_path)
-                sheet_names = xl.sheet_names
-                
-                if progress_callback:
-                    progress_callback(45, "Filtering relevant sheets...")
-                
-                # Filter sheets to only include those starting with DATA_ or DIP_
-                filtered_sheets = [sheet for sheet in sheet_names if sheet.startswith("DATA_") or sheet.startswith("DIP_")]
-                
-                if len(filtered_sheets) == 0:
-                    return "No DATA_ or DIP_ sheets found in SET_BDU.xlsx."
-                
-                # Hide loading label as we have data
-                self.loading_label.setVisible(False)
-                
-                if progress_callback:
-                    progress_callback(55, f"Processing {len(filtered_sheets)} sheets...")
-                
-                # Create a tab for each filtered sheet
-                sheet_progress_step = 40 / len(filtered_sheets)  # Distribute 40% progress among sheets
-                
-                for i, sheet_name in enumerate(filtered_sheets):
-                    current_progress = 55 + (i * sheet_progress_step)
-                    
-                    if progress_callback:
-                        progress_callback(int(current_progress), f"Processing sheet: {sheet_name}")
-                    
-                    # Get display name
-                    display_name = sheet_name
-                    if sheet_name.startswith("DIP_"):
-                        display_name = sheet_name[4:]
-                    elif sheet_name.startswith("DATA_"):
-                        display_name = sheet_name[5:]
-                    
-                    try:
-                        df = pd.read_excel(self.excel_path, sheet_name=sheet_name, header=None)
-                        
-                        if sheet_name == "DATA_PROPOSAL":
-                            # Special handling for proposal sheet
-                            scroll_area = QScrollArea()
-                            scroll_area.setWidgetResizable(True)
-                            
-                            proposal_widget = QWidget()
-                            proposal_layout = QVBoxLayout(proposal_widget)
-                            proposal_layout.setContentsMargins(10, 10, 10, 0)
-                            proposal_layout.setSpacing(0)
-                            
-                            # Check for existing proposal file
-                            file_exists = False
-                            relative_word_file_path = ""
-                            
-                            if not df.empty and not pd.isna(df.iloc[0, 0]):
-                                relative_word_file_path = str(df.iloc[0, 0]).strip()
-                                absolute_word_file_path = self.get_absolute_path(relative_word_file_path)
-                                file_exists = os.path.exists(absolute_word_file_path)
-                            
-                            if file_exists:
-                                self.proposal_relative_path = relative_word_file_path
-                                if self.process_proposal_document(absolute_word_file_path):
-                                    if hasattr(self, 'proposal_document_widget'):
-                                        proposal_layout.addWidget(self.proposal_document_widget)
-                            else:
-                                # Create proposal interface for when file doesn't exist
-                                self.create_proposal_interface(proposal_layout)
-                            
-                            scroll_area.setWidget(proposal_widget)
-                            self.tab_widget.addTab(scroll_area, display_name)
-                            self.sheet_tabs[sheet_name] = proposal_widget
-                        else:
-                            # Regular processing for other sheets
-                            scroll_area = QScrollArea()
-                            scroll_area.setWidgetResizable(True)
-                            
-                            sheet_widget = QWidget()
-                            sheet_layout = QVBoxLayout(sheet_widget)
-                            sheet_layout.setContentsMargins(15, 15, 15, 15)
-                            
-                            # Process the sheet data
-                            self.process_sheet_data(df, sheet_name, sheet_layout)
-                            
-                            scroll_area.setWidget(sheet_widget)
-                            self.tab_widget.addTab(scroll_area, display_name)
-                            self.sheet_tabs[sheet_name] = sheet_widget
-                            
-                    except Exception as e:
-                        print(f"Error processing sheet {sheet_name}: {str(e)}")
-                        # Create an error tab for this sheet
-                        error_widget = QWidget()
-                        error_layout = QVBoxLayout(error_widget)
-                        
-                        error_label = QLabel(f"Error loading {sheet_name}: {str(e)}")
-                        error_label.setStyleSheet("color: #E74C3C;")
-                        error_layout.addWidget(error_label)
-                        
-                        self.tab_widget.addTab(error_widget, display_name)
-                
-                if progress_callback:
-                    progress_callback(100, "Excel data loaded successfully!")
-                
-                return "Excel data loaded successfully"
-                
-            except Exception as e:
-                if progress_callback:
-                    progress_callback(100, f"Error: {str(e)}")
-                return f"Error loading data: {str(e)}"
+        sheet_name = scroll_area.property("sheet_name")
+        df = self._sheet_frames.get(sheet_name)
+        if df is None:
+            # Data sheet belum selesai diparsing worker - dibangun saat sheet_ready
+            return
+        
+        # Tandai dulu supaya tidak dibangun dua kali (prefetch vs. klik user)
+        scroll_area.setProperty("sheet_built", True)
         
-        # For large files, show loading screen. For small files, load directly.
         try:
-            file_size = os.path.getsize(self.excel_path) / (1024 * 1024)  # Size in MB
+            if isinstance(df, Exception):
+                raise df
             
-            if file_size > 5:  # Show loading screen for files larger than 5MB
-                loading_screen = LoadingScreen(
-                    parent=self,
-                    title="Loading Excel Data",
-                    message="Reading and processing Excel sheets..."
-                )
-                loading_screen.show()
-                loading_screen.start_loading(load_data_process)
-                
-                def on_load_complete(success, message):
-                    if not success:
-                        self.loading_label.setText(message)
-                        self.loading_label.setStyleSheet("color: #E74C3C; margin: 20px;")
-                        self.loading_label.setVisible(True)
-                        print(f"Error loading Excel data: {message}")
+            if sheet_name == "DATA_PROPOSAL":
+                # Special handling for proposal sheet
+                proposal_widget = QWidget()
+                proposal_layout = QVBoxLayout(proposal_widget)
+                proposal_layout.setContentsMargins(10, 10, 10, 0)
+                proposal_layout.setSpacing(0)
+                
+                # Check for existing proposal file
+                file_exists = False
+                relative_word_file_path = ""
+                
+                if not df.empty and not pd.isna(df.iloc[0, 0]):
+                    relative_word_file_path = str(df.iloc[0, 0]).strip()
+                    absolute_word_file_path = self.get_absolute_path(relative_word_file_path)
+                    file_exists = os.path.exists(absolute_word_file_path)
+                
+                if file_exists:
+                    self.proposal_relative_path = relative_word_file_path
+                    if self.process_proposal_document(absolute_word_file_path):
+                        if hasattr(self, 'proposal_document_widget'):
+                            proposal_layout.addWidget(self.proposal_document_widget)
+                else:
+                    # Create proposal interface for when file doesn't exist
+                    self.create_proposal_interface(proposal_layout)
                 
-                loading_screen.worker.task_completed.connect(on_load_complete)
+                scroll_area.setWidget(proposal_widget)
+                self.sheet_tabs[sheet_name] = proposal_widget
             else:
-                # Load directly for smaller files
-                result = load_data_process()
-                if "Error" in result:
-                    self.loading_label.setText(result)
-                    self.loading_label.setStyleSheet("color: #E74C3C; margin: 20px;")
-                    self.loading_label.setVisible(True)
-                    print(f"Error loading Excel data: {result}")
+                # Regular processing for other sheets
+                sheet_widget = QWidget()
+                sheet_layout = QVBoxLayout(sheet_widget)
+                sheet_layout.setContentsMargins(15, 15, 15, 15)
+                
+                # Process the sheet data
+                self.process_sheet_data(df, sheet_name, sheet_layout)
+                
+                scroll_area.setWidget(sheet_widget)
+                self.sheet_tabs[sheet_name] = sheet_widget
+                
         except Exception as e:
-            self.loading_label.setText(f"Error loading data: {str(e)}")
-            self.loading_label.setStyleSheet("color: #E74C3C; margin: 20px;")
-            self.loading_label.setVisible(True)
-            print(f"Error loading Excel data: {str(e)}") 
+            print(f"Error processing sheet {sheet_name}: {str(e)}")
+            # Create an error widget for this sheet
+            error_widget = QWidget()
+            error_layout = QVBoxLayout(error_widget)
             
+            error_label = QLabel(f"Error loading {sheet_name}: {str(e)}")
+            error_label.setStyleSheet("color: #E74C3C;")
+            error_layout.addWidget(error_label)
+            
+            scroll_area.setWidget(error_widget)
+    
+    def start_tab_prefetch(self):
+        """Bangun tab yang belum dibuka satu per satu saat event loop idle"""
+        if not self.prefetch_tabs:
+            return
+        
+        if self._tab_prefetch_timer is None:
+            self._tab_prefetch_timer = QtCore.QTimer(self)
+            self._tab_prefetch_timer.setSingleShot(True)
+            self._tab_prefetch_timer.timeout.connect(self.prefetch_next_tab)
+        
+        # Beri jeda agar input user tetap diproses di antara dua sheet
+        self._tab_prefetch_timer.start(50)
+    
+    def stop_tab_prefetch(self):
+        if self._tab_prefetch_timer is not None:
+            self._tab_prefetch_timer.stop()
+    
+    def prefetch_next_tab(self):
+        """Build one pending tab, then reschedule until all tabs are built"""
+        for index in range(self.tab_widget.count()):
+            scroll_area = self.tab_widget.widget(index)
+            if (isinstance(scroll_area, QScrollArea) and scroll_area.property("sheet_built") is False
+                    and scroll_area.property("sheet_name") in self._sheet_frames):
+                self.build_sheet_tab(index)
+                self.start_tab_prefetch()
+                return
+    
     def create_proposal_interface(self, layout):
         """Create interface for when proposal file doesn't exist"""
         # Container untuk header file yang tidak ada
@@ -1670,46 +1148,49 @@ class BDUGroupView(QMainWindow):
         """Force Excel to recalculate all formulas before reading data with progress updates"""
         try:
             import xlwings as xw
-            import time
             
             if progress_callback:
                 progress_callback(10, "Starting Excel application...")
             
             # Buka Excel dengan xlwings (tidak visible)
             app = xw.App(visible=False)
-            app.display_alerts = False
-            
-            if progress_callback:
-                progress_callback(30, "Opening workbook...")
-            
-            # Buka workbook
-            wb = xw.Book(excel_path)
-            
-            if progress_callback:
-                progress_callback(50, "Forcing formula calculation...")
-            
-            # Paksa kalkulasi semua formula
-            wb.api.Application.CalculateFullRebuild()
-            wb.api.Application.Calculate()
-            
-            if progress_callback:
-                progress_callback(70, "Waiting for calculation to complete...")
-            
-            # Tunggu sebentar untuk memastikan kalkulasi selesai
-            time.sleep(2)
-            
-            if progress_callback:
-                progress_callback(90, "Saving workbook...")
-            
-            # Simpan workbook
-            wb.save()
-            
-            if progress_callback:
-                progress_callback(100, "Calculation completed!")
-            
-            # Tutup
-            wb.close()
-            app.quit()
+            # Excel dimatikan jika task dibatalkan
+            cancel_token = current_token()
+            cancel_token.register_process(app.pid)
+            wb = None
+            try:
+                app.display_alerts = False
+                
+                if progress_callback:
+                    progress_callback(30, "Opening workbook...")
+                
+                # Buka workbook
+                wb = xw.Book(excel_path)
+                
+                if progress_callback:
+                    progress_callback(50, "Forcing formula calculation...")
+                
+                # Paksa kalkulasi semua formula
+                wb.api.Application.CalculateFullRebuild()
+                wb.api.Application.Calculate()
+                
+                if progress_callback:
+                    progress_callback(70, "Waiting for calculation to complete...")
+                
+                # Tunggu sebentar untuk memastikan kalkulasi selesai
+                cancel_token.sleep(2)
+                
+                if progress_callback:
+                    progress_callback(90, "Saving workbook...")
+                
+                # Simpan workbook
+                wb.save()
+                
+                if progress_callback:
+                    progress_callback(100, "Calculation completed!")
+            finally:
+                # Tutup - juga saat error/dibatalkan agar tidak ada Excel tersembunyi yang tertinggal
+                close_excel_app(app, wb, cancel_token)
             
             return True
             
@@ -1723,14 +1204,19 @@ class BDUGroupView(QMainWindow):
             return False
     
     def run_projection(self):
-        """Fungsi untuk menjalankan projection dengan loading screen - Complete Version with Process 4 & 5"""
+        """Fungsi untuk menjalankan projection sebagai job background - Complete Version with Process 4 & 5"""
+        
+        # Path dicatat saat job disubmit - view bisa sudah pindah customer saat job berjalan
+        excel_path = self.excel_path
         
-        def projection_process(progress_callback=None):
+        def projection_process(progress_callback=None, cancel_token=None):
+            cancel_token = cancel_token or current_token()
+            # File yang dimodifikasi di-backup dulu supaya bisa di-rollback saat dibatalkan
+            transaction = FileTransaction()
             try:
                 import os
                 import pandas as pd
                 from openpyxl import load_workbook
-                import time
                 import sys
                 import subprocess
                 from PyQt5.QtWidgets import QApplication, QMessageBox
@@ -1742,15 +1228,9 @@ class BDUGroupView(QMainWindow):
                 if progress_callback:
                     progress_callback(2, "Initializing projection process...")
                 
-                # Use the customer-specific Excel file if available
-                if hasattr(self, 'excel_path'):
-                    set_bdu_path = self.excel_path
-                    print(f"📁 Using customer-specific Excel: {set_bdu_path}")
-                else:
-                    # Fall back to default path if customer file isn't set
-                    data_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
-                    set_bdu_path = os.path.join(data_folder, "SET_BDU.xlsx")
-                    print(f"📁 Using default Excel: {set_bdu_path}")
+                # Use the customer-specific Excel file captured at submit time
+                set_bdu_path = excel_path
+                print(f"📁 Using customer-specific Excel: {set_bdu_path}")
                 
                 # Base data folder path
                 data_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
@@ -1788,6 +1268,8 @@ class BDUGroupView(QMainWindow):
                     raise Exception(error_msg)
                 
                 print("✅ All required files found!")
+                transaction.protect(set_bdu_path, sbt_anapak_path, sbt_instrument_path,
+                                    sbt_dosingpump_path, sbt_chemicaltank_path)
                 
                 if progress_callback:
                     progress_callback(8, "Opening SET_BDU workbook...")
@@ -1899,7 +1381,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_anapak_path, 
                         lambda pct, msg: progress_callback(20 + (pct * 0.05), f"SBT_ANAPAK: {msg}") if progress_callback else None)
                     print("✅ SBT_ANAPAK calculation completed")
-                    time.sleep(3)  # Give more time for calculation to stabilize
+                    cancel_token.sleep(3)  # Give more time for calculation to stabilize
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_ANAPAK calculation: {str(e)}")
                     if progress_callback:
@@ -1996,6 +1478,7 @@ class BDUGroupView(QMainWindow):
                 if not os.path.exists(sbt_pump_path):
                     print(f"❌ SBT_PUMP file not found at: {sbt_pump_path}")
                     raise Exception(f"SBT_PUMP file not found: {pump_filename}")
+                transaction.protect(sbt_pump_path)
                 
                 print("✅ SBT_PUMP file exists!")
                 
@@ -2046,7 +1529,7 @@ class BDUGroupView(QMainWindow):
                     wb_pump.close()
                     print("✅ SBT_PUMP saved and closed")
                     
-                    time.sleep(1)
+                    cancel_token.sleep(1)
                     
                 except Exception as e:
                     error_msg = f"Failed to transfer data to SBT_PUMP: {str(e)}"
@@ -2070,38 +1553,41 @@ class BDUGroupView(QMainWindow):
                     
                     # Inisialisasi xlwings app
                     app = xw.App(visible=False)
-                    app.display_alerts = False
-                    app.api.AutomationSecurity = 1
-                    print("✅ xlwings app initialized")
-                    
-                    # Buka workbook
-                    wb = xw.Book(sbt_pump_path)
-                    print(f"✅ Workbook opened: {os.path.basename(sbt_pump_path)}")
-                    
-                    # Jalankan macro GENERATE_REPORT
-                    pump_filename = os.path.basename(sbt_pump_path)
-                    print(f"🚀 Running GENERATE_REPORT macro from {pump_filename}...")
-                    
+                    cancel_token.register_process(app.pid)
+                    wb = None
                     try:
-                        wb.api.Application.Run("GENERATE_REPORT")
-                        print("✅ Macro executed successfully")
-                    except Exception as macro_error:
-                        print(f"⚠️ Macro error: {str(macro_error)}")
-                    
-                    # Tunggu macro selesai
-                    print("⏳ Waiting for macro completion...")
-                    time.sleep(5)
-                    
-                    # Pastikan semua kalkulasi selesai
-                    print("🔄 Ensuring all calculations are complete...")
-                    wb.api.Application.CalculateFullRebuild()
-                    wb.api.Application.Calculate()
-                    time.sleep(2)
-                    
-                    print("💾 Saving workbook...")
-                    wb.save()
-                    wb.close()
-                    app.quit()
+                        app.display_alerts = False
+                        app.api.AutomationSecurity = 1
+                        print("✅ xlwings app initialized")
+                        
+                        # Buka workbook
+                        wb = xw.Book(sbt_pump_path)
+                        print(f"✅ Workbook opened: {os.path.basename(sbt_pump_path)}")
+                        
+                        # Jalankan macro GENERATE_REPORT
+                        pump_filename = os.path.basename(sbt_pump_path)
+                        print(f"🚀 Running GENERATE_REPORT macro from {pump_filename}...")
+                        
+                        try:
+                            wb.api.Application.Run("GENERATE_REPORT")
+                            print("✅ Macro executed successfully")
+                        except Exception as macro_error:
+                            print(f"⚠️ Macro error: {str(macro_error)}")
+                        
+                        # Tunggu macro selesai
+                        print("⏳ Waiting for macro completion...")
+                        cancel_token.sleep(5)
+                        
+                        # Pastikan semua kalkulasi selesai
+                        print("🔄 Ensuring all calculations are complete...")
+                        wb.api.Application.CalculateFullRebuild()
+                        wb.api.Application.Calculate()
+                        cancel_token.sleep(2)
+                        
+                        print("💾 Saving workbook...")
+                        wb.save()
+                    finally:
+                        close_excel_app(app, wb, cancel_token)
                     print("✅ xlwings method completed successfully")
                     macro_success = True
                     
@@ -2252,7 +1738,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_instrument_path,
                         lambda pct, msg: progress_callback(60 + (pct * 0.03), f"INSTRUMENT Calc: {msg}") if progress_callback else None)
                     print("✅ SBT_INSTRUMENT calculation completed")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_INSTRUMENT calculation: {str(e)}")
                 
@@ -2346,7 +1832,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_instrument_path,
                         lambda pct, msg: progress_callback(70 + (pct * 0.03), f"INSTRUMENT Calc 2: {msg}") if progress_callback else None)
                     print("✅ SBT_INSTRUMENT calculation completed (round 2)")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_INSTRUMENT calculation (round 2): {str(e)}")
                 
@@ -2423,7 +1909,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_instrument_path,
                         lambda pct, msg: progress_callback(85 + (pct * 0.05), f"INSTRUMENT Final Calc: {msg}") if progress_callback else None)
                     print("✅ SBT_INSTRUMENT calculation completed (final round)")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_INSTRUMENT calculation (final round): {str(e)}")
                 
@@ -2523,7 +2009,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_anapak_path,
                         lambda pct, msg: progress_callback(90 + (pct * 0.02), f"ANAPAK Pre-Q10 Calc: {msg}") if progress_callback else None)
                     print("✅ SBT_ANAPAK calculation completed before Q10 read")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_ANAPAK calculation: {str(e)}")
                 
@@ -2578,7 +2064,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_dosingpump_path,
                         lambda pct, msg: progress_callback(92 + (pct * 0.01), f"DOSINGPUMP Calc: {msg}") if progress_callback else None)
                     print("✅ SBT_DOSINGPUMP calculation completed")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_DOSINGPUMP calculation: {str(e)}")
                 
@@ -2680,7 +2166,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_anapak_path,
                         lambda pct, msg: progress_callback(94 + (pct * 0.01), f"ANAPAK Pre-Q11 Calc: {msg}") if progress_callback else None)
                     print("✅ SBT_ANAPAK calculation completed before Q11 read")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_ANAPAK calculation: {str(e)}")
                 
@@ -2715,7 +2201,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_dosingpump_path,
                         lambda pct, msg: progress_callback(95 + (pct * 0.01), f"DOSINGPUMP Calc 2: {msg}") if progress_callback else None)
                     print("✅ SBT_DOSINGPUMP calculation completed (round 2)")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_DOSINGPUMP calculation (round 2): {str(e)}")
                 
@@ -2800,7 +2286,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_anapak_path,
                         lambda pct, msg: progress_callback(96 + (pct * 0.01), f"ANAPAK Pre-Q13 Calc: {msg}") if progress_callback else None)
                     print("✅ SBT_ANAPAK calculation completed before Q13 read")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_ANAPAK calculation: {str(e)}")
                 
@@ -2835,7 +2321,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_dosingpump_path,
                         lambda pct, msg: progress_callback(97 + (pct * 0.01), f"DOSINGPUMP Final Calc: {msg}") if progress_callback else None)
                     print("✅ SBT_DOSINGPUMP calculation completed (final round)")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_DOSINGPUMP calculation (final round): {str(e)}")
                 
@@ -2971,7 +2457,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_anapak_path,
                         lambda pct, msg: progress_callback(90 + (pct * 0.01), f"ANAPAK Pre-D20 Calc: {msg}") if progress_callback else None)
                     print("✅ SBT_ANAPAK calculation completed before D20 read")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_ANAPAK calculation: {str(e)}")
                 
@@ -3026,7 +2512,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_chemicaltank_path,
                         lambda pct, msg: progress_callback(91 + (pct * 0.01), f"CHEMICALTANK Calc: {msg}") if progress_callback else None)
                     print("✅ SBT_CHEMICALTANK calculation completed")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_CHEMICALTANK calculation: {str(e)}")
                 
@@ -3113,7 +2599,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_anapak_path,
                         lambda pct, msg: progress_callback(92 + (pct * 0.01), f"ANAPAK Pre-D21 Calc: {msg}") if progress_callback else None)
                     print("✅ SBT_ANAPAK calculation completed before D21 read")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_ANAPAK calculation: {str(e)}")
                 
@@ -3151,7 +2637,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_chemicaltank_path,
                         lambda pct, msg: progress_callback(93 + (pct * 0.01), f"CHEMICALTANK Calc 2: {msg}") if progress_callback else None)
                     print("✅ SBT_CHEMICALTANK calculation completed (round 2)")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_CHEMICALTANK calculation (round 2): {str(e)}")
                 
@@ -3221,7 +2707,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_anapak_path,
                         lambda pct, msg: progress_callback(94 + (pct * 0.01), f"ANAPAK Pre-D22 Calc: {msg}") if progress_callback else None)
                     print("✅ SBT_ANAPAK calculation completed before D22 read")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_ANAPAK calculation: {str(e)}")
                 
@@ -3259,7 +2745,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_chemicaltank_path,
                         lambda pct, msg: progress_callback(95 + (pct * 0.01), f"CHEMICALTANK Final Calc: {msg}") if progress_callback else None)
                     print("✅ SBT_CHEMICALTANK calculation completed (final round)")
-                    time.sleep(2)
+                    cancel_token.sleep(2)
                 except Exception as e:
                     print(f"⚠️ Warning during SBT_CHEMICALTANK calculation (final round): {str(e)}")
                 
@@ -3328,7 +2814,7 @@ class BDUGroupView(QMainWindow):
                     self.force_excel_calculation(sbt_anapak_path,
                         lambda pct, msg: progress_callback(96 + (pct * 0.02), f"Final ANAPAK Calc: {msg}") if progress_callback else None)
                     print("✅ Final SBT_ANAPAK calculation completed")
-                    time.sleep(3)
+                    cancel_token.sleep(3)
                 except Exception as e:
                     print(f"⚠️ Warning during final SBT_ANAPAK calculation: {str(e)}")
                 
@@ -3554,6 +3040,11 @@ class BDUGroupView(QMainWindow):
                 print("=" * 80)
                 
                 return "Complete projection process with all 10 main processes has been executed successfully! Final results have been consolidated in DATA_OUTPUT_SBT_ANAPAK sheet."
+            
+            except OperationCancelled:
+                print("\n⛔ PROJECTION CANCELLED - restoring modified files...")
+                transaction.rollback()
+                raise
                 
             except Exception as e:
                 error_msg = f"Error during complete projection: {str(e)}"
@@ -3567,17 +3058,11 @@ class BDUGroupView(QMainWindow):
                 if progress_callback:
                     progress_callback(100, f"Error: {str(e)}")
                 return error_msg
+            
+            finally:
+                transaction.close()
         
-        # Show loading screen
-        loading_screen = LoadingScreen(
-            parent=self,
-            title="Running Projection",
-            message="Processing data through ANAPAK, PUMP, INSTRUMENT, DOSINGPUMP, and CHEMICALTANK modules with all 9 main processes..."
-        )
-        loading_screen.show()
-        loading_screen.start_loading(projection_process)
-        
-        # Connect completion handler
+        # Completion handler - dipanggil JobManager di GUI thread
         def on_projection_complete(success, message):
             if success:
                 print("\n🎯 COMPLETE PROJECTION FINISHED - UI NOTIFICATION")
@@ -3587,10 +3072,11 @@ class BDUGroupView(QMainWindow):
                     "Complete Projection Finished", 
                     "Complete advanced projection process with all 10 main processes has been completed successfully. All data has been processed through ANAPAK, PUMP, INSTRUMENT, DOSINGPUMP, and CHEMICALTANK modules. Final results have been consolidated in DATA_OUTPUT_SBT_ANAPAK sheet."
                 )
-                print("🔄 Refreshing UI display...")
-                # Refresh display
-                self.load_excel_data()
-                print("✅ UI refresh completed")
+                # Refresh display hanya jika view masih menampilkan workbook yang sama
+                if self.excel_path == excel_path:
+                    print("🔄 Refreshing UI display...")
+                    self.load_excel_data()
+                    print("✅ UI refresh completed")
             else:
                 print(f"\n🚨 COMPLETE PROJECTION FAILED - UI NOTIFICATION")
                 print("-" * 50)
@@ -3604,32 +3090,48 @@ class BDUGroupView(QMainWindow):
             self.statusBar().clearMessage()
             print("🏁 Complete projection process fully finished")
         
-        loading_screen.worker.task_completed.connect(on_projection_complete)
+        # Satu otomasi Excel sekaligus - projection lain menunggu di antrian
+        self.submit_job(
+            f"Projection - {getattr(self, 'customer_name', None) or os.path.basename(excel_path)}",
+            projection_process,
+            resource="excel",
+            on_complete=on_projection_complete,
+            target=excel_path
+        )
             
     def run_generate_proposal(self):
-        """Fungsi untuk menjalankan generate proposal dengan loading screen dan dynamic filename"""
+        """Fungsi untuk menjalankan generate proposal sebagai job background dengan dynamic filename"""
+        
+        # State view dicatat saat job disubmit, bukan saat job mulai berjalan
+        current_excel_path = self.excel_path
+        current_customer = getattr(self, 'customer_name', None)
+        current_selection = self.user_code_dropdown.currentText() if getattr(self, 'user_code_dropdown', None) else None
         
-        def generate_proposal_process(progress_callback=None):
+        def generate_proposal_process(progress_callback=None, cancel_token=None):
+            # Sel DATA_PROPOSAL!A1 di SET_BDU ikut diubah - backup untuk rollback saat dibatalkan
+            transaction = FileTransaction()
             try:
                 if progress_callback:
                     progress_callback(10, "Checking file paths...")
                 
                 # Use the customer-specific Excel file
-                if not hasattr(self, 'customer_name') or not self.customer_name:
-                    excel_path = self.excel_path
+                if not current_customer:
+                    excel_path = current_excel_path
                     output_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
                     customer_name = None
                 else:
-                    from modules.fix_customer_system import clean_folder_name
+                    from modules.customer_index import clean_folder_name
                     
                     customer_folder = os.path.join(
                         os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                        "data", "customers", clean_folder_name(self.customer_name)
+                        "data", "customers", clean_folder_name(current_customer)
                     )
                     
                     excel_path = os.path.join(customer_folder, "SET_BDU.xlsx")
                     output_dir = customer_folder
-                    customer_name = self.customer_name
+                    customer_name = current_customer
+                
+                transaction.protect(excel_path)
                 
                 # Path to the Word template
                 template_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
@@ -3640,10 +3142,8 @@ class BDUGroupView(QMainWindow):
                 
                 # Ambil user code yang dipilih dari dropdown
                 selected_user_code = None
-                if hasattr(self, 'user_code_dropdown') and self.user_code_dropdown:
-                    current_selection = self.user_code_dropdown.currentText()
-                    if current_selection and current_selection not in ["-- Select User Code --", "-- No User Codes Available --"]:
-                        selected_user_code = current_selection
+                if current_selection and current_selection not in ["-- Select User Code --", "-- No User Codes Available --"]:
+                    selected_user_code = current_selection
                 
                 if progress_callback:
                     progress_callback(25, "Preparing dynamic filename...")
@@ -3721,22 +3221,17 @@ class BDUGroupView(QMainWindow):
                 else:
                     return "Failed to generate proposal. Check the console for more details."
                 
+            except OperationCancelled:
+                transaction.rollback()
+                raise
             except Exception as e:
                 if progress_callback:
                     progress_callback(100, f"Error: {str(e)}")
                 return f"An error occurred while generating proposal: {str(e)}"
+            finally:
+                transaction.close()
         
-        # Show loading screen
-        from views.loading_screen import LoadingScreen
-        loading_screen = LoadingScreen(
-            parent=self,
-            title="Generating Proposal",
-            message="Creating proposal document with dynamic filename..."
-        )
-        loading_screen.show()
-        loading_screen.start_loading(generate_proposal_process)
-        
-        # Connect completion handler
+        # Completion handler - dipanggil JobManager di GUI thread
         def on_proposal_complete(success, message):
             if success and "successfully generated" in message:
                 from PyQt5.QtWidgets import QMessageBox
@@ -3746,7 +3241,8 @@ class BDUGroupView(QMainWindow):
                     message
                 )
                 # Refresh display to show the new file
-                self.load_excel_data()
+                if self.excel_path == current_excel_path:
+                    self.load_excel_data()
             else:
                 from PyQt5.QtWidgets import QMessageBox
                 QMessageBox.critical(
@@ -3757,7 +3253,13 @@ class BDUGroupView(QMainWindow):
             
             self.statusBar().clearMessage()
         
-        loading_screen.worker.task_completed.connect(on_proposal_complete)
+        self.submit_job(
+            f"Proposal - {current_customer or os.path.basename(current_excel_path)}",
+            generate_proposal_process,
+            resource="document",
+            on_complete=on_proposal_complete,
+            target=current_excel_path
+        )
 
     def preview_proposal_filename(self):
         """Preview nama file proposal yang akan dibuat"""
@@ -3984,56 +3486,23 @@ class BDUGroupView(QMainWindow):
             
             # Coba gunakan metode thumbnail generator jika tersedia modul yang diperlukan
             try:
-                # Cek apakah library yang diperlukan tersedia
-                have_required_modules = False
-                try:
-                    import pythoncom
-                    import docx2pdf
-                    import fitz
-                    have_required_modules = True
-                except ImportError:
-                    have_required_modules = False
+                # Cek apakah library yang diperlukan tersedia (konversi Word hanya perlu jika belum ada di cache)
+                have_required_modules = HAS_PYMUPDF
                 
                 if have_required_modules:
-                    # Membuat area scroll untuk thumbnail
-                    scroll_area = QScrollArea()
-                    scroll_area.setWidgetResizable(True)
-                    scroll_area.setStyleSheet("""
-                        QScrollArea {
-                            border: 1px solid #ddd;
-                            background-color: #f9f9f9;
-                            border-radius: 4px;
-                        }
-                    """)
+                    # Viewer merender halaman sesuai posisi scroll (placeholder untuk sisanya)
+                    preview_widget = ProposalPreviewWidget()
+                    preview_widget.page_double_clicked.connect(self.show_full_page)
+                    self.proposal_preview = preview_widget
                     
-                    # Container untuk thumbnail
-                    thumbnail_container = QWidget()
-                    thumbnail_layout = QVBoxLayout(thumbnail_container)
-                    thumbnail_layout.setAlignment(Qt.AlignHCenter)
-                    thumbnail_layout.setSpacing(20)
-                    
-                    # Label loading
-                    loading_label = QLabel("Loading preview document...")
-                    loading_label.setFont(QFont("Segoe UI", 12))
-                    loading_label.setAlignment(Qt.AlignCenter)
-                    loading_label.setStyleSheet("color: #666; margin: 20px;")
-                    thumbnail_layout.addWidget(loading_label)
-                    
-                    # Simpan referensi layout thumbnail untuk digunakan nanti
-                    self.thumbnail_layout = thumbnail_layout
-                    self.loading_label = loading_label
-                    
-                    # Tambahkan container ke area gulir
-                    scroll_area.setWidget(thumbnail_container)
                     document_layout.removeWidget(preview_container)
                     preview_container.deleteLater()
-                    document_layout.addWidget(scroll_area, 1)  # Stretch factor 1
-                    
-                    # Inisialisasi COM library untuk main thread
-                    pythoncom.CoInitialize()
+                    document_layout.addWidget(preview_widget, 1)  # Stretch factor 1
                     
-                    # Mulai thread generator thumbnail
-                    self.thumbnail_thread = ThumbnailGeneratorThread(file_path, max_pages=100)
+                    # Mulai thread persiapan pratinjau
+                    self.proposal_doc_hash = None
+                    self.thumbnail_thread = ThumbnailGeneratorThread(abs_file_path, max_pages=100)
+                    self.thumbnail_thread.document_ready.connect(self.on_proposal_document_ready)
                     self.thumbnail_thread.thumbnail_ready.connect(self.add_thumbnail)
                     self.thumbnail_thread.finished.connect(self.generation_finished)
                     self.thumbnail_thread.error.connect(self.generation_error)
@@ -4055,63 +3524,60 @@ class BDUGroupView(QMainWindow):
             traceback.print_exc()
             return False
             
-    def add_thumbnail(self, page_num, pixmap):
-        """Menambahkan thumbnail ke UI"""
+    def on_proposal_document_ready(self, doc_hash, page_count, page_ratio):
+        """PDF siap di cache - viewer mulai merender halaman yang terlihat"""
+        self.proposal_doc_hash = doc_hash
+        self.proposal_preview.set_document(doc_hash, page_count, page_ratio)
+    
+    def show_full_page(self, page_num):
+        """Render satu halaman di FULL_PAGE_DPI (hanya saat diminta) dan tampilkan di dialog"""
+        doc_hash = getattr(self, 'proposal_doc_hash', None)
+        if not doc_hash:
+            return
+        
         try:
-            # Hapus label loading saat thumbnail pertama ditambahkan
-            if page_num == 0 and self.loading_label:
-                self.loading_label.setVisible(False)
-            
-            # Buat frame untuk thumbnail
-            thumbnail_frame = QFrame()
-            thumbnail_frame.setFrameShape(QFrame.StyledPanel)
-            thumbnail_frame.setStyleSheet("""
-                QFrame {
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                    background-color: white;
-                    padding: 10px;
-                }
-            """)
-            frame_layout = QVBoxLayout(thumbnail_frame)
+            QApplication.setOverrideCursor(Qt.WaitCursor)
+            try:
+                png_path = get_render_service().render_full_page(doc_hash, page_num)
+            finally:
+                QApplication.restoreOverrideCursor()
             
-            # Tambahkan label halaman
-            page_label = QLabel(f"Page {page_num + 1}")
-            page_label.setFont(QFont("Segoe UI", 10, QFont.Bold))
-            page_label.setAlignment(Qt.AlignCenter)
-            frame_layout.addWidget(page_label)
+            dialog = QDialog(self)
+            dialog.setWindowTitle(f"Page {page_num + 1}")
+            dialog.resize(900, 1000)
+            dialog_layout = QVBoxLayout(dialog)
             
-            # Skala thumbnail untuk fit dalam lebar 600px
-            scaled_pixmap = pixmap.scaledToWidth(600, Qt.SmoothTransformation)
+            page_scroll = QScrollArea()
+            page_scroll.setAlignment(Qt.AlignHCenter)
+            page_label = QLabel()
+            page_label.setPixmap(QPixmap(png_path))
+            page_scroll.setWidget(page_label)
+            dialog_layout.addWidget(page_scroll)
             
-            # Buat label untuk thumbnail
-            thumbnail_label = QLabel()
-            thumbnail_label.setPixmap(scaled_pixmap)
-            thumbnail_label.setAlignment(Qt.AlignCenter)
-            thumbnail_label.setStyleSheet("background-color: white;")
-            frame_layout.addWidget(thumbnail_label)
+            dialog.exec_()
+        except Exception as e:
+            print(f"Error menampilkan halaman penuh: {str(e)}")
             
-            # Tambahkan thumbnail ke layout
-            self.thumbnail_layout.addWidget(thumbnail_frame)
+    def add_thumbnail(self, page_num, image):
+        """Menambahkan halaman pratinjau alternatif (tanpa PDF) ke UI"""
+        try:
+            self.proposal_preview.add_static_page(page_num, image)
         except Exception as e:
             print(f"Error menambahkan thumbnail: {str(e)}")
 
     def generation_finished(self):
-        """Dipanggil saat generasi thumbnail selesai"""
+        """Dipanggil saat persiapan pratinjau selesai"""
         try:
-            # Hapus label loading jika masih ada
-            if self.loading_label:
-                self.loading_label.setVisible(False)
-                
+            if self.proposal_preview.doc_hash is None and not self.proposal_preview.status_label.isHidden():
+                # Tidak ada halaman yang dihasilkan
+                self.proposal_preview.show_status("Preview tidak tersedia.")
         except Exception as e:
             print(f"Error dalam generation_finished: {str(e)}")
 
     def generation_error(self, error_message):
         """Dipanggil jika ada error saat generasi thumbnail"""
         try:
-            if self.loading_label:
-                self.loading_label.setText(f"Error saat memuat pratinjau: {error_message}")
-                self.loading_label.setStyleSheet("color: #E74C3C; margin: 20px;")
+            self.proposal_preview.show_status(f"Error saat memuat pratinjau: {error_message}", is_error=True)
         except Exception as e:
             print(f"Error dalam generation_error: {str(e)}")
 
@@ -4143,17 +3609,10 @@ class BDUGroupView(QMainWindow):
     def process_excel_images(self, sheet_name, layout):
         """Extract and display images from Excel sheet"""
         try:
-            from openpyxl import load_workbook
-            from openpyxl.drawing.image import Image
-            from io import BytesIO
-            from PIL import Image as PILImage
-            
-            # Load workbook
-            wb = load_workbook(self.excel_path)
-            if sheet_name not in wb.sheetnames:
+            # Gambar dibaca langsung dari zip (xl/media) tanpa memparsing workbook
+            images = read_sheet_images(self.excel_path, sheet_name)
+            if not images:
                 return False
-                
-            sheet = wb[sheet_name]
             
             # Create a frame for images
             images_frame = QWidget()
@@ -4166,41 +3625,21 @@ class BDUGroupView(QMainWindow):
             images_title.setStyleSheet(f"color: {PRIMARY_COLOR};")
             images_layout.addWidget(images_title)
             
-            # Track if we found any images
-            found_images = False
-            
-            # Process all images in the sheet
-            for image in sheet._images:
-                found_images = True
-                
+            for image_hash, img_data in images:
                 # Create a label to display the image
                 img_label = QLabel()
                 img_label.setAlignment(Qt.AlignCenter)
                 img_label.setStyleSheet("background-color: white; border: 1px solid #ddd; padding: 10px;")
                 
-                # Extract image data
-                img_data = image._data()
-                
-                # Convert to QPixmap and set to label
-                pixmap = QPixmap()
-                pixmap.loadFromData(img_data)
-                
-                # Scale image if too large
-                if pixmap.width() > 800:
-                    pixmap = pixmap.scaledToWidth(800, Qt.SmoothTransformation)
-                    
-                img_label.setPixmap(pixmap)
+                # Decode + scale sekali, hasilnya di-cache per hash gambar
+                img_label.setPixmap(get_thumbnail(image_hash, img_data))
                 images_layout.addWidget(img_label)
                 
                 # Add some spacing between images
                 images_layout.addSpacing(20)
             
-            # Add the images frame to the main layout if we found any
-            if found_images:
-                layout.addWidget(images_frame)
-                return True
-            
-            return False
+            layout.addWidget(images_frame)
+            return True
         except Exception as e:
             print(f"Error processing images from sheet {sheet_name}: {str(e)}")
             return False
@@ -4230,31 +3669,9 @@ class BDUGroupView(QMainWindow):
         # Field identification
         field_count = 0
         
-        # Variables to track industry dropdown fields
-        industry_dropdown = None
-        sub_industry_dropdown = None
-        
-        # Untuk melacak pasangan field dropdown province-city
-        province1_dropdown = None
-        city1_dropdown = None
-        province2_dropdown = None
-        city2_dropdown = None
-        province1_field_key = None
-        city1_field_key = None
-        province2_field_key = None
-        city2_field_key = None
-        
-        # Untuk melacak pasangan field dropdown industry-subindustry
-        industry_field_key = None
-        sub_industry_field_key = None
-        
-        # Variabel untuk melacak pasangan field dropdown pump (brand-type-model)
-        pump_brand_dropdown = None
-        pump_type_dropdown = None  
-        pump_model_dropdown = None
-        pump_brand_field_key = None
-        pump_type_field_key = None
-        pump_model_field_key = None
+        # Dropdown bertingkat di sheet ini: {cascade_field: QComboBox} dan nilai tersimpan child-nya
+        cascade_combos = {}
+        cascade_values = {}
         
         # Create a section for table if we find table formatting
         table_section = None
@@ -5020,7 +4437,7 @@ class BDUGroupView(QMainWindow):
                                     right_cell_col = col_idx + 1
                                     right_cell_address = f"{chr(ord('A') + right_cell_col)}{index + 1}"
                                     
-                                    right_validation_options = self.get_validation_values(self.excel_path, sheet_name, right_cell_address)
+                                    right_validation_options = self.get_validation_values(sheet_name, right_cell_address)
                                     
                                     if right_validation_options:
                                         right_options = right_validation_options
@@ -5310,7 +4727,7 @@ class BDUGroupView(QMainWindow):
                                     right_cell_col = col_idx + 1
                                     right_cell_address = f"{chr(ord('A') + right_cell_col)}{index + 1}"
                                     
-                                    right_validation_options = self.get_validation_values(self.excel_path, sheet_name, right_cell_address)
+                                    right_validation_options = self.get_validation_values(sheet_name, right_cell_address)
                                     
                                     if right_validation_options:
                                         right_options = right_validation_options
@@ -5423,12 +4840,14 @@ class BDUGroupView(QMainWindow):
                 
                 # BAGIAN BARU: Deteksi field "Effluent Warranty" dan gunakan hard coded options
                 is_effluent_warranty_field = "Effluent Warranty" in field_name
-                is_industry_field = field_name == "Industry Classification"
-                is_sub_industry_field = field_name == "Sub Industry Specification"
-                is_province1_field = field_name == "1Province"
-                is_city1_field = field_name == "1City"
-                is_province2_field = field_name == "2Province"
-                is_city2_field = field_name == "2City"
+                
+                # Field dropdown bertingkat dikenali dari CASCADE_RULES
+                cascade_field = self.cascade_engine.cascade_field(field_name)
+                cascade_rule = self.cascade_engine.rule_for_child(cascade_field) if cascade_field else None
+                input_field.setProperty("field_name", field_name)
+                if cascade_field:
+                    input_field.setProperty("cascade_field", cascade_field)
+                    cascade_combos[cascade_field] = input_field
 
                 # Try to get options from data validation or from second column
                 options = []
@@ -5440,60 +4859,13 @@ class BDUGroupView(QMainWindow):
 
                 # Untuk field Effluent Warranty
                 if is_effluent_warranty_field:
-                    options = EFFLUENT_WARRANTY_OPTIONS                    
-                # Untuk field Industry Classification
-                elif is_industry_field:
-                    options = list(INDUSTRY_SUBTYPE_MAPPING.keys())
-                    industry_dropdown = input_field
-                    industry_field_key = field_key
-                # Untuk field Sub Industry Specification
-                elif is_sub_industry_field:
-                    sub_industry_dropdown = input_field
-                    sub_industry_field_key = field_key
-                    options = ["-- Select Industry First --"]
-                # Untuk field 1Province
-                elif is_province1_field:
-                    options = INDONESIA_PROVINCES
-                    province1_dropdown = input_field
-                    province1_field_key = field_key
-                    input_field.setProperty("dropdown_type", "province")
-                    input_field.setProperty("province_number", "1")
-                # Untuk field 1City
-                elif is_city1_field:
-                    city1_dropdown = input_field
-                    city1_field_key = field_key
-                    input_field.setProperty("placeholder_type", "city")
-                    input_field.setProperty("city_number", "1")
-                    options = ["-- Select Province First --"]
-                # Untuk field 2Province
-                elif is_province2_field:
-                    options = INDONESIA_PROVINCES
-                    province2_dropdown = input_field
-                    province2_field_key = field_key
-                    input_field.setProperty("dropdown_type", "province")
-                    input_field.setProperty("province_number", "2")
-                # Untuk field 2City
-                elif is_city2_field:
-                    city2_dropdown = input_field
-                    city2_field_key = field_key
-                    input_field.setProperty("placeholder_type", "city")
-                    input_field.setProperty("city_number", "2")
-                    options = ["-- Select Province First --"]
-                elif "Pump Brand" in field_name or field_name == "Pump Brand Selection":
-                    options = ["GRUNDFOS", "KSB", "XYLEM", "ITT GOULDS", "EBARA", "WILO", "FLOWREX", "CNP", "LEO"]
-                    pump_brand_dropdown = input_field
-                    pump_brand_field_key = field_key
-                    input_field.setProperty("pump_dropdown_type", "pump_brand")
-                elif "Pump Type" in field_name:
-                    pump_type_dropdown = input_field
-                    pump_type_field_key = field_key
-                    input_field.setProperty("pump_dropdown_type", "pump_type")
-                    options = ["-- Select Pump Brand First --"]
-                elif "Pump Model" in field_name:
-                    pump_model_dropdown = input_field  
-                    pump_model_field_key = field_key
-                    input_field.setProperty("pump_dropdown_type", "pump_model")
-                    options = ["-- Select Pump Brand and Type First --"]
+                    options = reference_data.get_effluent_warranty_options()                    
+                # Dropdown parent (Industry, Province, Pump Brand)
+                elif cascade_field in CASCADE_ROOT_OPTIONS:
+                    options = CASCADE_ROOT_OPTIONS[cascade_field]()
+                # Dropdown child - model dipasang oleh cascade engine
+                elif cascade_rule is not None:
+                    options = [cascade_rule.waiting_text]
                 else:
                     # Try multiple cell addresses in case the calculation is off
                     possible_addresses = [
@@ -5505,7 +4877,7 @@ class BDUGroupView(QMainWindow):
                     
                     validation_options = []
                     for addr in possible_addresses:
-                        validation_options = self.get_validation_values(self.excel_path, sheet_name, addr)
+                        validation_options = self.get_validation_values(sheet_name, addr)
                         if validation_options:
                             break
                     
@@ -5531,28 +4903,24 @@ class BDUGroupView(QMainWindow):
                     default_value = str(row.iloc[1]).strip()
                 
                 # Populate dropdown options
-                if options:
+                if cascade_rule is not None:
+                    # Child dropdown diisi saat cascade engine di-bind setelah semua field dibuat
+                    cascade_values[cascade_field] = default_value
+                elif options:
                     # Add placeholder if no default value or if we want to force selection
                     if not default_value or default_value == "nan":
-                        # For dependent fields, don't add extra placeholder
-                        if any(msg in options[0] for msg in ["Select Industry First", "Select Province First"]):
-                            input_field.addItems(options)
-                            input_field.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-                            input_field.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-                            input_field.setCurrentIndex(0)
-                        else:
-                            display_options = ["-- Select Value --"] + options
-                            input_field.addItems(display_options)
-                            
-                            # Style placeholder
-                            input_field.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-                            input_field.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-                            input_field.setCurrentIndex(0)
-                            
-                            # Set default value if it exists and matches an option
-                            if default_value and default_value in options:
-                                index = options.index(default_value) + 1  # +1 for placeholder
-                                input_field.setCurrentIndex(index)
+                        display_options = ["-- Select Value --"] + options
+                        input_field.addItems(display_options)
+                        
+                        # Style placeholder
+                        input_field.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
+                        input_field.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
+                        input_field.setCurrentIndex(0)
+                        
+                        # Set default value if it exists and matches an option
+                        if default_value and default_value in options:
+                            index = options.index(default_value) + 1  # +1 for placeholder
+                            input_field.setCurrentIndex(index)
                     else:
                         # No placeholder needed, add options directly
                         input_field.addItems(options)
@@ -5598,15 +4966,17 @@ class BDUGroupView(QMainWindow):
                     
                 # Add tooltips for special fields (existing code continues...)
                 if field_name == "Seismic Hazard Zone":
+                    seismic_descriptions = reference_data.get_seismic_zone_descriptions()
                     for i in range(input_field.count()):
                         zone_text = input_field.itemText(i)
-                        if zone_text in SEISMIC_ZONE_DESCRIPTIONS:
-                            input_field.setItemData(i, SEISMIC_ZONE_DESCRIPTIONS[zone_text], Qt.ToolTipRole)
+                        if zone_text in seismic_descriptions:
+                            input_field.setItemData(i, seismic_descriptions[zone_text], Qt.ToolTipRole)
                 elif field_name == "Wind Speed Zone":
+                    wind_descriptions = reference_data.get_wind_speed_descriptions()
                     for i in range(input_field.count()):
                         level_text = input_field.itemText(i)
-                        if level_text in WIND_SPEED_DESCRIPTIONS:
-                            input_field.setItemData(i, WIND_SPEED_DESCRIPTIONS[level_text], Qt.ToolTipRole)
+                        if level_text in wind_descriptions:
+                            input_field.setItemData(i, wind_descriptions[level_text], Qt.ToolTipRole)
 
                 # Check if there's any field in the right columns (columns C and beyond)
                 has_right_field = False
@@ -5735,7 +5105,7 @@ class BDUGroupView(QMainWindow):
                                     right_cell_col = col_idx + 1
                                     right_cell_address = f"{chr(ord('A') + right_cell_col)}{index + 1}"
                                     
-                                    right_validation_options = self.get_validation_values(self.excel_path, sheet_name, right_cell_address)
+                                    right_validation_options = self.get_validation_values(sheet_name, right_cell_address)
                                     
                                     if right_validation_options:
                                         right_options = right_validation_options
@@ -6190,194 +5560,9 @@ class BDUGroupView(QMainWindow):
                 current_row += 1
                 continue
 
-        # Setelah loop pemrosesan baris selesai dan sebelum return, tambahkan:
-
-        # Hubungkan dropdown industry dan sub-industry
-        if industry_dropdown and sub_industry_dropdown:
-            # Simpan pasangan dropdown untuk referensi nanti
-            self.linked_dropdowns[industry_field_key] = sub_industry_field_key
-            
-            # Hubungkan event dropdown industry ke fungsi update untuk dropdown sub-industry
-            industry_dropdown.currentTextChanged.connect(
-                lambda text, child=sub_industry_dropdown: self.update_dependent_dropdown(text, child))
-            
-            # Trigger update awal untuk mengisi sub-industry berdasarkan nilai industry yang sudah dipilih
-            industry_value = industry_dropdown.currentText()
-            if industry_value and industry_value != "-- Select Value --":
-                self.update_dependent_dropdown(industry_value, sub_industry_dropdown)
-                
-                # Cari nilai sub-industry yang tersimpan di Excel
-                sub_industry_value = None
-                sub_industry_row = None
-                
-                # Cari baris yang berisi 'fd_Sub Industry Specification'
-                for row_idx, row in df.iterrows():
-                    if pd.isna(row.iloc[0]):
-                        continue
-                        
-                    first_col = str(row.iloc[0]).strip() if not pd.isna(row.iloc[0]) else ""
-                    if first_col == 'fd_Sub Industry Specification':
-                        sub_industry_row = row_idx
-                        # Ambil nilai dari kolom B (indeks 1)
-                        if len(row) > 1 and not pd.isna(row.iloc[1]):
-                            sub_industry_value = str(row.iloc[1]).strip()
-                        break
-                
-                # Jika nilai sub-industry ditemukan, set ke dropdown
-                if sub_industry_value and sub_industry_value in [sub_industry_dropdown.itemText(i) for i in range(sub_industry_dropdown.count())]:
-                    sub_industry_dropdown.setCurrentText(sub_industry_value)
-
-        # Hubungkan dropdown province1 dan city1
-        if province1_dropdown and city1_dropdown:
-            # Simpan pasangan dropdown untuk referensi nanti
-            self.linked_dropdowns[province1_field_key] = city1_field_key
-            
-            # Hubungkan event dropdown province ke fungsi update untuk dropdown city
-            province1_dropdown.currentTextChanged.connect(
-                lambda text, child=city1_dropdown: self.update_dependent_dropdown(text, child))
-            
-            # Trigger update awal untuk mengisi city berdasarkan nilai province yang sudah dipilih
-            province1_value = province1_dropdown.currentText()
-            if province1_value and province1_value != "-- Select Value --":
-                self.update_dependent_dropdown(province1_value, city1_dropdown)
-                
-                # Cari nilai city yang tersimpan di Excel
-                city1_value = None
-                city1_row = None
-                
-                # Cari baris yang berisi 'fd_1City'
-                for row_idx, row in df.iterrows():
-                    if pd.isna(row.iloc[0]):
-                        continue
-                        
-                    first_col = str(row.iloc[0]).strip() if not pd.isna(row.iloc[0]) else ""
-                    if "1City" in first_col and first_col.startswith('fd_'):
-                        city1_row = row_idx
-                        # Ambil nilai dari kolom B (indeks 1)
-                        if len(row) > 1 and not pd.isna(row.iloc[1]):
-                            city1_value = str(row.iloc[1]).strip()
-                        break
-                
-                # Jika nilai city ditemukan, set ke dropdown
-                if city1_value and province1_value in INDONESIA_CITIES and city1_value in INDONESIA_CITIES[province1_value]:
-                    city1_dropdown.setCurrentText(city1_value)
-
-        # Hubungkan dropdown province2 dan city2
-        if province2_dropdown and city2_dropdown:
-            # Simpan pasangan dropdown untuk referensi nanti
-            self.linked_dropdowns[province2_field_key] = city2_field_key
-            
-            # Hubungkan event dropdown province ke fungsi update untuk dropdown city
-            province2_dropdown.currentTextChanged.connect(
-                lambda text, child=city2_dropdown: self.update_dependent_dropdown(text, child))
-            
-            # Trigger update awal untuk mengisi city berdasarkan nilai province yang sudah dipilih
-            province2_value = province2_dropdown.currentText()
-            if province2_value and province2_value != "-- Select Value --":
-                self.update_dependent_dropdown(province2_value, city2_dropdown)
-                
-                # Cari nilai city yang tersimpan di Excel
-                city2_value = None
-                city2_row = None
-                
-                # Cari baris yang berisi 'fd_2City'
-                for row_idx, row in df.iterrows():
-                    if pd.isna(row.iloc[0]):
-                        continue
-                        
-                    first_col = str(row.iloc[0]).strip() if not pd.isna(row.iloc[0]) else ""
-                    if "2City" in first_col and first_col.startswith('fd_'):
-                        city2_row = row_idx
-                        # Ambil nilai dari kolom B (indeks 1)
-                        if len(row) > 1 and not pd.isna(row.iloc[1]):
-                            city2_value = str(row.iloc[1]).strip()
-                        break
-                
-                # Jika nilai city ditemukan, set ke dropdown
-                if city2_value and province2_value in INDONESIA_CITIES and city2_value in INDONESIA_CITIES[province2_value]:
-                    city2_dropdown.setCurrentText(city2_value)
-                    
-        # Hubungkan pump dropdowns (triple dependency: brand -> type -> model)
-        if pump_brand_dropdown and pump_type_dropdown:
-            # Simpan referensi untuk triple dependency
-            self.linked_dropdowns[pump_brand_field_key] = pump_type_field_key
-            
-            # Hubungkan brand -> type
-            pump_brand_dropdown.currentTextChanged.connect(
-                lambda text, child=pump_type_dropdown: self.update_dependent_dropdown(text, child))
-
-        if pump_brand_dropdown and pump_type_dropdown and pump_model_dropdown:
-            # Fungsi khusus untuk menangani triple dependency
-            def update_pump_model():
-                brand = pump_brand_dropdown.currentText()
-                pump_type = pump_type_dropdown.currentText()
-                
-                # Cek apakah brand memiliki turunan
-                if brand not in PUMP_BRAND_TYPE_MAPPING:
-                    # Brand tidak memiliki turunan - disable model dropdown
-                    pump_model_dropdown.clear()
-                    pump_model_dropdown.addItem("-- Not Required for this Brand --")
-                    pump_model_dropdown.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-                    pump_model_dropdown.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-                    pump_model_dropdown.setEnabled(False)
-                elif (brand and brand != "-- Select Value --" and 
-                    pump_type and pump_type != "-- Select Value --" and
-                    pump_type != "-- Not Required for this Brand --"):
-                    self.update_pump_model_dropdown(brand, pump_type, pump_model_dropdown)
-                else:
-                    pump_model_dropdown.clear()
-                    pump_model_dropdown.addItem("-- Select Pump Brand and Type First --")
-                    pump_model_dropdown.setItemData(0, QtGui.QColor("#999999"), Qt.ForegroundRole)
-                    pump_model_dropdown.setItemData(0, QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic), Qt.FontRole)
-                    pump_model_dropdown.setEnabled(True)
-            
-            # Hubungkan kedua parent dropdown ke function update model
-            pump_brand_dropdown.currentTextChanged.connect(lambda: update_pump_model())
-            pump_type_dropdown.currentTextChanged.connect(lambda: update_pump_model())
-            
-        # Trigger update awal untuk pump brand -> type
-        if pump_brand_dropdown and pump_type_dropdown:
-            brand_value = pump_brand_dropdown.currentText()
-            if brand_value and brand_value != "-- Select Value --":
-                self.update_dependent_dropdown(brand_value, pump_type_dropdown)
-                
-                # Cari nilai pump type yang tersimpan di Excel
-                pump_type_value = None
-                for row_idx, row in df.iterrows():
-                    if pd.isna(row.iloc[0]):
-                        continue
-                        
-                    first_col = str(row.iloc[0]).strip() if not pd.isna(row.iloc[0]) else ""
-                    if "Pump Type" in first_col and first_col.startswith('fd_'):
-                        if len(row) > 1 and not pd.isna(row.iloc[1]):
-                            pump_type_value = str(row.iloc[1]).strip()
-                        break
-                
-                # Set nilai pump type jika ditemukan
-                if (pump_type_value and pump_type_value in 
-                    [pump_type_dropdown.itemText(i) for i in range(pump_type_dropdown.count())]):
-                    pump_type_dropdown.setCurrentText(pump_type_value)
-                    
-                    # Trigger update untuk pump model
-                    if pump_model_dropdown:
-                        self.update_pump_model_dropdown(brand_value, pump_type_value, pump_model_dropdown)
-                        
-                        # Cari nilai pump model yang tersimpan di Excel
-                        pump_model_value = None
-                        for row_idx, row in df.iterrows():
-                            if pd.isna(row.iloc[0]):
-                                continue
-                                
-                            first_col = str(row.iloc[0]).strip() if not pd.isna(row.iloc[0]) else ""
-                            if "Pump Model" in first_col and first_col.startswith('fd_'):
-                                if len(row) > 1 and not pd.isna(row.iloc[1]):
-                                    pump_model_value = str(row.iloc[1]).strip()
-                                break
-                        
-                        # Set nilai pump model jika ditemukan
-                        if (pump_model_value and pump_model_value in 
-                            [pump_model_dropdown.itemText(i) for i in range(pump_model_dropdown.count())]):
-                            pump_model_dropdown.setCurrentText(pump_model_value)
+        # Hubungkan dropdown bertingkat sesuai CASCADE_RULES dan pulihkan nilai child yang tersimpan
+        if cascade_combos:
+            self.cascade_engine.bind(cascade_combos, cascade_values)
         
         # Process any excel images that may exist in this sheet
         if section_layout:
@@ -6420,144 +5605,23 @@ class BDUGroupView(QMainWindow):
             layout.addWidget(no_data_label)
     
     # Implementasi method lainnya yang perlu tetap ada (dari kode asli)
-    def get_validation_values(self, excel_path, sheet_name, cell_address):
-        """Mengambil nilai dari data validation di sebuah sel Excel"""
-        from openpyxl import load_workbook
-        import re
-        
-        workbook = None
-        try:
-            # Pastikan untuk memuat dengan data_only=False agar kita bisa mengakses validasi
-            workbook = load_workbook(excel_path, data_only=False)
-            
-            if sheet_name not in workbook.sheetnames:
-                print(f"Sheet {sheet_name} not found in workbook")
-                return []
-                
-            sheet = workbook[sheet_name]
-            
-            # Parse cell address manually (e.g., "B5" -> column=2, row=5)
-            try:
-                # Use regex to parse cell address
-                match = re.match(r'^([A-Z]+)(\d+)$', cell_address.upper())
-                if not match:
-                    print(f"Invalid cell address format: {cell_address}")
-                    return []
-                
-                col_letters = match.group(1)
-                row_num = int(match.group(2))
-                
-                # Convert column letters to number (A=1, B=2, etc.)
-                col_num = 0
-                for i, letter in enumerate(reversed(col_letters)):
-                    col_num += (ord(letter) - ord('A') + 1) * (26 ** i)
-                
-                target_cell = sheet.cell(row=row_num, column=col_num)
-            except Exception as e:
-                print(f"Error parsing cell address {cell_address}: {str(e)}")
-                return []
-            
-            # Method 1: Check data validations collection
-            if hasattr(sheet, 'data_validations') and sheet.data_validations:
-                for validation in sheet.data_validations.dataValidation:
-                    if validation.type == "list":
-                        # Check if our cell is in the validation range
-                        for coord_range in validation.sqref.ranges:
-                            if target_cell.coordinate in str(coord_range):
-                                formula = validation.formula1
-                                
-                                if formula:
-                                    # Handle different formula formats
-                                    if formula.startswith('"') and formula.endswith('"'):
-                                        # Direct list: "option1,option2,option3"
-                                        formula = formula[1:-1]
-                                        options = [val.strip() for val in formula.split(',')]
-                                        return options
-                                    elif formula.startswith('='):
-                                        # Reference to another range
-                                        try:
-                                            ref_range = formula[1:]  # Remove '='
-                                            # Handle sheet references like 'Sheet1!A1:A10'
-                                            if '!' in ref_range:
-                                                ref_sheet_name, ref_range = ref_range.split('!', 1)
-                                                ref_sheet = workbook[ref_sheet_name]
-                                            else:
-                                                ref_sheet = sheet
-                                            
-                                            # Get values from the referenced range
-                                            ref_cells = ref_sheet[ref_range]
-                                            options = []
-                                            if hasattr(ref_cells, '__iter__'):
-                                                for cell_row in ref_cells:
-                                                    if hasattr(cell_row, '__iter__'):
-                                                        for cell in cell_row:
-                                                            if cell.value is not None:
-                                                                options.append(str(cell.value).strip())
-                                                    else:
-                                                        if cell_row.value is not None:
-                                                            options.append(str(cell_row.value).strip())
-                                            else:
-                                                if ref_cells.value is not None:
-                                                    options.append(str(ref_cells.value).strip())
-                                            
-                                            return options
-                                        except Exception as ref_e:
-                                            print(f"Error processing reference formula {formula}: {str(ref_e)}")
-                                    else:
-                                        # Simple list without quotes
-                                        options = [val.strip() for val in formula.split(',')]
-                                        return options
-            
-            # Method 2: Check if cell has direct validation (alternative approach)
-            try:
-                if hasattr(target_cell, 'data_validation') and target_cell.data_validation:
-                    cell_validation = target_cell.data_validation
-                    if hasattr(cell_validation, 'type') and cell_validation.type == 'list':
-                        formula = cell_validation.formula1
-                        if formula:
-                            if formula.startswith('"') and formula.endswith('"'):
-                                formula = formula[1:-1]
-                            options = [val.strip() for val in formula.split(',')]
-                            return options
-            except Exception as e:
-                print(f"Error checking direct cell validation: {str(e)}")
-            
-            # Method 3: Scan all validations and find matching cell coordinates
-            if hasattr(sheet, 'data_validations') and sheet.data_validations:
-                for validation in sheet.data_validations.dataValidation:
-                    if validation.type == "list":
-                        try:
-                            for coord_range in validation.sqref.ranges:
-                                # Check if our target coordinates fall within this range
-                                if (coord_range.min_row <= row_num <= coord_range.max_row and
-                                    coord_range.min_col <= col_num <= coord_range.max_col):
-                                    formula = validation.formula1
-                                    if formula:
-                                        if formula.startswith('"') and formula.endswith('"'):
-                                            formula = formula[1:-1]
-                                        options = [val.strip() for val in formula.split(',')]
-                                        return options
-                        except Exception as range_e:
-                            print(f"Error processing validation range: {str(range_e)}")
-                            continue
-            
-            return []
-                    
-        except Exception as e:
-            print(f"Error reading data validation for {cell_address}: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return []
-        finally:
-            # Always close the workbook if it was opened
-            if workbook is not None:
-                try:
-                    workbook.close()
-                except Exception as close_e:
-                    print(f"Error closing workbook: {str(close_e)}")
-                                            
+    def get_validation_values(self, sheet_name, cell_address):
+        """Mengambil nilai dari data validation di sebuah sel Excel (dari index loader)"""
+        return list(self.validation_index.get(sheet_name, {}).get(cell_address.upper(), []))
+    
     def save_sheet_data(self, sheet_name):
-        """Save the form data back to the Excel file with loading screen"""
+        """Save the form data back to the Excel file as a high-priority background job"""
+        
+        # Path dan nilai form dicatat di GUI thread saat job disubmit - job bisa antri di
+        # belakang job workbook lain, dan tab bisa dibangun ulang / customer diganti sebelum job berjalan
+        excel_path = self.excel_path
+        fields = self.snapshot_form_fields(sheet_name)
+        
+        # Pilihan dropdown bertingkat dihitung di sini juga (model option dibuat di GUI thread)
+        cascade_values = {field.cascade_field: field.value for field in fields.values()
+                          if field.kind == FieldSnapshot.DROPDOWN and field.cascade_field}
+        cascade_options = {rule.child: self.cascade_engine.options_for_field(rule.child, cascade_values)
+                           for rule in self.cascade_engine.rules}
         
         def save_process(progress_callback=None):
             try:
@@ -6577,12 +5641,12 @@ class BDUGroupView(QMainWindow):
                     progress_callback(10, "Checking file accessibility...")
                 
                 # Check if file exists and is accessible
-                if not os.path.exists(self.excel_path):
-                    return f"Excel file not found: {self.excel_path}"
+                if not os.path.exists(excel_path):
+                    return f"Excel file not found: {excel_path}"
                     
                 # Check if file is not opened by another process
                 try:
-                    with open(self.excel_path, 'a'):
+                    with open(excel_path, 'a'):
                         pass
                 except PermissionError:
                     return "Excel file is currently opened by another application. Please close it and try again."
@@ -6591,10 +5655,10 @@ class BDUGroupView(QMainWindow):
                     progress_callback(15, "Creating backup...")
                 
                 # Create a backup of the Excel file
-                backup_path = self.excel_path + ".bak"
+                backup_path = excel_path + ".bak"
                 try:
                     import shutil
-                    shutil.copy2(self.excel_path, backup_path)
+                    shutil.copy2(excel_path, backup_path)
                     print(f"Backup created at: {backup_path}")
                 except Exception as e:
                     print(f"Warning: Could not create backup: {str(e)}")
@@ -6603,7 +5667,7 @@ class BDUGroupView(QMainWindow):
                     progress_callback(20, "Loading Excel workbook...")
                 
                 # Load the Excel workbook with openpyxl
-                wb = load_workbook(self.excel_path)
+                wb = load_workbook(excel_path)
                 
                 if sheet_name not in wb.sheetnames:
                     return f"Sheet '{sheet_name}' not found in the Excel file."
@@ -6615,7 +5679,7 @@ class BDUGroupView(QMainWindow):
                     progress_callback(25, "Reading current data structure...")
                 
                 # Also load with pandas to help us find the field positions
-                df = pd.read_excel(self.excel_path, sheet_name=sheet_name, header=None)
+                df = pd.read_excel(excel_path, sheet_name=sheet_name, header=None)
                 
                 # Create validation data maps to help match dropdowns with their correct options
                 validation_data = {}
@@ -6688,76 +5752,38 @@ class BDUGroupView(QMainWindow):
                 # Create specific widget mapping based on field names and positions
                 widget_mapping = {}
                 
-                # Find industry and sub-industry dropdown widgets
-                industry_dropdown = None
-                sub_industry_dropdown = None
-                province1_dropdown = None
-                city1_dropdown = None
-                province2_dropdown = None
-                city2_dropdown = None
-                pump_brand_dropdown = None
-                pump_type_dropdown = None
-                pump_model_dropdown = None
+                # Dropdown bertingkat dikenali dari property cascade_field (lihat CASCADE_RULES)
+                cascade_widgets = []
+                cascade_values = {}
                 effluent_warranty_dropdown = None
                 
                 # Find specific dropdown widgets
-                for key, widget in self.data_fields.items():
-                    if not key.startswith(sheet_name) or not isinstance(widget, QComboBox):
+                for key, widget in fields.items():
+                    if not key.startswith(sheet_name) or widget.kind != FieldSnapshot.DROPDOWN:
                         continue
                     
-                    # Get the widget's label by looking at the grid layout
-                    widget_label = self._get_widget_label(widget)
-                    
-                    # Map based on widget labels or properties
-                    dropdown_type = widget.property("dropdown_type") or ""
-                    placeholder_type = widget.property("placeholder_type") or ""
-                    province_number = widget.property("province_number") or ""
-                    city_number = widget.property("city_number") or ""
-                    pump_dropdown_type = widget.property("pump_dropdown_type") or ""
-                     
-                    # Identify specific dropdowns
-                    if "Industry Classification" in widget_label:
-                        industry_dropdown = widget
-                        widget_mapping['Industry Classification'] = widget
-                    elif "Sub Industry" in widget_label:
-                        sub_industry_dropdown = widget
-                        widget_mapping['Sub Industry Specification'] = widget
-                    elif dropdown_type == "province" and province_number == "1":
-                        province1_dropdown = widget
-                        widget_mapping['1Province'] = widget
-                    elif placeholder_type == "city" and city_number == "1":
-                        city1_dropdown = widget
-                        widget_mapping['1City'] = widget
-                    elif dropdown_type == "province" and province_number == "2":
-                        province2_dropdown = widget
-                        widget_mapping['2Province'] = widget
-                    elif placeholder_type == "city" and city_number == "2":
-                        city2_dropdown = widget
-                        widget_mapping['2City'] = widget
-                    elif "Effluent Warranty" in widget_label:
-                        effluent_warranty_dropdown = widget
-                        widget_mapping['Effluent Warranty'] = widget
-                    elif pump_dropdown_type == "pump_brand" or "Pump Brand" in widget_label:
-                        pump_brand_dropdown = widget
-                        widget_mapping['Pump Brand Selection'] = widget
-                    elif pump_dropdown_type == "pump_type" or "Pump Type" in widget_label:
-                        pump_type_dropdown = widget
-                        widget_mapping['Pump Type'] = widget
-                    elif pump_dropdown_type == "pump_model" or "Pump Model" in widget_label:
-                        pump_model_dropdown = widget
-                        widget_mapping['Pump Model'] = widget
+                    cascade_field = widget.cascade_field
+                    field_name = widget.field_name
+                    
+                    if cascade_field and field_name:
+                        cascade_widgets.append(widget)
+                        cascade_values[cascade_field] = widget.value
+                        widget_mapping[field_name] = widget
+                    else:
+                        # Get the widget's label by looking at the grid layout
+                        widget_label = widget.label
+                        if "Effluent Warranty" in widget_label:
+                            effluent_warranty_dropdown = widget
+                            widget_mapping['Effluent Warranty'] = widget
 
                 if progress_callback:
                     progress_callback(45, "Processing remaining dropdown widgets...")
                 
                 # Map remaining dropdown widgets based on field positions and validation data
                 remaining_widgets = []
-                for key, widget in self.data_fields.items():
-                    if (not key.startswith(sheet_name) or not isinstance(widget, QComboBox) or
-                        widget in [industry_dropdown, sub_industry_dropdown, province1_dropdown, 
-                                city1_dropdown, province2_dropdown, city2_dropdown,
-                                effluent_warranty_dropdown, pump_brand_dropdown, 
-                                pump_type_dropdown, pump_model_dropdown]):  # TAMBAHAN: Include pump dropdowns
+                for key, widget in fields.items():
+                    if (not key.startswith(sheet_name) or widget.kind != FieldSnapshot.DROPDOWN or
+                        widget is effluent_warranty_dropdown or widget in cascade_widgets):
                         continue
                     remaining_widgets.append((key, widget))
 
@@ -6776,23 +5802,14 @@ class BDUGroupView(QMainWindow):
                     if cell_key in validation_data:
                         expected_options = validation_data[cell_key]['options']
                     
-                    # TAMBAHAN: Untuk field hardcoded, gunakan options dari konstanta
+                    # TAMBAHAN: Untuk field hardcoded, gunakan options dari konstanta / cascade rules
+                    cascade_field = self.cascade_engine.cascade_field(field_name)
                     if "Effluent Warranty" in field_name:
-                        expected_options = EFFLUENT_WARRANTY_OPTIONS
-                    elif "Pump Brand" in field_name:
-                        expected_options = ["GRUNDFOS", "KSB", "XYLEM", "ITT GOULDS", "EBARA", "WILO", "FLOWREX", "CNP", "LEO"]
-                    elif "Pump Type" in field_name and pump_brand_dropdown:
-                        # Get pump type options based on selected brand
-                        selected_brand = pump_brand_dropdown.currentText()
-                        if selected_brand in PUMP_BRAND_TYPE_MAPPING:
-                            expected_options = PUMP_BRAND_TYPE_MAPPING[selected_brand]
-                    elif "Pump Model" in field_name and pump_brand_dropdown and pump_type_dropdown:
-                        # Get pump model options based on brand and type
-                        selected_brand = pump_brand_dropdown.currentText()
-                        selected_type = pump_type_dropdown.currentText()
-                        model_key = (selected_brand, selected_type)
-                        if model_key in PUMP_BRAND_TYPE_MODEL_MAPPING:
-                            expected_options = PUMP_BRAND_TYPE_MODEL_MAPPING[model_key]
+                        expected_options = reference_data.get_effluent_warranty_options()
+                    elif cascade_field in CASCADE_ROOT_OPTIONS:
+                        expected_options = CASCADE_ROOT_OPTIONS[cascade_field]()
+                    elif cascade_field:
+                        expected_options = cascade_options.get(cascade_field, [])
                     
                     # Find the best matching widget
                     best_widget = None
@@ -6804,7 +5821,7 @@ class BDUGroupView(QMainWindow):
                             continue  # Already used
                         
                         # Get widget options
-                        widget_options = [widget.itemText(i) for i in range(widget.count())]
+                        widget_options = list(widget.options)
                         # Remove placeholder options
                         clean_widget_options = [opt for opt in widget_options if not opt.startswith("-- ")]
                         
@@ -6849,10 +5866,10 @@ class BDUGroupView(QMainWindow):
                     excel_row = position_info['excel_row']
                     
                     # Get widget value
-                    value = widget.currentText()
+                    value = widget.value
                     
                     # Skip placeholder values
-                    if value == "-- Select Value --":
+                    if is_placeholder(value):
                         value = ""
                     
                     # Update Excel cell
@@ -6922,12 +5939,12 @@ class BDUGroupView(QMainWindow):
                         found_key = None
                         
                         for test_key in possible_keys:
-                            if test_key in self.data_fields:
-                                widget = self.data_fields[test_key]
-                                if (isinstance(widget, QLineEdit) and 
+                            if test_key in fields:
+                                widget = fields[test_key]
+                                if (widget.kind == FieldSnapshot.TEXT and 
                                     test_key not in [info.get('key') for info in cell_to_widget_map.values() if 'key' in info]):
                                     
-                                    placeholder = widget.placeholderText()
+                                    placeholder = widget.placeholder
                                     if placeholder:
                                         if field_id in placeholder:
                                             found_widget = widget
@@ -6957,9 +5974,9 @@ class BDUGroupView(QMainWindow):
                         field_key_0 = f"{field_base}_0"
                         field_key_1 = f"{field_base}_1"
                         
-                        if field_key_0 in self.data_fields and field_key_1 in self.data_fields:
-                            widget_0 = self.data_fields[field_key_0]
-                            widget_1 = self.data_fields[field_key_1]
+                        if field_key_0 in fields and field_key_1 in fields:
+                            widget_0 = fields[field_key_0]
+                            widget_1 = fields[field_key_1]
                             
                             cell_key_0 = f"row_{row_idx}_col_1"
                             cell_key_1 = f"row_{row_idx}_col_2"
@@ -6978,7 +5995,6 @@ class BDUGroupView(QMainWindow):
                     
                     elif field_type == 'ft_':
                         # Table item handling
-                        processed_table_items = getattr(self, '_processed_table_items', set())
                         
                         found_base_key = None
                         
@@ -6988,18 +6004,18 @@ class BDUGroupView(QMainWindow):
                             contractor_key = f"{base_key}_contractor"
                             remarks_key = f"{base_key}_remarks"
                             
-                            if (client_key in self.data_fields and 
-                                contractor_key in self.data_fields and 
-                                remarks_key in self.data_fields and
+                            if (client_key in fields and 
+                                contractor_key in fields and 
+                                remarks_key in fields and
                                 base_key not in processed_table_items):
                                 
-                                client_widget = self.data_fields[client_key]
-                                contractor_widget = self.data_fields[contractor_key]
-                                remarks_widget = self.data_fields[remarks_key]
+                                client_widget = fields[client_key]
+                                contractor_widget = fields[contractor_key]
+                                remarks_widget = fields[remarks_key]
                                 
-                                if (isinstance(client_widget, QCheckBox) and 
-                                    isinstance(contractor_widget, QCheckBox) and 
-                                    isinstance(remarks_widget, QLineEdit)):
+                                if (client_widget.kind == FieldSnapshot.CHECKBOX and 
+                                    contractor_widget.kind == FieldSnapshot.CHECKBOX and 
+                                    remarks_widget.kind == FieldSnapshot.TEXT):
                                     
                                     cell_key_client = f"row_{row_idx}_col_1"
                                     cell_key_contractor = f"row_{row_idx}_col_2"
@@ -7026,8 +6042,7 @@ class BDUGroupView(QMainWindow):
                                     found_base_key = base_key
                                     processed_table_items.add(base_key)
                                     break
-                        
-                        self._processed_table_items = processed_table_items
+
 
                 if progress_callback:
                     progress_callback(60, "Processing right column fields...")
@@ -7088,12 +6103,12 @@ class BDUGroupView(QMainWindow):
                         if field_type == 'f_':
                             # Regular input field
                             # Look for a QLineEdit with this name in the placeholder
-                            for key, widget in self.data_fields.items():
+                            for key, widget in fields.items():
                                 if not key.startswith(sheet_name):
                                     continue
                                     
-                                if isinstance(widget, QLineEdit) and key not in [info.get('key') for info in cell_to_widget_map.values() if 'key' in info]:
-                                    placeholder = widget.placeholderText()
+                                if widget.kind == FieldSnapshot.TEXT and key not in [info.get('key') for info in cell_to_widget_map.values() if 'key' in info]:
+                                    placeholder = widget.placeholder
                                     if placeholder and display_name in placeholder:
                                         target_col = col_idx + 1  # Next column
                                         cell_key = f"row_{row_idx}_col_{target_col}"
@@ -7127,14 +6142,13 @@ class BDUGroupView(QMainWindow):
                             best_widget_key = None
                             best_match_score = 0
                             
-                            for key, widget in self.data_fields.items():
+                            for key, widget in fields.items():
                                 if not key.startswith(sheet_name):
                                     continue
                                     
-                                if isinstance(widget, QComboBox) and key not in [info.get('key') for info in cell_to_widget_map.values() if 'key' in info]:
+                                if widget.kind == FieldSnapshot.DROPDOWN and key not in [info.get('key') for info in cell_to_widget_map.values() if 'key' in info]:
                                     # Skip hardcode dropdowns that are already mapped
-                                    if (widget in [industry_dropdown, sub_industry_dropdown, province1_dropdown, 
-                                                city1_dropdown, province2_dropdown, city2_dropdown]):
+                                    if widget in cascade_widgets:
                                         continue
                                     
                                     # Skip if already used in widget_mapping
@@ -7142,7 +6156,7 @@ class BDUGroupView(QMainWindow):
                                         continue
                                         
                                     # Check if widget options match
-                                    widget_options = [widget.itemText(i) for i in range(widget.count())]
+                                    widget_options = list(widget.options)
                                     # Remove placeholder option for comparison
                                     clean_widget_options = [opt for opt in widget_options if opt != "-- Select Value --"]
                                     
@@ -7188,19 +6202,19 @@ class BDUGroupView(QMainWindow):
                                 key_0 = f"{base_key}_0"
                                 key_1 = f"{base_key}_1"
                                 
-                                if key_0 in self.data_fields and key_1 in self.data_fields:
-                                    widget_0 = self.data_fields[key_0]
-                                    widget_1 = self.data_fields[key_1]
+                                if key_0 in fields and key_1 in fields:
+                                    widget_0 = fields[key_0]
+                                    widget_1 = fields[key_1]
                                     
                                     # Skip if already mapped
                                     if (key_0 in [info.get('key') for info in cell_to_widget_map.values() if 'key' in info] or
                                         key_1 in [info.get('key') for info in cell_to_widget_map.values() if 'key' in info]):
                                         continue
                                     
-                                    if isinstance(widget_0, QLineEdit) and isinstance(widget_1, QLineEdit):
+                                    if widget_0.kind == FieldSnapshot.TEXT and widget_1.kind == FieldSnapshot.TEXT:
                                         # Check if placeholders contain the display name
-                                        placeholder_0 = widget_0.placeholderText()
-                                        placeholder_1 = widget_1.placeholderText()
+                                        placeholder_0 = widget_0.placeholder
+                                        placeholder_1 = widget_1.placeholder
                                         
                                         if ((placeholder_0 and display_name in placeholder_0) or 
                                             (placeholder_1 and display_name in placeholder_1)):
@@ -7277,13 +6291,13 @@ class BDUGroupView(QMainWindow):
                     
                     placeholders = info['placeholders']
                     
-                    for key, widget in self.data_fields.items():
+                    for key, widget in fields.items():
                         for placeholder in placeholders:
                             placeholder_key = f"tdi_{placeholder}_{header_text}"
                             placeholder_key_with_row = f"tdi_{placeholder}_{header_text}_{row_idx}"
                             
-                            if (key == placeholder_key or key == placeholder_key_with_row) and isinstance(widget, QLineEdit):
-                                value = widget.text()
+                            if (key == placeholder_key or key == placeholder_key_with_row) and widget.kind == FieldSnapshot.TEXT:
+                                value = widget.value
                                 
                                 if 'placeholder_inputs' not in placeholder_widgets[cell_key]:
                                     placeholder_widgets[cell_key]['placeholder_inputs'] = {}
@@ -7318,16 +6332,16 @@ class BDUGroupView(QMainWindow):
                     col_letter = chr(64 + excel_col)
                     
                     # Get cell value based on widget type
-                    if widget_type == 'text' and isinstance(widget, QLineEdit):
-                        value = widget.text()
-                    elif widget_type == 'dropdown' and isinstance(widget, QComboBox):
+                    if widget_type == 'text' and widget.kind == FieldSnapshot.TEXT:
+                        value = widget.value
+                    elif widget_type == 'dropdown' and widget.kind == FieldSnapshot.DROPDOWN:
                         # Handle dropdown fields (including right dropdown fields)
-                        value = widget.currentText()
+                        value = widget.value
                         # Skip placeholder values
                         if value == "-- Select Value --":
                             value = ""
-                    elif widget_type == 'checkbox' and isinstance(widget, QCheckBox):
-                        value = 'ü' if widget.isChecked() else ''
+                    elif widget_type == 'checkbox' and widget.kind == FieldSnapshot.CHECKBOX:
+                        value = 'ü' if widget.checked else ''
                         target_cell = sheet.cell(row=excel_row, column=excel_col)
                         old_value = target_cell.value
                         target_cell.value = value
@@ -7423,16 +6437,16 @@ class BDUGroupView(QMainWindow):
                                 
                 # Save the workbook
                 try:
-                    wb.save(self.excel_path)
+                    wb.save(excel_path)
           
                     if progress_callback:
                         progress_callback(98, "Writing change log...")
                     
                     # Write detailed log to file for debugging
-                    log_path = os.path.join(os.path.dirname(self.excel_path), "save_changes_log.txt")
+                    log_path = os.path.join(os.path.dirname(excel_path), "save_changes_log.txt")
                     with open(log_path, 'w') as log_file:
                         log_file.write(f"Save operation at {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                        log_file.write(f"Excel file: {self.excel_path}\n")
+                        log_file.write(f"Excel file: {excel_path}\n")
                         log_file.write(f"Sheet: {sheet_name}\n")
                         log_file.write(f"Total changes: {changes_made}\n\n")
                         log_file.write("Detailed changes:\n")
@@ -7454,16 +6468,7 @@ class BDUGroupView(QMainWindow):
                     progress_callback(100, f"Error: {str(e)}")
                 return f"An error occurred while processing data: {str(e)}"
         
-        # Show loading screen for save operation
-        loading_screen = LoadingScreen(
-            parent=self,
-            title="Saving Data",
-            message=f"Saving changes to {sheet_name}..."
-        )
-        loading_screen.show()
-        loading_screen.start_loading(save_process)
-        
-        # Connect completion handler
+        # Completion handler - dipanggil JobManager di GUI thread
         def on_save_complete(success, message):
             if success and "successfully saved" in message:
                 QMessageBox.information(
@@ -7472,20 +6477,21 @@ class BDUGroupView(QMainWindow):
                     message
                 )
                 
-                # Reload the data to reflect changes - just reload the current tab
-                current_tab_index = self.tab_widget.currentIndex()
+                # Reload hanya jika view masih menampilkan workbook yang disimpan
+                if self.excel_path != excel_path:
+                    return
                 
-                # Only reload the data for the current sheet to avoid freezing
+                # Only reload the data for the saved sheet to avoid freezing
                 if sheet_name in self.sheet_tabs:
                     try:
-                        # Get the tab's scroll area and its widget
-                        scroll_area = self.tab_widget.widget(current_tab_index)
+                        # Get the saved sheet's scroll area and its widget
+                        scroll_area = self.find_sheet_scroll_area(sheet_name)
                         if isinstance(scroll_area, QScrollArea):
                             # Save scroll position
                             scroll_pos = scroll_area.verticalScrollBar().value()
                             
                             # Clear and reload just this sheet
-                            df = pd.read_excel(self.excel_path, sheet_name=sheet_name, header=None)
+                            df = pd.read_excel(excel_path, sheet_name=sheet_name, header=None)
                             
                             sheet_widget = scroll_area.widget()
                             if sheet_widget:
@@ -7515,7 +6521,42 @@ class BDUGroupView(QMainWindow):
                     message
                 )
         
-        loading_screen.worker.task_completed.connect(on_save_complete)
+        # Save mendahului job workbook lain yang masih antri
+        self.submit_job(
+            f"Save {sheet_name}",
+            save_process,
+            resource="workbook",
+            priority=PRIORITY_HIGH,
+            on_complete=on_save_complete,
+            target=excel_path
+        )
+    
+    def snapshot_form_fields(self, sheet_name):
+        """Nilai semua widget form sebagai FieldSnapshot (dipanggil di GUI thread)"""
+        fields = {}
+        for key, widget in list(self.data_fields.items()):
+            try:
+                label = ""
+                # Label hanya dipakai untuk mengenali dropdown non-cascade di sheet yang disimpan
+                if (isinstance(widget, QComboBox) and key.startswith(sheet_name)
+                        and not widget.property("cascade_field")):
+                    label = self._get_widget_label(widget)
+                snapshot = FieldSnapshot.from_widget(widget, label)
+            except RuntimeError:
+                # Widget dari tab yang sudah dibangun ulang (objek C++ sudah dihapus)
+                continue
+            if snapshot is not None:
+                fields[key] = snapshot
+        return fields
+    
+    def find_sheet_scroll_area(self, sheet_name):
+        """Scroll area tab yang menampilkan `sheet_name`, atau None"""
+        sheet_widget = self.sheet_tabs.get(sheet_name)
+        for index in range(self.tab_widget.count()):
+            scroll_area = self.tab_widget.widget(index)
+            if isinstance(scroll_area, QScrollArea) and scroll_area.widget() is sheet_widget:
+                return scroll_area
+        return None
     
     def _get_widget_label(self, widget):
         """Helper method to get the label text for a widget by looking at the grid layout"""
@@ -7579,29 +6620,17 @@ class BDUGroupView(QMainWindow):
 
     def create_data_table(self, df, layout):
         """Create a table view for DATA sheets"""
-        # Create a table widget
-        table = QTableWidget()
-        
-        # Set row and column count
-        table.setRowCount(len(df))
-        table.setColumnCount(len(df.columns))
-        
-        # Set headers - convert all column headers to strings
-        headers = [str(col) for col in df.columns.tolist()]
-        table.setHorizontalHeaderLabels(headers)
+        # Model di atas array DataFrame - cell hanya diformat saat terlihat
+        model = DataFrameTableModel(df)
         
-        # Fill data - convert all values to strings to avoid type issues
-        for row_idx, row in df.iterrows():
-            for col_idx, value in enumerate(row):
-                if pd.isna(value):
-                    item = QTableWidgetItem("")
-                else:
-                    item = QTableWidgetItem(str(value))
-                table.setItem(row_idx, col_idx, item)
+        table = QTableView()
+        table.setModel(model)
+        # Model ikut hidup selama view-nya ada
+        model.setParent(table)
         
         # Style the table
         table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 border: 1px solid #E0E0E0;
                 border-radius: 8px;
                 background-color: white;
@@ -7613,21 +6642,27 @@ class BDUGroupView(QMainWindow):
                 border: 1px solid #E0E0E0;
                 font-weight: bold;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 5px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #D6EAF8;
             }
         """)
         
-        # Resize columns to content
+        # Lebar kolom diestimasi dari sampel baris, bukan ResizeToContents per cell
         header = table.horizontalHeader()
-        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(QHeaderView.Interactive)
         header.setStretchLastSection(True)
+        for col_idx, width in enumerate(model.estimate_column_widths(table.fontMetrics())):
+            header.resizeSection(col_idx, width)
+        
+        # Tinggi baris seragam supaya view tidak perlu mengukur setiap baris
+        table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        table.verticalHeader().setDefaultSectionSize(table.fontMetrics().height() + 12)
         
         # Make it read-only for DATA sheets
-        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setEditTriggers(QTableView.NoEditTriggers)
         
         # Add to layout
         layout.addWidget(table)
@@ -7649,7 +6684,7 @@ class BDUGroupView(QMainWindow):
                 background-color: #2980B9;
             }}
         """)
-        export_btn.clicked.connect(lambda: self.export_data_table(df))
+        export_btn.clicked.connect(lambda: self.export_data_table(model))
         
         export_layout = QHBoxLayout()
         export_layout.addStretch()
@@ -7657,7 +6692,7 @@ class BDUGroupView(QMainWindow):
         
         layout.addLayout(export_layout)
         
-    def export_data_table(self, df):
+    def export_data_table(self, model):
         """Export DATA table to CSV"""
         try:
             # Ask for save location
@@ -7670,8 +6705,8 @@ class BDUGroupView(QMainWindow):
                 if not file_path.endswith('.csv'):
                     file_path += '.csv'
                 
-                # Save the dataframe
-                df.to_csv(file_path, index=False)
+                # Stream rows from the table model
+                model.export_csv(file_path)
                 
                 # Show success message
                 QMessageBox.information(self, "Success", f"Data exported successfully to {file_path}")
@@ -7682,6 +6717,10 @@ class BDUGroupView(QMainWindow):
     def closeEvent(self, event):
         """Cleanup on close"""
         try:
+            # Hentikan parsing / prefetch yang masih berjalan
+            self.workbook_loader.cancel()
+            self.stop_tab_prefetch()
+            
             # Cleanup formula evaluator
             if hasattr(self, 'formula_evaluator') and self.formula_evaluator:
                 self.formula_evaluator.close()
@@ -26,7 +26,7 @@ class BDUGroupView(OriginalBDUGroupView):
                             "data", "customers")
         
         # Import the clean_folder_name function to handle special characters
-        from modules.fix_customer_system import clean_folder_name
+        from modules.customer_index import clean_folder_name
         
         # Create a valid folder name from the customer name
         valid_folder_name = clean_folder_name(self.customer_name)
@@ -0,0 +1,168 @@
+# views/cascade_dropdowns.py - Engine dropdown bertingkat (parent -> child) untuk form DIP
+
+from PyQt5 import QtGui
+from PyQt5.QtCore import Qt, QStringListModel
+
+PLACEHOLDER_SELECT = "-- Select Value --"
+
+
+def is_placeholder(text):
+    """Check apakah teks adalah placeholder dropdown seperti '-- Select Value --'"""
+    return not text or (text.startswith("-- ") and text.endswith(" --"))
+
+
+class OptionListModel(QStringListModel):
+    """Immutable option list shared by every combo box showing the same parent key.
+
+    Baris pertama yang berupa placeholder ditampilkan abu-abu dan italic,
+    sama seperti setItemData yang dulu dipasang ulang setiap kali dropdown diisi.
+    """
+
+    def __init__(self, options, enabled=True, parent=None):
+        super().__init__(list(options), parent)
+        self.enabled = enabled
+        self._placeholder_font = QtGui.QFont("Segoe UI", 10, QtGui.QFont.StyleItalic)
+        self._placeholder_color = QtGui.QColor("#999999")
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and index.row() == 0 and role in (Qt.ForegroundRole, Qt.FontRole):
+            text = super().data(index, Qt.DisplayRole)
+            if is_placeholder(text):
+                return self._placeholder_color if role == Qt.ForegroundRole else self._placeholder_font
+        return super().data(index, role)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def setData(self, index, value, role=Qt.EditRole):
+        return False
+
+    def options(self):
+        """Pilihan sebenarnya, tanpa placeholder"""
+        return [text for text in self.stringList() if not is_placeholder(text)]
+
+
+class CascadeRule:
+    """Declarative parent -> child dependency between dropdown fields.
+
+    `options` menerima nilai parent (urut sesuai `parents`) dan mengembalikan
+    list pilihan, atau None jika tidak ada mapping untuk kombinasi tersebut.
+    `not_applicable` (opsional) mengembalikan True jika child tidak berlaku
+    untuk nilai parent tersebut, sehingga child dinonaktifkan.
+    """
+
+    def __init__(self, name, parents, child, options, waiting_text,
+                 missing_text=PLACEHOLDER_SELECT, disable_when_missing=False,
+                 not_applicable=None, not_applicable_text="-- Not Required for this Brand --",
+                 parent_keys=None):
+        self.name = name
+        self.parents = tuple(parents)
+        self.child = child
+        self.options = options
+        self.waiting_text = waiting_text
+        self.missing_text = missing_text
+        self.disable_when_missing = disable_when_missing
+        self.not_applicable = not_applicable
+        self.not_applicable_text = not_applicable_text
+        self.parent_keys = parent_keys
+
+
+class CascadeEngine:
+    """Resolve and cache one OptionListModel per (rule, parent values) key.
+
+    Saat parent berubah, child cukup diganti model-nya (setModel) - item
+    tidak dibangun ulang dan data placeholder tidak dipasang ulang.
+    """
+
+    def __init__(self, rules, field_resolver):
+        self.rules = list(rules)
+        self.field_resolver = field_resolver
+        self._rules_by_child = {rule.child: rule for rule in self.rules}
+        self._models = {}
+
+    def cascade_field(self, field_name):
+        """Nama field kanonik jika field ikut dalam salah satu rule, selain itu None"""
+        return self.field_resolver(field_name)
+
+    def rule_for_child(self, cascade_field):
+        return self._rules_by_child.get(cascade_field)
+
+    def precompute(self):
+        """Bangun semua model yang parent key-nya bisa dienumerasi"""
+        for rule in self.rules:
+            if rule.parent_keys is None:
+                continue
+            for parent_values in rule.parent_keys():
+                self.model_for(rule, parent_values)
+
+    def model_for(self, rule, parent_values):
+        """Return the cached model for `rule` given the parents' current values"""
+        parent_values = tuple(parent_values)
+        cache_key = (rule.name,) + parent_values
+
+        model = self._models.get(cache_key)
+        if model is None:
+            model = self._build_model(rule, parent_values)
+            self._models[cache_key] = model
+        return model
+
+    def _build_model(self, rule, parent_values):
+        if rule.not_applicable and parent_values and rule.not_applicable(*parent_values):
+            return OptionListModel([rule.not_applicable_text], enabled=False)
+
+        if any(is_placeholder(value) for value in parent_values):
+            return OptionListModel([rule.waiting_text])
+
+        options = rule.options(*parent_values)
+        if options:
+            return OptionListModel([PLACEHOLDER_SELECT] + list(options))
+
+        return OptionListModel([rule.missing_text], enabled=not rule.disable_when_missing)
+
+    def options_for_field(self, cascade_field, values):
+        """Pilihan valid untuk child field berdasarkan nilai parent di `values`"""
+        rule = self.rule_for_child(cascade_field)
+        if rule is None:
+            return []
+        parent_values = tuple(values.get(parent, "") for parent in rule.parents)
+        return self.model_for(rule, parent_values).options()
+
+    def apply(self, rule, combos):
+        """Swap the child's model to match the parents' current text"""
+        child = combos[rule.child]
+        parent_values = tuple(combos[parent].currentText() for parent in rule.parents)
+        model = self.model_for(rule, parent_values)
+
+        if child.model() is not model:
+            child.setModel(model)
+            child.setCurrentIndex(0)
+        child.setEnabled(model.enabled)
+
+    def bind(self, combos, saved_values=None):
+        """Wire every rule whose fields are all present in `combos`.
+
+        `combos` berisi {cascade_field: QComboBox} untuk satu sheet dan
+        `saved_values` berisi nilai tersimpan di Excel untuk child field.
+        Rule diproses berurutan sehingga child tingkat dua (mis. Pump Model)
+        melihat nilai parent yang sudah dipulihkan.
+        """
+        saved_values = saved_values or {}
+
+        for rule in self.rules:
+            if rule.child not in combos or any(parent not in combos for parent in rule.parents):
+                continue
+
+            for parent in rule.parents:
+                combos[parent].currentTextChanged.connect(
+                    lambda _text, rule=rule: self.apply(rule, combos))
+
+            # Isi awal child dan pulihkan nilai yang tersimpan
+            self.apply(rule, combos)
+            saved_value = saved_values.get(rule.child)
+            if saved_value and not is_placeholder(saved_value):
+                child = combos[rule.child]
+                index = child.findText(saved_value)
+                if index >= 0:
+                    child.setCurrentIndex(index)
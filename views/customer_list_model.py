@@ -0,0 +1,76 @@
+# views/customer_list_model.py - Model list hasil pencarian customer untuk QListView
+
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QVariant
+
+
+class CustomerListModel(QAbstractListModel):
+    """Model di atas array id hasil CustomerSearchIndex.
+
+    Mengganti hasil hanya menukar referensi array (O(1)); nama, ikon dan
+    tooltip dihitung di data() sehingga hanya baris yang terlihat yang
+    pernah menyentuh index workspace customer.
+    """
+
+    def __init__(self, has_workspace, icon, parent=None):
+        super().__init__(parent)
+        self._has_workspace = has_workspace
+        self._icon = icon
+        self._names = []
+        self._ids = []
+
+    def set_results(self, names, ids):
+        """Tampilkan `ids` (posisi di `names`) sesuai urutan ranking"""
+        self.beginResetModel()
+        self._names = names
+        self._ids = ids
+        self.endResetModel()
+
+    def refresh_decorations(self):
+        """Ikon/tooltip berubah (index workspace di-update) - view hanya repaint baris terlihat"""
+        if self._ids:
+            self.dataChanged.emit(self.index(0), self.index(len(self._ids) - 1),
+                                  [Qt.DecorationRole, Qt.ToolTipRole])
+
+    def customer_at(self, row):
+        if 0 <= row < len(self._ids):
+            return self._names[self._ids[row]]
+        return None
+
+    def row_of(self, customer_name):
+        """Baris customer di hasil saat ini, atau -1"""
+        for row, customer_id in enumerate(self._ids):
+            if self._names[customer_id] == customer_name:
+                return row
+        return -1
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+
+        customer = self.customer_at(index.row())
+        if customer is None:
+            return QVariant()
+
+        if role == Qt.DisplayRole:
+            return customer
+        if role == Qt.DecorationRole:
+            # Indikator customer yang sudah punya file BDU
+            if self._has_workspace(customer):
+                return self._icon
+            return QVariant()
+        if role == Qt.ToolTipRole:
+            if self._has_workspace(customer):
+                return "Customer has existing BDU file"
+            return QVariant()
+
+        return QVariant()
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
@@ -6,39 +6,23 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QFrame, QGridLayout, QSpacerItem,
                              QSizePolicy, QScrollArea, QApplication, QMenu, QAction,
-                             QLineEdit, QListWidget, QListWidgetItem, QMessageBox, QProgressDialog)
+                             QLineEdit, QListView, QMessageBox, QFileDialog, QProgressDialog)
 from PyQt5.QtGui import QPixmap, QIcon, QFont, QColor, QPalette, QCursor
-from PyQt5.QtCore import Qt, QSize, pyqtSignal, QPoint, QTimer
+from PyQt5.QtCore import Qt, QSize, pyqtSignal, QPoint, QTimer, QFileSystemWatcher
 
 # Import local modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import APP_NAME, APP_LOGO, DEPARTMENTS, PRIMARY_COLOR, SECONDARY_COLOR, BG_COLOR
 from views.loading_screen import LoadingScreen, QuickLoadingDialog, show_loading_dialog
-
-import pandas as pd
-
-def clean_folder_name(name):
-    """
-    Create a valid Windows folder name by:
-    1. Removing trailing whitespace and newlines
-    2. Replacing invalid characters with underscores
-    3. Ensuring name isn't too long for Windows paths
-    """
-    # Trim whitespace and newlines
-    name = name.strip()
-    
-    # Replace invalid Windows filename characters: \ / : * ? " < > |
-    name = re.sub(r'[\\/:*?"<>|\t\n\r]', '_', name)
-    
-    # Replace multiple consecutive underscores with a single one
-    name = re.sub(r'_+', '_', name)
-    
-    # Limit the length to avoid path too long errors (Windows MAX_PATH is 260)
-    # Use a reasonable limit like 100 chars for the folder name
-    if len(name) > 100:
-        name = name[:97] + '...'
-    
-    return name
+from views.job_manager import get_job_manager
+from views.jobs_panel import JobsPanel
+from views.customer_list_model import CustomerListModel
+from modules.workbook_cache import get_workbook_cache
+from modules.customer_index import clean_folder_name, get_customer_index
+from modules.customer_search_index import CustomerSearchIndex
+from modules.customer_store import get_customer_store
+from modules.workspace_template import instantiate_workspace
+from modules.customer_onboarding import onboard_customers
 
 class CustomerSearchView(QMainWindow):
     """View untuk pencarian customer sebelum akses ke BDU View"""
@@ -52,12 +36,12 @@ class CustomerSearchView(QMainWindow):
         self.auth_manager = auth_manager
         self.current_user = auth_manager.get_current_user()
         self.customers_data = []
-        self.filtered_customers = []
+        self.filtered_ids = []
+        self.search_index = CustomerSearchIndex([])
         self.selected_customer = None
         
-        # Path to customer database
-        self.db_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-                                 "data", "database_customer.xlsx")
+        # Database customer (SQLite, database_customer.xlsx di-import otomatis)
+        self.customer_store = None
                                  
         # Path to SET_BDU template
         self.template_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
@@ -71,7 +55,18 @@ class CustomerSearchView(QMainWindow):
         if not os.path.exists(self.customers_base_path):
             os.makedirs(self.customers_base_path)
         
+        # Index workspace customer: satu scandir, lalu di-update oleh watcher
+        self.customer_index = get_customer_index(self.customers_base_path)
+        self.customer_index.refresh()
+        self.setup_customer_watcher()
+        
         self.initUI()
+        
+        # Panel job background (registrasi customer) - muncul saat ada job
+        self.jobs_panel = JobsPanel(self)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.jobs_panel)
+        self.jobs_panel.hide()
+        
         self.load_customer_data()
     
     def initUI(self):
@@ -174,31 +169,39 @@ class CustomerSearchView(QMainWindow):
         
         search_box_layout.addWidget(self.search_input)
         
-        # Results list
-        self.results_list = QListWidget()
+        # Results list - model di atas array id hasil pencarian (baris dibuat sesuai yang terlihat)
+        self.results_model = CustomerListModel(
+            self.check_customer_bdu_file_exists,
+            self.style().standardIcon(QtWidgets.QStyle.SP_FileIcon),
+            self
+        )
+        self.results_list = QListView()
+        self.results_list.setModel(self.results_model)
+        self.results_list.setUniformItemSizes(True)
+        self.results_list.setEditTriggers(QListView.NoEditTriggers)
         self.results_list.setMinimumHeight(300)  # Make sure list is visible
         self.results_list.setFont(QFont("Segoe UI", 12))
         self.results_list.setStyleSheet("""
-            QListWidget {
+            QListView {
                 border: 1px solid #ccc;
                 border-radius: 5px;
                 padding: 5px;
                 background-color: white;
             }
-            QListWidget::item {
+            QListView::item {
                 padding: 10px;
                 border-bottom: 1px solid #eee;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #e0f0ff;
                 color: #333;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #f0f0f0;
             }
         """)
-        self.results_list.itemClicked.connect(self.on_customer_selected)
-        self.results_list.itemDoubleClicked.connect(self.on_customer_double_clicked)
+        self.results_list.clicked.connect(self.on_customer_selected)
+        self.results_list.doubleClicked.connect(self.on_customer_double_clicked)
         
         search_box_layout.addWidget(self.results_list)
         
@@ -236,6 +239,25 @@ class CustomerSearchView(QMainWindow):
         """)
         self.register_btn.clicked.connect(self.register_new_customer)
         
+        # Import customer massal dari CSV/XLSX (mis. leads dari pameran)
+        self.import_btn = QPushButton("Import Customers...")
+        self.import_btn.setFont(QFont("Segoe UI", 12))
+        self.import_btn.setMinimumHeight(40)
+        self.import_btn.setCursor(Qt.PointingHandCursor)
+        self.import_btn.setStyleSheet(f"""
+            QPushButton {{
+                background-color: white;
+                color: {SECONDARY_COLOR};
+                border: 1px solid {SECONDARY_COLOR};
+                border-radius: 5px;
+                padding: 8px 15px;
+            }}
+            QPushButton:hover {{
+                background-color: #eaf4fc;
+            }}
+        """)
+        self.import_btn.clicked.connect(self.import_customers)
+        
         # Continue button (disabled initially)
         self.continue_btn = QPushButton("Continue to BDU Form")
         self.continue_btn.setFont(QFont("Segoe UI", 12, QFont.Bold))
@@ -262,6 +284,7 @@ class CustomerSearchView(QMainWindow):
         
         buttons_layout.addStretch()
         buttons_layout.addWidget(self.register_btn)
+        buttons_layout.addWidget(self.import_btn)
         buttons_layout.addWidget(self.continue_btn)
         
         search_layout.addLayout(buttons_layout)
@@ -369,37 +392,70 @@ class CustomerSearchView(QMainWindow):
         # Show menu at button position
         menu.exec_(sender.mapToGlobal(QPoint(0, sender.height())))
     
+    def setup_customer_watcher(self):
+        """Pantau folder customers supaya index tetap sinkron tanpa scan per keystroke"""
+        self._changed_folders = set()
+        self._rescan_all = False
+        
+        self.customer_watcher = QFileSystemWatcher(self)
+        self.customer_watcher.addPath(self.customers_base_path)
+        folder_paths = [os.path.join(self.customers_base_path, name) for name in self.customer_index.folder_names()]
+        if folder_paths:
+            self.customer_watcher.addPaths(folder_paths)
+        self.customer_watcher.directoryChanged.connect(self.on_customer_directory_changed)
+        
+        # Event watcher digabung - satu update index per burst perubahan
+        self.index_update_timer = QTimer(self)
+        self.index_update_timer.setSingleShot(True)
+        self.index_update_timer.setInterval(200)
+        self.index_update_timer.timeout.connect(self.apply_customer_index_changes)
+    
+    def on_customer_directory_changed(self, path):
+        """Catat folder yang berubah; diproses setelah debounce"""
+        if os.path.normcase(os.path.abspath(path)) == os.path.normcase(os.path.abspath(self.customers_base_path)):
+            self._rescan_all = True
+        else:
+            self._changed_folders.add(os.path.basename(path))
+        self.index_update_timer.start()
+    
+    def apply_customer_index_changes(self):
+        """Update index dari event watcher lalu refresh ikon list (tanpa akses filesystem per item)"""
+        if self._rescan_all:
+            self.customer_index.refresh()
+            watched = set(self.customer_watcher.directories())
+            new_paths = [os.path.join(self.customers_base_path, name) for name in self.customer_index.folder_names()]
+            new_paths = [path for path in new_paths if path not in watched]
+            if new_paths:
+                self.customer_watcher.addPaths(new_paths)
+        else:
+            for folder_name in self._changed_folders:
+                self.customer_index.refresh_folder(folder_name)
+        
+        self._changed_folders = set()
+        self._rescan_all = False
+        self.results_model.refresh_decorations()
+    
     def go_back_to_dashboard(self):
         """Go back to dashboard"""
+        get_workbook_cache().cancel_prefetch()
         self.back_to_dashboard.emit()
         self.close()
     
     def load_customer_data(self):
-        """Load customer data from database_customer.xlsx"""
+        """Load customer names from the customer store"""
         try:
-            if os.path.exists(self.db_path):
-                # Load the Excel file
-                df = pd.read_excel(self.db_path)
-                
-                # Get list of customer names from the 'Company Name' column
-                if 'Company Name' in df.columns:
-                    self.customers_data = df['Company Name'].dropna().unique().tolist()
-                    self.customers_data.sort()  # Sort alphabetically
-                    
-                    # Show all customers initially
-                    self.filtered_customers = self.customers_data.copy()
-                    self.update_results_list()
-                    
-                    # Update status message
-                    self.statusBar().showMessage(f"Loaded {len(self.customers_data)} customers from database")
-                else:
-                    self.statusBar().showMessage("Error: 'Company Name' column not found in customer database")
-                    self.no_results_label.setText("Error: 'Company Name' column not found in database")
-                    self.no_results_label.setVisible(True)
-            else:
-                self.statusBar().showMessage(f"Customer database not found: {self.db_path}")
-                self.no_results_label.setText("Customer database file not found")
-                self.no_results_label.setVisible(True)
+            self.customer_store = get_customer_store()
+            # Ambil perubahan jika database_customer.xlsx diedit di luar aplikasi
+            self.customer_store.sync_from_xlsx()
+            self.customers_data = self.customer_store.list_names()
+            self.search_index = CustomerSearchIndex(self.customers_data)
+            
+            # Show all customers initially
+            self.filtered_ids = self.search_index.all_ids
+            self.update_results_list()
+            
+            # Update status message
+            self.statusBar().showMessage(f"Loaded {len(self.customers_data)} customers from database")
         except Exception as e:
             self.statusBar().showMessage(f"Error loading customer data: {str(e)}")
             self.no_results_label.setText(f"Error loading customer database: {str(e)}")
@@ -414,37 +470,18 @@ class CustomerSearchView(QMainWindow):
     
     def perform_search(self):
         """Perform the actual search after delay"""
-        search_text = self.search_input.text().strip().lower()
-        
-        if not search_text:
-            # Show all customers if search is empty
-            self.filtered_customers = self.customers_data.copy()
-        else:
-            # Filter customers that start with or contain the search text
-            self.filtered_customers = [
-                customer for customer in self.customers_data 
-                if search_text in customer.lower()
-            ]
+        # Index: exact > prefix > awal kata > substring > fuzzy (salah ketik)
+        self.filtered_ids = self.search_index.search(self.search_input.text())
         
         # Update the results list
         self.update_results_list()
     
     def update_results_list(self):
         """Update the results list with filtered customers"""
-        self.results_list.clear()
+        # Hanya menukar array id - ikon/tooltip dihitung model untuk baris yang terlihat
+        self.results_model.set_results(self.search_index.names, self.filtered_ids)
         
-        if self.filtered_customers:
-            # Add filtered customers to list
-            for customer in self.filtered_customers:
-                item = QListWidgetItem(customer)
-                
-                # Check if customer has existing BDU file and add icon indicator
-                if self.check_customer_bdu_file_exists(customer):
-                    item.setIcon(self.style().standardIcon(QtWidgets.QStyle.SP_FileIcon))
-                    item.setToolTip(f"Customer has existing BDU file")
-                
-                self.results_list.addItem(item)
-            
+        if self.filtered_ids:
             # Hide no results message
             self.no_results_label.setVisible(False)
         else:
@@ -456,9 +493,19 @@ class CustomerSearchView(QMainWindow):
             
             self.no_results_label.setVisible(True)
     
-    def on_customer_selected(self, item):
+    def select_customer_in_list(self, customer_name):
+        """Select baris customer di hasil saat ini; False jika tidak ada"""
+        row = self.results_model.row_of(customer_name)
+        if row < 0:
+            return False
+        index = self.results_model.index(row)
+        self.results_list.setCurrentIndex(index)
+        self.results_list.scrollTo(index)
+        return True
+    
+    def on_customer_selected(self, index):
         """Handle customer selection from the list"""
-        self.selected_customer = item.text()
+        self.selected_customer = self.results_model.customer_at(index.row())
         self.continue_btn.setEnabled(True)
         
         # Check if customer file exists and update status bar
@@ -467,14 +514,17 @@ class CustomerSearchView(QMainWindow):
         
         if file_exists:
             status_message += " (existing BDU file will be opened)"
+            # Mulai parsing workbook customer sekarang; dibatalkan jika pilihan berubah
+            get_workbook_cache().prefetch(self.get_customer_bdu_file_path(self.selected_customer))
         else:
+            get_workbook_cache().cancel_prefetch()
             status_message += " (new BDU file will be created)"
             
         self.statusBar().showMessage(status_message)
     
-    def on_customer_double_clicked(self, item):
+    def on_customer_double_clicked(self, index):
         """Handle customer double click (select and continue)"""
-        self.selected_customer = item.text()
+        self.selected_customer = self.results_model.customer_at(index.row())
         self.continue_to_bdu()
     
     def register_new_customer(self):
@@ -486,21 +536,20 @@ class CustomerSearchView(QMainWindow):
             QMessageBox.warning(self, "Input Required", "Please enter a customer name to register")
             return
         
-        # Check if customer already exists
-        if new_customer in self.customers_data:
+        # Check if customer already exists (nama dinormalisasi, mis. "PT. ABC" = "pt abc")
+        existing = get_customer_store().get(new_customer)
+        if existing:
+            existing_name = existing.get('Company Name', new_customer)
             QMessageBox.information(
                 self, 
                 "Customer Exists", 
-                f"Customer '{new_customer}' already exists in the database.\n\nPlease select it from the list."
+                f"Customer '{existing_name}' already exists in the database.\n\nPlease select it from the list."
             )
             
             # Find and select that customer in the list
-            for i in range(self.results_list.count()):
-                if self.results_list.item(i).text() == new_customer:
-                    self.results_list.setCurrentRow(i)
-                    self.selected_customer = new_customer
-                    self.continue_btn.setEnabled(True)
-                    break
+            if self.select_customer_in_list(existing_name):
+                self.selected_customer = existing_name
+                self.continue_btn.setEnabled(True)
         else:
             # Confirm registration
             reply = QMessageBox.question(
@@ -512,7 +561,7 @@ class CustomerSearchView(QMainWindow):
             )
             
             if reply == QMessageBox.Yes:
-                # Show loading screen for registration process
+                # Registrasi dijalankan sebagai job background (antrian workbook)
                 def register_customer_process(progress_callback=None):
                     try:
                         if progress_callback:
@@ -527,45 +576,33 @@ class CustomerSearchView(QMainWindow):
                         # Add new customer to the database if it exists
                         self.add_customer_to_database(new_customer)
                         
-                        if progress_callback:
-                            progress_callback(80, "Updating customer list...")
-                        
-                        # Add new customer to temporary list
-                        self.customers_data.append(new_customer)
-                        self.filtered_customers.append(new_customer)
-                        
                         if progress_callback:
                             progress_callback(100, "Customer registration completed!")
                         
-                        return True
+                        return f"Customer '{new_customer}' registered"
                     except Exception as e:
                         if progress_callback:
                             progress_callback(100, f"Error: {str(e)}")
-                        return False
+                        raise
                 
-                # Show loading screen
-                loading_screen = LoadingScreen(
-                    parent=self,
-                    title="Registering Customer",
-                    message=f"Setting up new customer: {new_customer}"
-                )
-                loading_screen.show()
-                loading_screen.start_loading(register_customer_process)
-                
-                # Connect completion handler
+                # Completion handler - dipanggil JobManager di GUI thread
                 def on_registration_complete(success, message):
                     if success:
+                        # List customer hanya diubah di GUI thread
+                        if new_customer not in self.customers_data:
+                            self.customers_data.append(new_customer)
+                            self.customers_data.sort()
+                            # Index di-update incremental, tidak dibangun ulang
+                            self.search_index.add(new_customer)
+                        
                         # Set as selected customer and enable continue
                         self.selected_customer = new_customer
                         self.continue_btn.setEnabled(True)
                         
-                        self.update_results_list()
+                        self.perform_search()
                         
                         # Find and select the new customer in the list
-                        for i in range(self.results_list.count()):
-                            if self.results_list.item(i).text() == new_customer:
-                                self.results_list.setCurrentRow(i)
-                                break
+                        self.select_customer_in_list(new_customer)
                         
                         self.statusBar().showMessage(f"New customer '{new_customer}' registered and added to database")
                         
@@ -577,33 +614,76 @@ class CustomerSearchView(QMainWindow):
                     else:
                         QMessageBox.critical(self, "Registration Failed", f"Failed to register customer: {message}")
                 
-                loading_screen.worker.task_completed.connect(on_registration_complete)
+                get_job_manager().submit(
+                    f"Register customer - {new_customer}",
+                    register_customer_process,
+                    resource="workbook",
+                    on_complete=on_registration_complete
+                )
+                self.statusBar().showMessage(f"Registering '{new_customer}' in background...", 3000)
+    
+    def import_customers(self):
+        """Import customer massal dari CSV/XLSX sebagai job background"""
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Import Customers", "", "Customer files (*.csv *.xlsx);;CSV files (*.csv);;Excel files (*.xlsx)"
+        )
+        if not path:
+            return
+        
+        reports = []
+        
+        def import_process(progress_callback=None):
+            report = onboard_customers(path, template_path=self.template_path,
+                                       customers_dir=self.customers_base_path,
+                                       progress_callback=progress_callback)
+            reports.append(report)
+            return report.summary()
+        
+        # Completion handler - dipanggil JobManager di GUI thread
+        def on_import_complete(success, message):
+            if not success:
+                QMessageBox.critical(self, "Import Failed", f"Failed to import customers:\n\n{message}")
+                return
+            
+            report = reports[0]
+            self.load_customer_data()
+            self.customer_index.refresh()
+            self.results_model.refresh_decorations()
+            
+            details = message
+            report_path = os.path.splitext(path)[0] + "_import_report.csv"
+            try:
+                report.write_csv(report_path)
+                details += f"\n\nPer-row results: {report_path}"
+            except Exception as e:
+                print(f"Error writing import report: {str(e)}")
+            
+            errors = report.errors()
+            if errors:
+                details += "\n\nErrors:\n" + "\n".join(
+                    f"Row {row.row_number} ({row.company_name or '-'}): {row.message}" for row in errors[:10]
+                )
+                if len(errors) > 10:
+                    details += f"\n... and {len(errors) - 10} more"
+                QMessageBox.warning(self, "Import Finished With Errors", details)
+            else:
+                QMessageBox.information(self, "Import Complete", details)
+        
+        get_job_manager().submit(
+            f"Import customers - {os.path.basename(path)}",
+            import_process,
+            resource="workbook",
+            on_complete=on_import_complete
+        )
+        self.statusBar().showMessage(f"Importing customers from {os.path.basename(path)} in background...", 3000)
     
     def add_customer_to_database(self, customer_name):
-        """Add new customer to database_customer.xlsx"""
+        """Add new customer to the customer store (single indexed insert)"""
         try:
-            if os.path.exists(self.db_path):
-                # Load existing database
-                df = pd.read_excel(self.db_path)
-                
-                # Check if 'Company Name' column exists
-                if 'Company Name' in df.columns:
-                    # Create a new row for the customer
-                    new_row = pd.DataFrame({
-                        'Company Name': [customer_name]
-                    })
-                    
-                    # Fill other columns with empty values if they exist
-                    for col in df.columns:
-                        if col != 'Company Name':
-                            new_row[col] = ""
-                    
-                    # Append to the dataframe
-                    df = pd.concat([df, new_row], ignore_index=True)
-                    
-                    # Save back to Excel
-                    df.to_excel(self.db_path, index=False)
-                    print(f"Added customer '{customer_name}' to database")
+            if get_customer_store().add(customer_name):
+                print(f"Added customer '{customer_name}' to database")
+            else:
+                print(f"Customer '{customer_name}' already exists in database")
         except Exception as e:
             print(f"Error adding customer to database: {str(e)}")
             # Don't show error to user, just log it - customer can still be used
@@ -630,13 +710,12 @@ class CustomerSearchView(QMainWindow):
         return os.path.join(folder_path, "SET_BDU.xlsx")
     
     def check_customer_bdu_file_exists(self, customer_name):
-        """Check if the customer's SET_BDU.xlsx file already exists"""
+        """Check if the customer's SET_BDU.xlsx file already exists (in-memory index lookup)"""
         # Validate input - make sure customer_name is a string
         if not isinstance(customer_name, str):
             raise TypeError(f"Customer name must be a string, got {type(customer_name)}")
             
-        file_path = self.get_customer_bdu_file_path(customer_name)
-        return os.path.exists(file_path)
+        return self.customer_index.has_bdu_file(customer_name)
     
     def create_customer_bdu_file(self, customer_name, progress_callback=None):
         """Create a copy of SET_BDU.xlsx for the customer if it doesn't exist"""
@@ -661,10 +740,25 @@ class CustomerSearchView(QMainWindow):
             if not customer_data:
                 print(f"Warning: Could not find detailed data for customer '{customer_name}' in database")
             
+            # Fast path: sel customer di-stamp langsung ke XML template terkompilasi
+            values = dict(customer_data or {})
+            values['Company Name'] = customer_name
+            try:
+                if progress_callback:
+                    progress_callback(50, "Creating workspace from compiled template...")
+                if instantiate_workspace(self.template_path, customer_file_path, values):
+                    if progress_callback:
+                        progress_callback(100, "Customer file created successfully!")
+                    self.customer_index.refresh_folder(clean_folder_name(customer_name))
+                    return customer_file_path
+            except Exception as e:
+                print(f"Error creating workspace from compiled template, falling back to openpyxl: {str(e)}")
+            
             if progress_callback:
                 progress_callback(30, "Copying template file...")
             
             # Copy the template file to the customer folder
+            os.makedirs(os.path.dirname(customer_file_path), exist_ok=True)
             shutil.copy2(self.template_path, customer_file_path)
             
             if progress_callback:
@@ -741,41 +835,20 @@ class CustomerSearchView(QMainWindow):
                 traceback.print_exc()
                 # Continue anyway - the file was copied
             
+            # Index langsung diperbarui, tidak menunggu event watcher
+            self.customer_index.refresh_folder(clean_folder_name(customer_name))
+            
             return customer_file_path
             
         except Exception as e:
             raise Exception(f"Error creating customer BDU file: {str(e)}")
 
     def get_customer_data_from_database(self, customer_name):
-        """Retrieve all customer data from database_customer.xlsx"""
+        """Retrieve all customer data from the customer store"""
         try:
-            if not os.path.exists(self.db_path):
-                print(f"Customer database not found: {self.db_path}")
-                return {}
-                
-            # Load the database
-            df = pd.read_excel(self.db_path)
-            
-            # Find the customer row
-            customer_rows = df[df['Company Name'] == customer_name]
-            if customer_rows.empty:
+            customer_data = get_customer_store().get(customer_name)
+            if not customer_data:
                 print(f"Customer '{customer_name}' not found in database")
-                return {}
-                
-            # Get the first matching row (in case of duplicates)
-            customer_row = customer_rows.iloc[0]
-            
-            # Convert the row to a dictionary
-            customer_data = customer_row.to_dict()
-            
-            # Clean up the data - handle NaN values
-            for key, value in customer_data.items():
-                if pd.isna(value):
-                    customer_data[key] = ""
-                elif not isinstance(value, str):
-                    # Convert numeric values to strings
-                    customer_data[key] = str(value)
-                    
             return customer_data
             
         except Exception as e:
@@ -835,8 +908,7 @@ class CustomerSearchView(QMainWindow):
         def on_preparation_complete(success, message):
             if success:
                 # Signal to open BDU view with selected customer
-                QTimer.singleShot(300, lambda: self.open_bdu_view.emit(self.selected_customer))
-                self.close()
+                self.open_bdu_view.emit(self.selected_customer)
             else:
                 error_msg = message if "Error:" in message else f"An error occurred while preparing the customer file:\n\n{message}"
                 QMessageBox.critical(self, "Error", error_msg)
@@ -183,7 +183,7 @@ class DashboardView(QMainWindow):
             )
             
             # If user doesn't have access, make it look disabled
-            if dept_id not in self.accessible_depts:
+            if not self.auth_manager.has_access(dept_id):
                 dept_card.setEnabled(False)
                 dept_card.setStyleSheet("""
                     background-color: rgba(240, 240, 240, 0.5);
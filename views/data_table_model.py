@@ -0,0 +1,114 @@
+# views/data_table_model.py - Model tabel read-only di atas DataFrame untuk sheet DATA_
+
+import csv
+import math
+
+import pandas as pd
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QVariant
+
+
+class DataFrameTableModel(QAbstractTableModel):
+    """
+    Model tabel read-only yang membaca langsung array kolom DataFrame.
+
+    Nilai hanya diformat saat view meminta cell yang terlihat, jadi tidak ada
+    satu item Qt pun yang dibuat per cell.
+    """
+
+    def __init__(self, df, parent=None):
+        super().__init__(parent)
+        self._headers = [str(col) for col in df.columns.tolist()]
+        # Satu array NumPy per kolom supaya dtype numerik tidak di-upcast ke object
+        self._columns = [df.iloc[:, col_idx].to_numpy() for col_idx in range(df.shape[1])]
+        self._row_count = len(df)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._columns)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return QVariant()
+
+        if role == Qt.DisplayRole or role == Qt.ToolTipRole:
+            return self.format_value(self._columns[index.column()][index.row()])
+
+        return QVariant()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return QVariant()
+
+        if orientation == Qt.Horizontal:
+            if 0 <= section < len(self._headers):
+                return self._headers[section]
+            return QVariant()
+
+        return str(section + 1)
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    @staticmethod
+    def format_value(value):
+        """Format satu nilai cell, sama seperti QTableWidget lama"""
+        if pd.isna(value):
+            return ""
+        return str(value)
+
+    def headers(self):
+        return list(self._headers)
+
+    def iter_rows(self):
+        """Baris yang sudah diformat satu per satu (untuk export streaming)"""
+        for row_idx in range(self._row_count):
+            yield [self.format_value(column[row_idx]) for column in self._columns]
+
+    def sample_rows(self, sample_size=200):
+        """Index baris yang tersebar di seluruh tabel untuk estimasi lebar kolom"""
+        if self._row_count <= sample_size:
+            return range(self._row_count)
+
+        # Ambil baris awal (yang langsung terlihat) ditambah sampel merata sisanya
+        head = list(range(min(50, self._row_count)))
+        step = max(1, math.ceil(self._row_count / (sample_size - len(head))))
+        return head + list(range(len(head), self._row_count, step))
+
+    def estimate_column_widths(self, font_metrics, sample_size=200, padding=24, max_width=400):
+        """Estimasi lebar kolom dari sampel, bukan dengan mengukur setiap cell"""
+        rows = self.sample_rows(sample_size)
+        widths = []
+
+        for col_idx, column in enumerate(self._columns):
+            width = font_metrics.horizontalAdvance(self._headers[col_idx])
+            for row_idx in rows:
+                text = self.format_value(column[row_idx])
+                if text:
+                    width = max(width, font_metrics.horizontalAdvance(text))
+            widths.append(min(width + padding, max_width))
+
+        return widths
+
+    def export_csv(self, file_path, chunk_size=1000):
+        """Tulis model ke CSV secara streaming tanpa membuat salinan kedua data"""
+        with open(file_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(self._headers)
+
+            chunk = []
+            for row in self.iter_rows():
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    writer.writerows(chunk)
+                    chunk = []
+
+            if chunk:
+                writer.writerows(chunk)
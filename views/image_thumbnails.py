@@ -0,0 +1,49 @@
+# views/image_thumbnails.py - Decode gambar Excel sekali ke ukuran tampil, cache per hash gambar
+
+from collections import OrderedDict
+
+from PyQt5.QtCore import QBuffer, QByteArray, QIODevice, QSize
+from PyQt5.QtGui import QImage, QImageReader, QPixmap
+
+# Lebar maksimum gambar di tab DATA_ / DIP_ (sama dengan batas lama)
+MAX_IMAGE_WIDTH = 800
+# Jumlah thumbnail yang disimpan di memori
+MAX_CACHED_THUMBNAILS = 64
+
+_thumbnail_cache = OrderedDict()
+
+
+def decode_thumbnail(data, max_width=MAX_IMAGE_WIDTH):
+    """
+    Decode bytes gambar langsung ke ukuran tampil. QImageReader men-scale saat
+    decode, jadi gambar besar tidak pernah dibuat dalam resolusi penuh.
+    """
+    byte_array = QByteArray(data)
+    buffer = QBuffer(byte_array)
+    buffer.open(QIODevice.ReadOnly)
+
+    reader = QImageReader(buffer)
+    size = reader.size()
+    if size.isValid() and size.width() > max_width:
+        reader.setScaledSize(QSize(max_width, int(size.height() * max_width / size.width())))
+
+    image = reader.read()
+    buffer.close()
+    return image if not image.isNull() else QImage()
+
+
+def get_thumbnail(image_hash, data, max_width=MAX_IMAGE_WIDTH):
+    """QPixmap untuk gambar; decode hanya terjadi sekali per hash (GUI thread)"""
+    key = (image_hash, max_width)
+    pixmap = _thumbnail_cache.get(key)
+    if pixmap is not None:
+        _thumbnail_cache.move_to_end(key)
+        return pixmap
+
+    image = decode_thumbnail(data, max_width)
+    pixmap = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+
+    _thumbnail_cache[key] = pixmap
+    while len(_thumbnail_cache) > MAX_CACHED_THUMBNAILS:
+        _thumbnail_cache.popitem(last=False)
+    return pixmap
@@ -0,0 +1,228 @@
+# views/job_manager.py - Antrian job background dengan prioritas dan batas per resource
+
+import heapq
+import itertools
+import os
+import time
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QApplication, QSystemTrayIcon
+
+from config import APP_LOGO, APP_NAME, JOB_RESOURCE_LIMITS
+from views.loading_screen import LoadingWorker, PROGRESS_FRAME_MS
+
+# Prioritas job - angka lebih besar dijalankan lebih dulu
+PRIORITY_LOW = 0
+PRIORITY_NORMAL = 5
+PRIORITY_HIGH = 10
+
+JOB_QUEUED = "Queued"
+JOB_RUNNING = "Running"
+JOB_FINISHED = "Finished"
+JOB_FAILED = "Failed"
+JOB_CANCELLED = "Cancelled"
+
+
+class Job:
+    """Satu operasi background beserta status dan progress terakhirnya"""
+
+    def __init__(self, job_id, title, task_function, resource, priority, on_complete, target=None):
+        self.id = job_id
+        self.title = title
+        self.task_function = task_function
+        self.resource = resource
+        # File yang ditulis job - job dengan target yang sama tidak pernah berjalan bersamaan
+        self.target = os.path.normcase(os.path.abspath(target)) if target else None
+        self.priority = priority
+        self.on_complete = on_complete
+
+        self.state = JOB_QUEUED
+        self.progress = 0
+        self.message = "Waiting in queue..."
+        self.result = ""
+        self.worker = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+
+    def is_active(self):
+        return self.state in (JOB_QUEUED, JOB_RUNNING)
+
+
+class JobManager(QObject):
+    """
+    Scheduler pusat untuk projection, proposal, save dan registrasi customer.
+
+    Job dijalankan di LoadingWorker (progress channel + cancellation token yang
+    sama dengan LoadingScreen). Jumlah job yang berjalan bersamaan dibatasi per
+    resource (JOB_RESOURCE_LIMITS), misalnya hanya satu otomasi Excel sekaligus.
+    Selain itu job yang menulis file yang sama (target) dijalankan satu per satu,
+    apa pun resource-nya, supaya save / projection / proposal tidak saling menimpa.
+    """
+    job_added = pyqtSignal(object)
+    job_updated = pyqtSignal(object)
+    job_finished = pyqtSignal(object)
+
+    def __init__(self, resource_limits=None, parent=None):
+        super().__init__(parent)
+        self.resource_limits = dict(resource_limits or JOB_RESOURCE_LIMITS)
+        self.jobs = []
+        self._queue = []
+        self._sequence = itertools.count()
+        self._running = {}
+
+        # Progress semua job yang berjalan dibaca sekali per frame
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_FRAME_MS)
+        self._progress_timer.timeout.connect(self._poll_progress)
+
+    def submit(self, title, task_function, resource="default", priority=PRIORITY_NORMAL, on_complete=None,
+               target=None):
+        """
+        Antrikan job. `task_function` menerima progress_callback / cancel_token
+        seperti task LoadingScreen; `on_complete(success, message)` dipanggil di GUI thread.
+        `target` adalah path file yang ditulis job (lihat Job.target).
+        """
+        job = Job(next(self._sequence) + 1, title, task_function, resource, priority, on_complete, target)
+        self.jobs.append(job)
+        heapq.heappush(self._queue, (-priority, job.id, job))
+        self.job_added.emit(job)
+        self._schedule()
+        return job
+
+    def cancel(self, job):
+        """Batalkan job: yang masih antri langsung dibuang, yang berjalan berhenti di checkpoint"""
+        if job.state == JOB_QUEUED:
+            self._queue = [entry for entry in self._queue if entry[2] is not job]
+            heapq.heapify(self._queue)
+            self._finish(job, JOB_CANCELLED, "Cancelled before start")
+        elif job.state == JOB_RUNNING and job.worker:
+            job.message = "Cancelling..."
+            self.job_updated.emit(job)
+            job.worker.stop()
+
+    def clear_finished(self):
+        self.jobs = [job for job in self.jobs if job.is_active()]
+
+    def active_jobs(self):
+        return [job for job in self.jobs if job.is_active()]
+
+    def _running_count(self, resource):
+        return sum(1 for job in self._running.values() if job.resource == resource)
+
+    def _target_busy(self, target):
+        return target is not None and any(job.target == target for job in self._running.values())
+
+    def _schedule(self):
+        """Jalankan job antrian berprioritas tertinggi yang resource dan target-nya masih tersedia"""
+        deferred = []
+        while self._queue:
+            entry = heapq.heappop(self._queue)
+            job = entry[2]
+            limit = self.resource_limits.get(job.resource, 1)
+            if self._running_count(job.resource) < limit and not self._target_busy(job.target):
+                self._start(job)
+            else:
+                deferred.append(entry)
+
+        for entry in deferred:
+            heapq.heappush(self._queue, entry)
+
+    def _start(self, job):
+        job.state = JOB_RUNNING
+        job.started_at = time.time()
+        job.message = "Starting..."
+
+        worker = LoadingWorker(job.task_function)
+        worker.task_completed.connect(lambda success, message, job=job: self._on_completed(job, success, message))
+        worker.task_cancelled.connect(lambda job=job: self._finish(job, JOB_CANCELLED, "Cancelled by user"))
+        # Task yang selesai setelah stop() tidak emit task_completed - tutup job di sini
+        worker.finished.connect(lambda job=job: self._finish(job, JOB_CANCELLED, "Cancelled by user"))
+        job.worker = worker
+        self._running[job.id] = job
+
+        worker.start()
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+        self.job_updated.emit(job)
+
+    def _poll_progress(self):
+        if not self._running:
+            self._progress_timer.stop()
+            return
+
+        for job in list(self._running.values()):
+            update = job.worker.progress_channel.read()
+            if update is not None:
+                job.progress, message = update
+                if message:
+                    job.message = message
+                self.job_updated.emit(job)
+
+    def _on_completed(self, job, success, message):
+        self._finish(job, JOB_FINISHED if success else JOB_FAILED, message)
+
+    def _finish(self, job, state, message):
+        if not job.is_active():
+            return
+
+        job.state = state
+        job.result = message
+        job.message = message
+        job.finished_at = time.time()
+        if state == JOB_FINISHED:
+            job.progress = 100
+
+        self._running.pop(job.id, None)
+        if job.worker is not None:
+            job.worker.detach()
+
+        self.job_updated.emit(job)
+        self.job_finished.emit(job)
+
+        if job.on_complete and state != JOB_CANCELLED:
+            try:
+                job.on_complete(state == JOB_FINISHED, message)
+            except Exception as e:
+                print(f"Error in completion handler of job '{job.title}': {str(e)}")
+
+        self._schedule()
+
+
+class JobNotifier(QObject):
+    """Notifikasi desktop (tray) saat job selesai; fallback ke console jika tray tidak tersedia"""
+
+    def __init__(self, job_manager, parent=None):
+        super().__init__(parent)
+        self.tray_icon = None
+        if QSystemTrayIcon.isSystemTrayAvailable() and QSystemTrayIcon.supportsMessages():
+            self.tray_icon = QSystemTrayIcon(QIcon(APP_LOGO), self)
+            self.tray_icon.setToolTip(APP_NAME)
+            self.tray_icon.show()
+        job_manager.job_finished.connect(self.notify)
+
+    def notify(self, job):
+        if job.state == JOB_CANCELLED:
+            return
+
+        title = f"{job.title} - {job.state}"
+        message = job.result.split("\n")[0] if job.result else job.state
+        if self.tray_icon is not None:
+            icon = QSystemTrayIcon.Information if job.state == JOB_FINISHED else QSystemTrayIcon.Warning
+            self.tray_icon.showMessage(title, message, icon, 5000)
+        else:
+            print(f"[Job] {title}: {message}")
+
+
+_job_manager = None
+_notifier = None
+
+
+def get_job_manager():
+    """Shared job manager untuk seluruh aplikasi (dibuat di GUI thread)"""
+    global _job_manager, _notifier
+    if _job_manager is None:
+        _job_manager = JobManager(parent=QApplication.instance())
+        _notifier = JobNotifier(_job_manager, parent=QApplication.instance())
+    return _job_manager
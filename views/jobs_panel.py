@@ -0,0 +1,114 @@
+# views/jobs_panel.py - Dock panel berisi job antri, berjalan dan selesai
+
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont, QColor
+from PyQt5.QtWidgets import (QDockWidget, QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
+                             QTableWidgetItem, QProgressBar, QPushButton, QHeaderView,
+                             QAbstractItemView)
+
+from config import PRIMARY_COLOR
+from views.job_manager import (get_job_manager, JOB_QUEUED, JOB_RUNNING, JOB_FINISHED,
+                               JOB_FAILED, JOB_CANCELLED)
+
+STATE_COLORS = {
+    JOB_QUEUED: "#7F8C8D",
+    JOB_RUNNING: "#3498DB",
+    JOB_FINISHED: "#27AE60",
+    JOB_FAILED: "#E74C3C",
+    JOB_CANCELLED: "#95A5A6",
+}
+
+COLUMN_TITLE, COLUMN_STATE, COLUMN_PROGRESS, COLUMN_ACTION = range(4)
+
+
+class JobsPanel(QDockWidget):
+    """Tampilan job dari JobManager bersama; satu panel per window utama"""
+
+    def __init__(self, parent=None, job_manager=None):
+        super().__init__("Background Jobs", parent)
+        self.job_manager = job_manager or get_job_manager()
+        self.setObjectName("jobsPanel")
+        self.setAllowedAreas(Qt.BottomDockWidgetArea | Qt.RightDockWidgetArea)
+
+        container = QWidget()
+        layout = QVBoxLayout(container)
+        layout.setContentsMargins(6, 6, 6, 6)
+
+        self.table = QTableWidget(0, 4)
+        self.table.setHorizontalHeaderLabels(["Job", "Status", "Progress", ""])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setFont(QFont("Segoe UI", 9))
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(COLUMN_TITLE, QHeaderView.Stretch)
+        header.setSectionResizeMode(COLUMN_STATE, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(COLUMN_PROGRESS, QHeaderView.Fixed)
+        header.setSectionResizeMode(COLUMN_ACTION, QHeaderView.ResizeToContents)
+        self.table.setColumnWidth(COLUMN_PROGRESS, 220)
+        layout.addWidget(self.table)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        clear_btn = QPushButton("Clear Finished")
+        clear_btn.setStyleSheet(f"color: {PRIMARY_COLOR}; padding: 4px 10px;")
+        clear_btn.clicked.connect(self.clear_finished)
+        buttons.addWidget(clear_btn)
+        layout.addLayout(buttons)
+
+        self.setWidget(container)
+
+        self._rows = {}
+        for job in self.job_manager.jobs:
+            self.add_job(job)
+
+        self.job_manager.job_added.connect(self.add_job)
+        self.job_manager.job_updated.connect(self.update_job)
+
+    def add_job(self, job):
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        self._rows[job.id] = row
+
+        self.table.setItem(row, COLUMN_TITLE, QTableWidgetItem(job.title))
+        self.table.setItem(row, COLUMN_STATE, QTableWidgetItem(job.state))
+
+        progress = QProgressBar()
+        progress.setRange(0, 100)
+        progress.setTextVisible(True)
+        self.table.setCellWidget(row, COLUMN_PROGRESS, progress)
+
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.setCursor(Qt.PointingHandCursor)
+        cancel_btn.clicked.connect(lambda _checked=False, job=job: self.job_manager.cancel(job))
+        self.table.setCellWidget(row, COLUMN_ACTION, cancel_btn)
+
+        self.update_job(job)
+
+        # Panel dimunculkan saat ada job baru
+        self.show()
+        self.raise_()
+
+    def update_job(self, job):
+        row = self._rows.get(job.id)
+        if row is None:
+            return
+
+        state_item = self.table.item(row, COLUMN_STATE)
+        state_item.setText(job.state)
+        state_item.setForeground(QColor(STATE_COLORS.get(job.state, "#333")))
+        self.table.item(row, COLUMN_TITLE).setToolTip(job.message)
+
+        progress = self.table.cellWidget(row, COLUMN_PROGRESS)
+        progress.setValue(min(int(job.progress), 100))
+        progress.setFormat(f"{int(job.progress)}% - {job.message}" if job.is_active() else job.state)
+        progress.setToolTip(job.message)
+
+        self.table.cellWidget(row, COLUMN_ACTION).setEnabled(job.is_active())
+
+    def clear_finished(self):
+        self.job_manager.clear_finished()
+        self.table.setRowCount(0)
+        self._rows = {}
+        for job in self.job_manager.jobs:
+            self.add_job(job)
@@ -1,59 +1,94 @@
 import os
 import sys
+import inspect
 from PyQt5 import QtCore, QtGui, QtWidgets
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                             QProgressBar, QFrame, QApplication)
+                             QProgressBar, QFrame, QApplication, QPushButton)
 from PyQt5.QtGui import QPixmap, QIcon, QFont, QColor, QMovie
 from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve
 
 # Import local modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from config import APP_NAME, PRIMARY_COLOR, SECONDARY_COLOR
+from modules.progress_channel import ProgressChannel
+from modules.cancellation import CancellationToken, OperationCancelled
+
+# Interval sampling progress worker oleh GUI (~30 Hz)
+PROGRESS_FRAME_MS = 33
+
+
+def accepts_argument(task_function, name):
+    """True jika task menerima argumen `name` (eksplisit atau via **kwargs)"""
+    try:
+        parameters = inspect.signature(task_function).parameters
+    except (TypeError, ValueError):
+        return False
+    if name in parameters:
+        return True
+    return any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values())
+
+
+def accepts_progress_callback(task_function):
+    return accepts_argument(task_function, 'progress_callback')
+
+# Worker yang dibatalkan tetap direferensikan sampai thread-nya selesai
+_detached_workers = set()
 
 class LoadingWorker(QThread):
     """Worker thread untuk menjalankan task di background"""
-    progress_updated = pyqtSignal(int, str)  # progress percentage, status text
     task_completed = pyqtSignal(bool, str)  # success, result/error message
+    task_cancelled = pyqtSignal()  # task berhenti di checkpoint setelah cancel
     
     def __init__(self, task_function, *args, **kwargs):
         super().__init__()
         self.task_function = task_function
         self.args = args
         self.kwargs = kwargs
-        self.progress_callback = None
         self._stop_requested = False
-        
-    def set_progress_callback(self, callback):
-        """Set callback function untuk update progress"""
-        self.progress_callback = callback
+        # Progress ditulis ke channel, LoadingScreen yang membacanya per frame
+        self.progress_channel = ProgressChannel()
+        self.cancel_token = CancellationToken()
         
     def update_progress(self, percentage, message=""):
-        """Update progress dari task function"""
+        """Update progress dari task function (aman dipanggil dari worker thread)"""
+        # Setiap update progress adalah batas step - checkpoint pembatalan
+        self.cancel_token.raise_if_cancelled()
         if not self._stop_requested:
-            self.progress_updated.emit(percentage, message)
-            QApplication.processEvents()
+            self.progress_channel.write(percentage, message)
         
     def stop(self):
-        """Request worker thread to stop"""
+        """Request worker thread to stop - task berhenti di checkpoint berikutnya"""
         self._stop_requested = True
+        self.cancel_token.cancel()
+    
+    def detach(self):
+        """Lepas worker dari pemiliknya; referensi disimpan sampai thread selesai"""
+        if self.isRunning():
+            _detached_workers.add(self)
+            self.finished.connect(lambda: _detached_workers.discard(self))
         
     def run(self):
         """Run the task function"""
         try:
             if self._stop_requested:
                 return
-                
-            # Pass update_progress sebagai callback jika task function membutuhkannya
-            if 'progress_callback' in self.kwargs:
-                self.kwargs['progress_callback'] = self.update_progress
-            elif len(self.args) > 0 and hasattr(self.args[0], '__call__'):
-                # Jika args pertama adalah function, tambahkan progress_callback
-                result = self.task_function(*self.args, progress_callback=self.update_progress, **self.kwargs)
-            else:
-                result = self.task_function(*self.args, **self.kwargs)
+            
+            kwargs = dict(self.kwargs)
+            # Pass update_progress sebagai callback jika task function menerimanya
+            if accepts_progress_callback(self.task_function):
+                kwargs['progress_callback'] = self.update_progress
+            if accepts_argument(self.task_function, 'cancel_token'):
+                kwargs['cancel_token'] = self.cancel_token
+            
+            # current_token() di helper (mis. force_excel_calculation) menunjuk ke token ini
+            with self.cancel_token.activate():
+                result = self.task_function(*self.args, **kwargs)
             
             if not self._stop_requested:
                 self.task_completed.emit(True, str(result) if result else "Task completed successfully")
+        except OperationCancelled:
+            print("Task cancelled")
+            self.task_cancelled.emit()
         except Exception as e:
             if not self._stop_requested:
                 self.task_completed.emit(False, str(e))
@@ -146,6 +181,31 @@ class LoadingScreen(QWidget):
         self.status_label.setAlignment(Qt.AlignCenter)
         container_layout.addWidget(self.status_label)
         
+        # Tombol cancel - hanya tampil saat ada worker yang berjalan
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setFont(QFont("Segoe UI", 10))
+        self.cancel_button.setCursor(Qt.PointingHandCursor)
+        self.cancel_button.setFixedWidth(120)
+        self.cancel_button.setStyleSheet("""
+            QPushButton {
+                background-color: #F5F5F5;
+                color: #E74C3C;
+                border: 1px solid #E74C3C;
+                border-radius: 4px;
+                padding: 6px;
+            }
+            QPushButton:hover {
+                background-color: #FDEDEC;
+            }
+            QPushButton:disabled {
+                color: #999;
+                border-color: #ccc;
+            }
+        """)
+        self.cancel_button.clicked.connect(self.cancel)
+        self.cancel_button.setVisible(False)
+        container_layout.addWidget(self.cancel_button, 0, Qt.AlignCenter)
+        
         # Center the window
         self.center_on_screen()
         
@@ -156,6 +216,11 @@ class LoadingScreen(QWidget):
         self.progress_timer.timeout.connect(self.simulate_progress)
         self.current_progress = 0
         
+        # Timer sampling progress worker - update di antara dua frame digabung
+        self.frame_timer = QTimer()
+        self.frame_timer.setInterval(PROGRESS_FRAME_MS)
+        self.frame_timer.timeout.connect(self.poll_worker_progress)
+        
     def center_on_screen(self):
         """Center window di tengah layar"""
         screen = QApplication.desktop().screenGeometry()
@@ -172,9 +237,11 @@ class LoadingScreen(QWidget):
         if task_function:
             # Jalankan task di background thread
             self.worker = LoadingWorker(task_function, *args, **kwargs)
-            self.worker.progress_updated.connect(self.update_progress)
             self.worker.task_completed.connect(self.on_task_completed)
+            self.worker.task_cancelled.connect(self.on_task_cancelled)
             self.worker.start()
+            self.frame_timer.start()
+            self.cancel_button.setVisible(True)
         else:
             # Simulasi progress jika tidak ada task
             self.simulate_progress_start()
@@ -203,12 +270,24 @@ class LoadingScreen(QWidget):
                 increment = 1
                 
             self.current_progress += increment
-            self.update_progress(self.current_progress, f"Processing... {self.current_progress}%")
+            self.apply_progress(self.current_progress, f"Processing... {self.current_progress}%")
         else:
             self.progress_timer.stop()
-            
-    def update_progress(self, percentage, message=""):
-        """Update progress bar dan status"""
+    
+    def poll_worker_progress(self):
+        """Ambil progress terbaru dari worker (dipanggil frame_timer di GUI thread)"""
+        if self._is_closing or not self.worker:
+            self.frame_timer.stop()
+            return
+        
+        update = self.worker.progress_channel.read()
+        if update is not None:
+            # Progress asli tersedia - simulasi tidak diperlukan lagi
+            self.progress_timer.stop()
+            self.apply_progress(*update)
+    
+    def apply_progress(self, percentage, message=""):
+        """Set progress bar dan status (GUI thread)"""
         if self._is_closing:
             return
             
@@ -218,19 +297,32 @@ class LoadingScreen(QWidget):
         
         # Update progress text di progress bar
         self.progress_bar.setFormat(f"{percentage}%")
+            
+    def update_progress(self, percentage, message=""):
+        """Update progress bar dan status secara langsung (untuk operasi sinkron di GUI thread)"""
+        if self._is_closing:
+            return
+        
+        self.progress_timer.stop()
+        self.apply_progress(percentage, message)
         
+        # Operasi sinkron memblokir event loop - paksa repaint
         QApplication.processEvents()
         
     def on_task_completed(self, success, message):
         """Callback ketika task selesai"""
         if self._is_closing:
             return
+        
+        self.frame_timer.stop()
+        self.progress_timer.stop()
+        self.cancel_button.setEnabled(False)
             
         if success:
-            self.update_progress(100, "Completed successfully!")
+            self.apply_progress(100, "Completed successfully!")
             QTimer.singleShot(500, self.close_with_success)
         else:
-            self.update_progress(100, f"Error: {message}")
+            self.apply_progress(100, f"Error: {message}")
             self.progress_bar.setStyleSheet(f"""
                 QProgressBar {{
                     border: 2px solid #E74C3C;
@@ -248,6 +340,32 @@ class LoadingScreen(QWidget):
             """)
             QTimer.singleShot(2000, self.close_with_error)
             
+    def cancel(self):
+        """Batalkan task: proses turunan dimatikan, task berhenti di checkpoint berikutnya"""
+        if self._is_closing or not self.worker:
+            return
+        
+        self.cancel_button.setEnabled(False)
+        self.frame_timer.stop()
+        self.apply_progress(self.progress_bar.value(), "Cancelling... restoring files")
+        self.worker.stop()
+        
+        if not self.worker.isRunning():
+            self.on_task_cancelled()
+    
+    def on_task_cancelled(self):
+        """Task sudah berhenti (dan file sudah di-rollback) - tutup loading screen"""
+        if self._is_closing:
+            return
+        self._is_closing = True
+        self.cleanup_and_close()
+    
+    def stop_worker(self):
+        """Minta worker berhenti tanpa memblokir GUI; thread tidak pernah di-terminate paksa"""
+        if self.worker and self.worker.isRunning():
+            self.worker.stop()
+            self.worker.detach()
+            
     def close_with_success(self):
         """Close dengan status success"""
         if self._is_closing:
@@ -270,14 +388,10 @@ class LoadingScreen(QWidget):
             # Stop timers
             if self.progress_timer:
                 self.progress_timer.stop()
+            self.frame_timer.stop()
                      
-            # Stop worker thread dengan aman
-            if self.worker and self.worker.isRunning():
-                self.worker.stop()
-                self.worker.quit()
-                if not self.worker.wait(1000):  # Wait max 1 second
-                    self.worker.terminate()
-                    self.worker.wait()
+            # Stop worker thread dengan aman (berhenti sendiri di checkpoint)
+            self.stop_worker()
                     
             # Close window
             self.close()
@@ -307,14 +421,10 @@ class LoadingScreen(QWidget):
             # Stop timers
             if self.progress_timer:
                 self.progress_timer.stop()
+            self.frame_timer.stop()
                      
-            # Stop worker thread dengan aman
-            if self.worker and self.worker.isRunning():
-                self.worker.stop()
-                self.worker.quit()
-                if not self.worker.wait(1000):  # Wait max 1 second
-                    self.worker.terminate()
-                    self.worker.wait()
+            # Stop worker thread dengan aman (berhenti sendiri di checkpoint)
+            self.stop_worker()
                     
         except Exception as e:
             print(f"Error in closeEvent: {str(e)}")
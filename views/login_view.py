@@ -6,7 +6,7 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdi
                              QPushButton, QFrame, QGridLayout, QMessageBox, QApplication,
                              QGraphicsDropShadowEffect, QSpacerItem, QSizePolicy, QStyle)
 from PyQt5.QtGui import QPixmap, QIcon, QFont, QColor, QPalette, QMovie, QCursor
-from PyQt5.QtCore import Qt, QSize, QTimer
+from PyQt5.QtCore import Qt, QSize, QTimer, QThread, pyqtSignal
 from PyQt5.QtSvg import QSvgWidget
 
 # Import local modules
@@ -37,6 +37,23 @@ class StyleHelper:
         shadow.setColor(QColor(color))
         widget.setGraphicsEffect(shadow)
 
+class LoginWorker(QThread):
+    """Menjalankan AuthManager.login (bcrypt) di luar GUI thread"""
+    login_finished = pyqtSignal(bool, str)  # success, message
+    
+    def __init__(self, auth_manager, username, password):
+        super().__init__()
+        self.auth_manager = auth_manager
+        self.username = username
+        self.password = password
+    
+    def run(self):
+        try:
+            success, message = self.auth_manager.login(self.username, self.password)
+        except Exception as e:
+            success, message = False, f"Error saat login: {str(e)}"
+        self.login_finished.emit(success, message)
+
 class LoginView(QWidget):
     def __init__(self, auth_manager, on_login_success):
         super().__init__()
@@ -45,6 +62,7 @@ class LoginView(QWidget):
         
         # Status variabel
         self.login_in_progress = False
+        self.login_worker = None
         
         # Setup UI
         self.initUI()
@@ -382,13 +400,16 @@ class LoginView(QWidget):
         # Set status loading
         self.set_loading_state(True)
         
-        # Simulasikan delay jaringan (untuk UX yang lebih baik)
-        QTimer.singleShot(800, lambda: self.process_login(username, password))
+        self.process_login(username, password)
     
     def process_login(self, username, password):
-        """Proses login setelah delay"""
-        success, message = self.auth_manager.login(username, password)
-        
+        """Jalankan otentikasi di worker thread; hasilnya diterima di on_login_finished"""
+        self.login_worker = LoginWorker(self.auth_manager, username, password)
+        self.login_worker.login_finished.connect(self.on_login_finished)
+        self.login_worker.start()
+    
+    def on_login_finished(self, success, message):
+        """Hasil login dari worker - dipanggil di GUI thread"""
         if success:
             # Login berhasil
             self.on_login_success()
@@ -0,0 +1,272 @@
+# views/proposal_preview.py - Viewer proposal yang merender halaman sesuai posisi scroll
+
+from collections import OrderedDict
+
+from PyQt5.QtWidgets import QScrollArea, QWidget, QVBoxLayout, QLabel, QFrame
+from PyQt5.QtGui import QFont, QImage, QPixmap
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from config import THUMBNAIL_DPI
+from modules.page_renderer import get_render_service
+
+# Lebar tampilan halaman (px) - sama dengan ukuran thumbnail sebelumnya
+PAGE_DISPLAY_WIDTH = 600
+# Jumlah halaman di atas/bawah area terlihat yang ikut dirender
+PREFETCH_PAGES = 2
+# Maksimum pixmap halaman yang disimpan; sisanya dikembalikan ke placeholder
+MAX_CACHED_PAGES = 12
+
+
+class PageThumbnailLabel(QLabel):
+    """Label thumbnail halaman; double click meminta render resolusi penuh"""
+    double_clicked = pyqtSignal(int)
+
+    def __init__(self, page_num, parent=None):
+        super().__init__(parent)
+        self.page_num = page_num
+        self.setCursor(Qt.PointingHandCursor)
+        self.setToolTip("Double click untuk melihat resolusi penuh")
+
+    def mouseDoubleClickEvent(self, event):
+        self.double_clicked.emit(self.page_num)
+        super().mouseDoubleClickEvent(event)
+
+
+class PageRenderSignals(QObject):
+    rendered = pyqtSignal(str, int, QImage)
+    failed = pyqtSignal(str, int, str)
+
+
+class PageRenderTask(QRunnable):
+    """Render (atau ambil dari cache disk) satu halaman di thread pool"""
+
+    def __init__(self, doc_hash, page_num, dpi=THUMBNAIL_DPI):
+        super().__init__()
+        self.doc_hash = doc_hash
+        self.page_num = page_num
+        self.dpi = dpi
+        self.signals = PageRenderSignals()
+
+    def run(self):
+        try:
+            png_path = get_render_service().render_page(self.doc_hash, self.page_num, self.dpi)
+            self.signals.rendered.emit(self.doc_hash, self.page_num, QImage(png_path))
+        except Exception as e:
+            self.signals.failed.emit(self.doc_hash, self.page_num, str(e))
+
+
+class ProposalPreviewWidget(QScrollArea):
+    """
+    Menampilkan semua halaman sebagai placeholder berukuran tetap, lalu hanya
+    merender halaman yang terlihat (+ PREFETCH_PAGES) saat user scroll.
+    Pixmap halaman yang jauh dari layar dibuang secara LRU.
+    """
+    page_double_clicked = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWidgetResizable(True)
+        self.setStyleSheet("""
+            QScrollArea {
+                border: 1px solid #ddd;
+                background-color: #f9f9f9;
+                border-radius: 4px;
+            }
+        """)
+
+        container = QWidget()
+        self.page_layout = QVBoxLayout(container)
+        self.page_layout.setAlignment(Qt.AlignHCenter)
+        self.page_layout.setSpacing(20)
+
+        self.status_label = QLabel("Loading preview document...")
+        self.status_label.setFont(QFont("Segoe UI", 12))
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setStyleSheet("color: #666; margin: 20px;")
+        self.page_layout.addWidget(self.status_label)
+
+        self.setWidget(container)
+
+        self.doc_hash = None
+        self.page_frames = []
+        self.page_labels = []
+        self.page_height = int(PAGE_DISPLAY_WIDTH * 297 / 210)
+        self._loaded_pages = OrderedDict()
+        self._pending_pages = set()
+
+        # Dua worker cukup: halaman terlihat dirender duluan, sisanya menunggu
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(2)
+
+        # Scroll cepat digabung menjadi satu update
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(30)
+        self._update_timer.timeout.connect(self.update_visible_pages)
+        self.verticalScrollBar().valueChanged.connect(lambda _value: self._update_timer.start())
+
+    def show_status(self, message, is_error=False):
+        self.status_label.setText(message)
+        color = "#E74C3C" if is_error else "#666"
+        self.status_label.setStyleSheet(f"color: {color}; margin: 20px;")
+        self.status_label.setVisible(True)
+
+    def hide_status(self):
+        self.status_label.setVisible(False)
+
+    def set_document(self, doc_hash, page_count, page_ratio):
+        """Buat placeholder untuk semua halaman; rendering mengikuti scroll"""
+        self.clear_pages()
+        self.doc_hash = doc_hash
+        self.page_height = int(PAGE_DISPLAY_WIDTH * page_ratio)
+
+        for page_num in range(page_count):
+            frame, label = self._create_page_frame(page_num)
+            self.page_layout.addWidget(frame)
+            self.page_frames.append(frame)
+            self.page_labels.append(label)
+
+        if page_count:
+            self.hide_status()
+        else:
+            self.show_status("Dokumen tidak memiliki halaman.")
+
+        # Tunggu layout selesai sebelum menghitung halaman yang terlihat
+        QTimer.singleShot(0, self.update_visible_pages)
+
+    def add_static_page(self, page_num, image):
+        """Tambahkan halaman yang sudah jadi (pratinjau alternatif tanpa PDF)"""
+        self.hide_status()
+        frame, label = self._create_page_frame(page_num)
+        label.setPixmap(QPixmap.fromImage(image).scaledToWidth(PAGE_DISPLAY_WIDTH, Qt.SmoothTransformation))
+        self.page_layout.addWidget(frame)
+
+    def clear_pages(self):
+        for frame in self.page_frames:
+            self.page_layout.removeWidget(frame)
+            frame.deleteLater()
+        self.page_frames = []
+        self.page_labels = []
+        self._loaded_pages.clear()
+        self._pending_pages.clear()
+        self.doc_hash = None
+
+    def _create_page_frame(self, page_num):
+        frame = QFrame()
+        frame.setFrameShape(QFrame.StyledPanel)
+        frame.setStyleSheet("""
+            QFrame {
+                border: 1px solid #ddd;
+                border-radius: 4px;
+                background-color: white;
+                padding: 10px;
+            }
+        """)
+        frame_layout = QVBoxLayout(frame)
+
+        page_label = QLabel(f"Page {page_num + 1}")
+        page_label.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        page_label.setAlignment(Qt.AlignCenter)
+        frame_layout.addWidget(page_label)
+
+        # Ukuran tetap supaya posisi scroll tidak melompat saat halaman dirender/dibuang
+        image_label = PageThumbnailLabel(page_num)
+        image_label.setFixedSize(PAGE_DISPLAY_WIDTH, self.page_height)
+        image_label.setAlignment(Qt.AlignCenter)
+        image_label.setStyleSheet("background-color: white; color: #999;")
+        image_label.setText("Loading...")
+        image_label.double_clicked.connect(self.page_double_clicked.emit)
+        frame_layout.addWidget(image_label)
+
+        return frame, image_label
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_timer.start()
+
+    def visible_page_range(self):
+        """Index halaman pertama dan terakhir yang bersinggungan dengan viewport"""
+        if not self.page_frames:
+            return None
+
+        top = self.verticalScrollBar().value()
+        bottom = top + self.viewport().height()
+
+        first = last = None
+        for page_num, frame in enumerate(self.page_frames):
+            geometry = frame.geometry()
+            if geometry.bottom() < top:
+                continue
+            if geometry.top() > bottom:
+                break
+            if first is None:
+                first = page_num
+            last = page_num
+
+        if first is None:
+            return None
+        return first, last
+
+    def update_visible_pages(self):
+        """Minta render halaman terlihat + prefetch, lalu buang pixmap yang jauh (LRU)"""
+        visible = self.visible_page_range()
+        if visible is None or self.doc_hash is None:
+            return
+
+        first, last = visible
+        wanted_first = max(0, first - PREFETCH_PAGES)
+        wanted_last = min(len(self.page_frames) - 1, last + PREFETCH_PAGES)
+
+        # Halaman terlihat diantrikan duluan, baru halaman prefetch
+        order = list(range(first, last + 1))
+        order += [p for p in range(wanted_first, wanted_last + 1) if p < first or p > last]
+
+        for page_num in order:
+            if page_num in self._loaded_pages:
+                self._loaded_pages.move_to_end(page_num)
+            elif page_num not in self._pending_pages:
+                self._request_page(page_num)
+
+        self._evict(keep=range(wanted_first, wanted_last + 1))
+
+    def _request_page(self, page_num):
+        self._pending_pages.add(page_num)
+        task = PageRenderTask(self.doc_hash, page_num)
+        task.signals.rendered.connect(self._on_page_rendered)
+        task.signals.failed.connect(self._on_page_failed)
+        self.thread_pool.start(task)
+
+    def _on_page_rendered(self, doc_hash, page_num, image):
+        if doc_hash != self.doc_hash or page_num >= len(self.page_labels):
+            return
+        self._pending_pages.discard(page_num)
+
+        pixmap = QPixmap.fromImage(image)
+        if pixmap.width() != PAGE_DISPLAY_WIDTH:
+            pixmap = pixmap.scaledToWidth(PAGE_DISPLAY_WIDTH, Qt.SmoothTransformation)
+        self.page_labels[page_num].setPixmap(pixmap)
+
+        self._loaded_pages[page_num] = True
+        self._loaded_pages.move_to_end(page_num)
+
+        visible = self.visible_page_range()
+        if visible:
+            self._evict(keep=range(max(0, visible[0] - PREFETCH_PAGES), visible[1] + PREFETCH_PAGES + 1))
+
+    def _on_page_failed(self, doc_hash, page_num, error_message):
+        if doc_hash != self.doc_hash or page_num >= len(self.page_labels):
+            return
+        self._pending_pages.discard(page_num)
+        self.page_labels[page_num].setText(f"Gagal merender halaman: {error_message}")
+
+    def _evict(self, keep):
+        """Kembalikan halaman paling lama tidak terlihat ke placeholder"""
+        keep = set(keep)
+        while len(self._loaded_pages) > MAX_CACHED_PAGES:
+            victim = next((p for p in self._loaded_pages if p not in keep), None)
+            if victim is None:
+                break
+            del self._loaded_pages[victim]
+            label = self.page_labels[victim]
+            label.clear()
+            label.setText("Loading...")
@@ -0,0 +1,122 @@
+# views/view_manager.py - Simpan instance view dan preload view berikutnya saat idle
+
+import importlib
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class ViewManager(QObject):
+    """
+    Registry window utama aplikasi (dashboard, customer search, BDU, ...).
+
+    View dibuat sekali lewat factory lalu disimpan, sehingga navigasi berikutnya
+    cukup show/hide. Setelah sebuah view tampil, view yang kemungkinan dibuka
+    berikutnya dibuat di idle time (QTimer 0 ms hanya jalan saat event queue kosong).
+    """
+    view_created = pyqtSignal(str)
+    view_shown = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._factories = {}
+        self._next_views = {}
+        self._next_modules = {}
+        self._views = {}
+        self._idle_queue = []
+
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setInterval(0)
+        self._idle_timer.timeout.connect(self._run_idle_task)
+
+    def register(self, name, factory, preload_next=None, preload_modules=None):
+        """
+        `factory()` membuat view baru. `preload_next` berisi nama view yang dibuat
+        saat idle setelah view ini tampil; `preload_modules` berisi modul Python
+        yang cukup di-import saja (untuk view yang butuh parameter, mis. BDU).
+        """
+        self._factories[name] = factory
+        self._next_views[name] = list(preload_next or [])
+        self._next_modules[name] = list(preload_modules or [])
+
+    def view(self, name):
+        """Instance yang sudah ada, atau None"""
+        return self._views.get(name)
+
+    def get(self, name):
+        """Instance view, dibuat lewat factory jika belum ada"""
+        view = self._views.get(name)
+        if view is None:
+            view = self._factories[name]()
+            self._views[name] = view
+            self.view_created.emit(name)
+        return view
+
+    def set_view(self, name, view):
+        """Simpan view yang dibuat di luar factory (mis. butuh parameter)"""
+        self._views[name] = view
+        self.view_created.emit(name)
+
+    def show(self, name):
+        """Tampilkan view (dibuat jika perlu), sembunyikan view lain"""
+        view = self.get(name)
+
+        for other_name, other in self._views.items():
+            if other_name != name and other.isVisible():
+                other.hide()
+
+        view.showMaximized()
+        view.raise_()
+        view.activateWindow()
+        self.view_shown.emit(name)
+
+        self.schedule_preload(name)
+        return view
+
+    def hide_all(self):
+        for view in self._views.values():
+            view.hide()
+
+    def schedule_preload(self, name):
+        """Antrikan preload view/modul lanjutan dari `name` untuk idle time"""
+        for module_name in self._next_modules.get(name, []):
+            self._idle_queue.append(("module", module_name))
+        for next_name in self._next_views.get(name, []):
+            if next_name not in self._views:
+                self._idle_queue.append(("view", next_name))
+
+        if self._idle_queue and not self._idle_timer.isActive():
+            self._idle_timer.start()
+
+    def _run_idle_task(self):
+        # Satu task per iterasi idle supaya input user tetap diproses di antaranya
+        if not self._idle_queue:
+            self._idle_timer.stop()
+            return
+
+        kind, target = self._idle_queue.pop(0)
+        try:
+            if kind == "module":
+                importlib.import_module(target)
+            elif target not in self._views:
+                view = self.get(target)
+                view.hide()
+        except Exception as e:
+            print(f"Error preloading {target}: {str(e)}")
+
+        if not self._idle_queue:
+            self._idle_timer.stop()
+
+    def discard(self, name):
+        """Tutup dan buang satu view (dibuat ulang pada akses berikutnya)"""
+        self._idle_queue = [task for task in self._idle_queue if task != ("view", name)]
+        view = self._views.pop(name, None)
+        if view is not None:
+            view.close()
+            view.deleteLater()
+
+    def discard_all(self):
+        """Buang semua view, mis. saat logout (view terikat ke user yang login)"""
+        self._idle_queue = []
+        self._idle_timer.stop()
+        for name in list(self._views):
+            self.discard(name)
@@ -0,0 +1,154 @@
+# views/workbook_loader.py - Loader dua fase: parsing di QThreadPool, widget dibangun di GUI thread
+
+import threading
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from modules.workbook_reader import read_bdu_workbook
+from modules.workbook_cache import get_workbook_cache
+
+try:
+    from modules.formula_helper import SimpleFormulaEvaluator, evaluate_formulas_background
+    HAS_FORMULA_HELPER = True
+except ImportError:
+    HAS_FORMULA_HELPER = False
+
+
+class WorkbookLoadSignals(QObject):
+    """Signals emitted by WorkbookLoadTask (delivered queued to the GUI thread)"""
+    progress = pyqtSignal(int, str)
+    sheet_list_ready = pyqtSignal(list)
+    user_codes_ready = pyqtSignal(list)
+    validations_ready = pyqtSignal(object)
+    sheet_ready = pyqtSignal(str, object)
+    evaluator_ready = pyqtSignal(object)
+    finished = pyqtSignal(bool, str)
+
+
+class WorkbookLoadTask(QRunnable):
+    """Parse the workbook off the GUI thread - tidak pernah menyentuh widget"""
+
+    def __init__(self, excel_path, load_formulas=True):
+        super().__init__()
+        self.excel_path = excel_path
+        self.load_formulas = load_formulas
+        self.signals = WorkbookLoadSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def is_cancelled(self):
+        return self._cancelled.is_set()
+
+    def run(self):
+        try:
+            cache = get_workbook_cache()
+            # Hasil prefetch dari customer search dipakai langsung jika file tidak berubah
+            snapshot = cache.get_or_wait(self.excel_path, should_cancel=self.is_cancelled)
+            if snapshot is not None:
+                self.replay_snapshot(snapshot)
+            else:
+                snapshot = read_bdu_workbook(
+                    self.excel_path,
+                    on_progress=self.signals.progress.emit,
+                    on_sheet_list=self.signals.sheet_list_ready.emit,
+                    on_validations=self.signals.validations_ready.emit,
+                    on_sheet=self.signals.sheet_ready.emit,
+                    should_cancel=self.is_cancelled,
+                )
+                if not self.is_cancelled():
+                    cache.put(snapshot)
+
+            if self.is_cancelled():
+                self.signals.finished.emit(False, "Loading cancelled")
+                return
+
+            self.signals.user_codes_ready.emit(snapshot['user_codes'])
+
+            if not snapshot['sheet_names']:
+                self.signals.finished.emit(False, "No DATA_ or DIP_ sheets found in SET_BDU.xlsx.")
+                return
+
+            # Formula evaluator dimuat terakhir supaya tab sudah bisa tampil lebih dulu
+            if self.load_formulas and HAS_FORMULA_HELPER:
+                evaluator = SimpleFormulaEvaluator(self.excel_path)
+                if evaluator.load_workbook():
+                    evaluate_formulas_background(evaluator)
+                    self.signals.evaluator_ready.emit(evaluator)
+                else:
+                    print("Warning: Could not initialize formula evaluator")
+
+            self.signals.finished.emit(True, "Excel data loaded successfully")
+
+        except Exception as e:
+            self.signals.finished.emit(False, f"Error loading data: {str(e)}")
+
+    def replay_snapshot(self, snapshot):
+        """Emit signal yang sama seperti saat parsing, dari snapshot yang sudah jadi"""
+        self.signals.progress.emit(20, "Using prefetched workbook data...")
+        self.signals.validations_ready.emit(snapshot['validations'])
+        self.signals.sheet_list_ready.emit(list(snapshot['sheet_names']))
+        for sheet_name in snapshot['sheet_names']:
+            if self.is_cancelled():
+                return
+            self.signals.sheet_ready.emit(sheet_name, snapshot['sheets'][sheet_name])
+        self.signals.progress.emit(100, "Excel data loaded successfully!")
+
+
+class WorkbookLoader(QObject):
+    """Start workbook loads and relay signals of the most recent load only"""
+    progress = pyqtSignal(int, str)
+    sheet_list_ready = pyqtSignal(list)
+    user_codes_ready = pyqtSignal(list)
+    validations_ready = pyqtSignal(object)
+    sheet_ready = pyqtSignal(str, object)
+    evaluator_ready = pyqtSignal(object)
+    finished = pyqtSignal(bool, str)
+
+    def __init__(self, parent=None, thread_pool=None):
+        super().__init__(parent)
+        self.thread_pool = thread_pool or QThreadPool.globalInstance()
+        self._current_task = None
+
+    def is_loading(self):
+        return self._current_task is not None
+
+    def load(self, excel_path, load_formulas=True):
+        """Cancel any running load and start parsing `excel_path`"""
+        self.cancel()
+
+        task = WorkbookLoadTask(excel_path, load_formulas)
+        self._current_task = task
+
+        # Signal dari load lama diabaikan agar tab tidak tercampur
+        task.signals.progress.connect(lambda v, m: self._relay(task, self.progress, v, m))
+        task.signals.sheet_list_ready.connect(lambda names: self._relay(task, self.sheet_list_ready, names))
+        task.signals.user_codes_ready.connect(lambda codes: self._relay(task, self.user_codes_ready, codes))
+        task.signals.validations_ready.connect(lambda index: self._relay(task, self.validations_ready, index))
+        task.signals.sheet_ready.connect(lambda name, df: self._relay(task, self.sheet_ready, name, df))
+        task.signals.evaluator_ready.connect(lambda ev: self._relay_evaluator(task, ev))
+        task.signals.finished.connect(lambda ok, msg: self._on_finished(task, ok, msg))
+
+        self.thread_pool.start(task)
+        return task
+
+    def cancel(self):
+        if self._current_task is not None:
+            self._current_task.cancel()
+            self._current_task = None
+
+    def _relay(self, task, signal, *args):
+        if task is self._current_task:
+            signal.emit(*args)
+
+    def _relay_evaluator(self, task, evaluator):
+        if task is self._current_task:
+            self.evaluator_ready.emit(evaluator)
+        else:
+            evaluator.close()
+
+    def _on_finished(self, task, success, message):
+        if task is self._current_task:
+            self._current_task = None
+            self.finished.emit(success, message)